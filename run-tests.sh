@@ -18,10 +18,22 @@ function wait_and_get_exit_codes() {
 DIRN=$(dirname "$0");
 
 commands=(
+        "{ python -m unittest tests.sdk.testAio; }"
+        "{ python -m unittest tests.sdk.testAioBalance; }"
+        "{ python -m unittest tests.sdk.testApiJson; }"
+        "{ python -m unittest tests.sdk.testBacenId; }"
         "{ python -m unittest tests.sdk.testBalance; }"
+        "{ python -m unittest tests.sdk.testBulk; }"
+        "{ python -m unittest tests.sdk.testCache; }"
+        "{ python -m unittest tests.sdk.testCatalog; }"
+        "{ python -m unittest tests.sdk.testColumns; }"
+        "{ python -m unittest tests.sdk.testCompact; }"
         "{ python -m unittest tests.sdk.testCreditNote; }"
         "{ python -m unittest tests.sdk.testCreditNoteLog; }"
         "{ python -m unittest tests.sdk.testEvent; }"
+        "{ python -m unittest tests.sdk.testGetMany; }"
+        "{ python -m unittest tests.sdk.testHttp2Transport; }"
+        "{ python -m unittest tests.sdk.testImport; }"
         "{ python -m unittest tests.sdk.testIssuingAuthorization; }"
         "{ python -m unittest tests.sdk.testIssuingBalance; }"
         "{ python -m unittest tests.sdk.testIssuingBin; }"
@@ -33,14 +45,25 @@ commands=(
         "{ python -m unittest tests.sdk.testIssuingInvoiceLog; }"
         "{ python -m unittest tests.sdk.testIssuingPurchase; }"
         "{ python -m unittest tests.sdk.testIssuingPurchaseLog; }"
+        "{ python -m unittest tests.sdk.testIssuingRuleEngine; }"
         "{ python -m unittest tests.sdk.testIssuingTransaction; }"
         "{ python -m unittest tests.sdk.testIssuingWithdrawal; }"
         "{ python -m unittest tests.sdk.testKey; }"
+        "{ python -m unittest tests.sdk.testParallel; }"
         "{ python -m unittest tests.sdk.testPixRequest; }"
         "{ python -m unittest tests.sdk.testPixRequestLog; }"
         "{ python -m unittest tests.sdk.testPixReversal; }"
         "{ python -m unittest tests.sdk.testPixReversalLog; }"
         "{ python -m unittest tests.sdk.testPixStatement; }"
+        "{ python -m unittest tests.sdk.testPixStatementIndex; }"
+        "{ python -m unittest tests.sdk.testPixStatementStream; }"
+        "{ python -m unittest tests.sdk.testPrefetch; }"
+        "{ python -m unittest tests.sdk.testRateLimiter; }"
+        "{ python -m unittest tests.sdk.testResponse; }"
+        "{ python -m unittest tests.sdk.testSigner; }"
+        "{ python -m unittest tests.sdk.testSingleFlight; }"
+        "{ python -m unittest tests.sdk.testTransport; }"
+        "{ python -m unittest tests.sdk.testVerifier; }"
     )
 
 clen=`expr "${#commands[@]}" - 1` # get length of commands - 1
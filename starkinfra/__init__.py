@@ -1,104 +1,154 @@
 version = "0.4.0"
 language = "en-US"
 timeout = 15
+transport = None
+cache = None
+rate_limiter = None
+single_flight = None
 user = None
 
+from sys import version_info as _python_version
+from importlib import import_module as _import_module
 from starkcore import Project, Organization, key, error
 
-from . import event
-from .event.__event import Event
 
-from . import brcodepreview
-from .brcodepreview.__brcodepreview import BrcodePreview
-
-from . import pixrequest
-from .pixrequest.__pixrequest import PixRequest
-
-from . import pixreversal
-from .pixreversal.__pixreversal import PixReversal
-
-from . import pixstatement
-from .pixstatement.__pixstatement import PixStatement
-
-from . import pixbalance
-from .pixbalance.__pixbalance import PixBalance
-
-from . import pixdirector
-from .pixdirector.__pixdirector import PixDirector
-
-from . import pixkey
-from .pixkey.__pixkey import PixKey
-
-from . import pixclaim
-from .pixclaim.__pixclaim import PixClaim
-
-from . import pixdomain
-from .pixdomain.__pixdomain import PixDomain
-
-from . import pixinfraction
-from .pixinfraction.__pixinfraction import PixInfraction
-
-from . import pixchargeback
-from .pixchargeback.__pixchargeback import PixChargeback
-
-from . import issuingbalance
-from .issuingbalance.__issuingbalance import IssuingBalance
-
-from . import creditnote
-from .creditnote.__creditnote import CreditNote
-
-from . import creditsigner
-from .creditsigner.__creditsigner import CreditSigner
-
-from . import creditpreview
-from .creditpreview.__creditpreview import CreditPreview
-
-from . import individualidentity
-from .individualidentity.__individualidentity import IndividualIdentity
-
-from . import individualdocument
-from .individualdocument.__individualdocument import IndividualDocument
-
-from . import dynamicbrcode
-from .dynamicbrcode.__dynamicbrcode import DynamicBrcode
-
-from . import staticbrcode
-from .staticbrcode.__staticbrcode import StaticBrcode
-
-from . import issuingtransaction
-from .issuingtransaction.__issuingtransaction import IssuingTransaction
-
-from . import issuingholder
-from .issuingholder.__issuingholder import IssuingHolder
-
-from . import issuingcard
-from .issuingcard.__issuingcard import IssuingCard
-
-from . import issuingpurchase
-from .issuingpurchase.__issuingpurchase import IssuingPurchase
-
-from . import issuinginvoice
-from .issuinginvoice.__issuinginvoice import IssuingInvoice
-
-from . import issuingwithdrawal
-from .issuingwithdrawal.__issuingwithdrawal import IssuingWithdrawal
-
-from . import issuingproduct
-from .issuingproduct.__issuingproduct import IssuingProduct
-
-from . import issuingrule
-from .issuingrule.__issuingrule import IssuingRule
-
-from . import merchantcategory
-from .merchantcategory.__merchantcategory import MerchantCategory
-
-from . import merchantcountry
-from .merchantcountry.__merchantcountry import MerchantCountry
-
-from . import cardmethod
-from .cardmethod.__cardmethod import CardMethod
-
-from . import webhook
-from .webhook.__webhook import Webhook
-
-from .utils import endtoendid, returnid
+# resource packages and classes are only imported when first accessed
+_modules = [
+    "event",
+    "brcodepreview",
+    "pixrequest",
+    "pixreversal",
+    "pixstatement",
+    "pixbalance",
+    "pixdirector",
+    "pixkey",
+    "pixclaim",
+    "pixdomain",
+    "pixinfraction",
+    "pixchargeback",
+    "issuingbalance",
+    "creditnote",
+    "creditsigner",
+    "creditpreview",
+    "individualidentity",
+    "individualdocument",
+    "dynamicbrcode",
+    "staticbrcode",
+    "issuingtransaction",
+    "issuingholder",
+    "issuingcard",
+    "issuingpurchase",
+    "issuinginvoice",
+    "issuingwithdrawal",
+    "issuingproduct",
+    "issuingrule",
+    "merchantcategory",
+    "merchantcountry",
+    "cardmethod",
+    "webhook",
+]
+
+_utils = ["endtoendid", "returnid", "parallel", "bulk", "columns"]
+
+_classes = {
+    "Transport": ".utils.transport",
+    "HttpTransport": ".utils.transport",
+    "Http2Transport": ".utils.http2",
+    "use_transport": ".utils.relay",
+    "Verifier": ".utils.verifier",
+    "Cache": ".utils.cache",
+    "MemoryBackend": ".utils.cache",
+    "DiskBackend": ".utils.cache",
+    "RateLimiter": ".utils.ratelimiter",
+    "SingleFlight": ".utils.singleflight",
+    "Event": ".event.__event",
+    "BrcodePreview": ".brcodepreview.__brcodepreview",
+    "PixRequest": ".pixrequest.__pixrequest",
+    "PixReversal": ".pixreversal.__pixreversal",
+    "PixStatement": ".pixstatement.__pixstatement",
+    "PixBalance": ".pixbalance.__pixbalance",
+    "PixDirector": ".pixdirector.__pixdirector",
+    "PixKey": ".pixkey.__pixkey",
+    "PixClaim": ".pixclaim.__pixclaim",
+    "PixDomain": ".pixdomain.__pixdomain",
+    "PixInfraction": ".pixinfraction.__pixinfraction",
+    "PixChargeback": ".pixchargeback.__pixchargeback",
+    "IssuingBalance": ".issuingbalance.__issuingbalance",
+    "CreditNote": ".creditnote.__creditnote",
+    "CreditSigner": ".creditsigner.__creditsigner",
+    "CreditPreview": ".creditpreview.__creditpreview",
+    "IndividualIdentity": ".individualidentity.__individualidentity",
+    "IndividualDocument": ".individualdocument.__individualdocument",
+    "DynamicBrcode": ".dynamicbrcode.__dynamicbrcode",
+    "StaticBrcode": ".staticbrcode.__staticbrcode",
+    "IssuingTransaction": ".issuingtransaction.__issuingtransaction",
+    "IssuingHolder": ".issuingholder.__issuingholder",
+    "IssuingCard": ".issuingcard.__issuingcard",
+    "IssuingPurchase": ".issuingpurchase.__issuingpurchase",
+    "IssuingInvoice": ".issuinginvoice.__issuinginvoice",
+    "IssuingWithdrawal": ".issuingwithdrawal.__issuingwithdrawal",
+    "IssuingProduct": ".issuingproduct.__issuingproduct",
+    "IssuingRule": ".issuingrule.__issuingrule",
+    "MerchantCategory": ".merchantcategory.__merchantcategory",
+    "MerchantCountry": ".merchantcountry.__merchantcountry",
+    "CardMethod": ".cardmethod.__cardmethod",
+    "Webhook": ".webhook.__webhook",
+}
+
+# helpers written for newer interpreters, by the Python version they need
+_minimum_versions = {"Http2Transport": (3, 5)}
+
+__all__ = [
+    "version", "language", "timeout", "transport", "cache", "rate_limiter", "single_flight", "user",
+    "Project", "Organization", "key", "error",
+] + _modules + _utils + list(_classes)
+
+
+def __getattr__(name):
+    if name in _minimum_versions and _python_version < _minimum_versions[name]:
+        raise ImportError("starkinfra.{name} requires Python {version} or later".format(
+            name=name,
+            version=".".join(str(number) for number in _minimum_versions[name]),
+        ))
+    if name in _classes:
+        value = getattr(_import_module(_classes[name], __name__), name)
+    elif name in _modules:
+        value = _import_module("." + name, __name__)
+    elif name in _utils:
+        value = _import_module(".utils." + name, __name__)
+    else:
+        raise AttributeError("module {name!r} has no attribute {attribute!r}".format(name=__name__, attribute=name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+# before Python 3.7, modules have no __getattr__ hook: the package is replaced by a module subclass that
+# imports the helpers on first access, and only the resource packages are imported eagerly, as they always were
+if _python_version < (3, 7):
+    from sys import modules as _sys_modules
+    from types import ModuleType as _ModuleType
+
+    class _LazyModule(_ModuleType):
+
+        def __getattr__(self, name):
+            value = __getattr__(name)
+            setattr(self, name, value)
+            return value
+
+        def __dir__(self):
+            return sorted(set(self.__dict__) | set(__all__))
+
+    _module = _LazyModule(__name__, __doc__)
+    _module.__dict__.update(globals())
+    _module._package = _sys_modules[__name__]
+    _sys_modules[__name__] = _module
+
+    for _name in _modules + ["endtoendid", "returnid"]:
+        getattr(_module, _name)
+    for _name, _path in _classes.items():
+        if not _path.startswith(".utils."):
+            getattr(_module, _name)
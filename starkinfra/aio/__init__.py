@@ -0,0 +1,42 @@
+from .transport import AsyncHttpTransport
+from .relay import wrap as _wrap
+from .parserpool import ParserPool as _ParserPool
+
+# set after the imports, since importing the transport submodule binds its name here
+transport = None
+
+import starkinfra as _starkinfra
+
+event = _wrap(_starkinfra.event)
+event.ParserPool = _ParserPool
+brcodepreview = _wrap(_starkinfra.brcodepreview)
+pixrequest = _wrap(_starkinfra.pixrequest)
+pixreversal = _wrap(_starkinfra.pixreversal)
+pixstatement = _wrap(_starkinfra.pixstatement)
+pixbalance = _wrap(_starkinfra.pixbalance)
+pixdirector = _wrap(_starkinfra.pixdirector)
+pixkey = _wrap(_starkinfra.pixkey)
+pixclaim = _wrap(_starkinfra.pixclaim)
+pixdomain = _wrap(_starkinfra.pixdomain)
+pixinfraction = _wrap(_starkinfra.pixinfraction)
+pixchargeback = _wrap(_starkinfra.pixchargeback)
+issuingbalance = _wrap(_starkinfra.issuingbalance)
+creditnote = _wrap(_starkinfra.creditnote)
+creditsigner = _wrap(_starkinfra.creditsigner)
+creditpreview = _wrap(_starkinfra.creditpreview)
+individualidentity = _wrap(_starkinfra.individualidentity)
+individualdocument = _wrap(_starkinfra.individualdocument)
+dynamicbrcode = _wrap(_starkinfra.dynamicbrcode)
+staticbrcode = _wrap(_starkinfra.staticbrcode)
+issuingtransaction = _wrap(_starkinfra.issuingtransaction)
+issuingholder = _wrap(_starkinfra.issuingholder)
+issuingcard = _wrap(_starkinfra.issuingcard)
+issuingpurchase = _wrap(_starkinfra.issuingpurchase)
+issuinginvoice = _wrap(_starkinfra.issuinginvoice)
+issuingwithdrawal = _wrap(_starkinfra.issuingwithdrawal)
+issuingproduct = _wrap(_starkinfra.issuingproduct)
+issuingrule = _wrap(_starkinfra.issuingrule)
+merchantcategory = _wrap(_starkinfra.merchantcategory)
+merchantcountry = _wrap(_starkinfra.merchantcountry)
+cardmethod = _wrap(_starkinfra.cardmethod)
+webhook = _wrap(_starkinfra.webhook)
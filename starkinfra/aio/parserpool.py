@@ -0,0 +1,59 @@
+import starkinfra
+from asyncio import Semaphore, wrap_future, get_event_loop
+from ..utils import parse as _parse
+
+
+class ParserPool:
+    """# Event ParserPool object
+    asyncio counterpart of starkinfra.event.ParserPool. Submissions wait without blocking the
+    event loop while max_pending contents are waiting to be parsed.
+    ## Parameters (optional):
+    - processes [integer, default None]: number of worker processes. Defaults to the number of cores. ex: 4
+    - max_pending [integer, default None]: maximum number of submitted contents waiting to be parsed. Defaults to 8 per process. ex: 64
+    - user [Organization/Project object, default None]: Organization or Project object used to fetch the public key. Not necessary if starkinfra.user was set before the first submission.
+    """
+
+    def __init__(self, processes=None, max_pending=None, user=None):
+        self._pool = starkinfra.event.ParserPool(processes=processes, max_pending=max_pending, user=user)
+        self._slots = Semaphore(self._pool.max_pending)
+
+    async def submit(self, content, signature):
+        """# Submit an Event content to be parsed
+        ## Parameters (required):
+        - content [string]: response content from request received at user endpoint (not parsed)
+        - signature [string]: base-64 digital signature received at response header "Digital-Signature"
+        ## Return:
+        - asyncio.Future resolving to the parsed Event object or raising starkinfra.error.InvalidSignatureError
+        """
+        if _parse.verifier._cached_key(user=self._pool.user) is None:
+            await get_event_loop().run_in_executor(None, self._pool._public_key)
+        await self._slots.acquire()
+        try:
+            future = wrap_future(self._pool.submit(content=content, signature=signature))
+        except:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    async def parse(self, content, signature):
+        """# Parse an Event content in the pool
+        ## Parameters (required):
+        - content [string]: response content from request received at user endpoint (not parsed)
+        - signature [string]: base-64 digital signature received at response header "Digital-Signature"
+        ## Return:
+        - Parsed Event object
+        """
+        return await (await self.submit(content=content, signature=signature))
+
+    async def close(self):
+        """# Close the pool
+        Wait for the pending contents to be parsed and stop the worker processes.
+        """
+        await get_event_loop().run_in_executor(None, self._pool.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
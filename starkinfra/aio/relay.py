@@ -0,0 +1,77 @@
+import starkinfra
+from asyncio import sleep, iscoroutinefunction
+from functools import wraps
+from types import ModuleType
+from ..utils.relay import redirect_relay, rate_limit_name, _context
+from ..utils.ratelimiter import _key, _retry_after
+from .request import _default_transport
+from . import rest
+
+
+_functions = ["create", "get", "get_many", "query", "page", "update", "cancel", "delete"]
+_submodules = ["log", "attempt"]
+
+
+def wrap(module):
+    aio_module = ModuleType(
+        name=module.__name__.replace("starkinfra.", "starkinfra.aio.", 1),
+        doc="asyncio counterpart of {name}".format(name=module.__name__),
+    )
+    for name in _functions:
+        if hasattr(module, name):
+            setattr(aio_module, name, _awaitable(getattr(module, name)))
+    for name in _submodules:
+        if isinstance(getattr(module, name, None), ModuleType):
+            setattr(aio_module, name, wrap(getattr(module, name)))
+    return aio_module
+
+
+def _awaitable(function):
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with redirect_relay(_relay):
+            return function(*args, **kwargs)
+    return wrapper
+
+
+def _relay(func, *args, **kwargs):
+    transport = getattr(_context, "transport", None)
+    if not iscoroutinefunction(getattr(transport, "request", None)):
+        transport = None
+    kwargs["transport"] = kwargs.get("transport") or transport or starkinfra.aio.transport
+    if starkinfra.rate_limiter is not None:
+        kwargs["transport"] = _RateLimitedTransport(
+            transport=kwargs["transport"] or _default_transport,
+            rate_limiter=starkinfra.rate_limiter,
+            name=rate_limit_name(kwargs),
+            user=kwargs["user"],
+        )
+    return getattr(rest, func.__name__.lstrip("_"))(*args, **kwargs)
+
+
+class _RateLimitedTransport:
+
+    def __init__(self, transport, rate_limiter, name, user):
+        self.transport = transport
+        self.rate_limiter = rate_limiter
+        self.name = name
+        self.user = user
+
+    async def request(self, **request):
+        rate_limiter = self.rate_limiter
+        key = _key(self.name, self.user)
+        attempt = 0
+        while True:
+            wait = rate_limiter._reserve(key, self.name)
+            if wait > 0:
+                await sleep(wait)
+            response = await self.transport.request(**request)
+            if response.status != 429:
+                rate_limiter._succeed(key)
+                return response
+            rate_limiter._reject(key, attempt, _retry_after(response))
+            if attempt >= rate_limiter.retries:
+                return response
+            attempt += 1
+            with rate_limiter._lock:
+                rate_limiter.retried += 1
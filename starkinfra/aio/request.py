@@ -0,0 +1,28 @@
+from starkcore.error import UnknownError
+from ..utils.request import prepare, check
+from .transport import AsyncHttpTransport
+
+
+_default_transport = AsyncHttpTransport()
+
+
+async def fetch(host, sdk_version, user, method, path, payload=None, query=None,
+                api_version="v2", language="en-US", timeout=15, transport=None):
+    request = prepare(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method=method,
+        path=path,
+        payload=payload,
+        query=query,
+        api_version=api_version,
+        language=language,
+    )
+
+    try:
+        response = await (transport or _default_transport).request(timeout=timeout, **request)
+    except Exception as exception:
+        raise UnknownError("{}: {}".format(exception.__class__.__name__, str(exception)))
+
+    return check(response)
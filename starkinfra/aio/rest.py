@@ -0,0 +1,357 @@
+import starkinfra
+from json import dumps
+from copy import deepcopy
+from asyncio import ensure_future, gather, get_event_loop, shield, Queue, Semaphore, CancelledError
+from .request import fetch
+from ..utils.compact import compact as _compact
+from ..utils.batch import _unique, _chunks, _result
+from ..utils.api import api_json, from_api_json, cast_json_to_api_format
+from starkcore.utils.api import endpoint, last_name, last_name_plural
+
+
+async def get_page(sdk_version, host, api_version, user, resource, language, timeout, transport, **query):
+    json = (await fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path=endpoint(resource),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )).json()
+    entities = [from_api_json(resource, entity) for entity in json[last_name_plural(resource)]]
+    cursor = json.get("cursor")
+    return entities, cursor
+
+
+async def get_stream(sdk_version, host, api_version, user, resource, language, timeout, transport, limit=None, prefetch=None, compact=False, **query):
+    if compact:
+        resource = _compact(resource)
+    pages = Queue(maxsize=prefetch or 1)
+    producer = ensure_future(_fill(pages, _get_pages(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        resource=resource,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+        limit=limit,
+        **query
+    )))
+    try:
+        while True:
+            entities = await pages.get()
+            if entities is None:
+                break
+            for entity in entities:
+                yield entity
+        await producer
+    finally:
+        producer.cancel()
+
+
+async def _get_pages(sdk_version, host, api_version, user, resource, language, timeout, transport, limit=None, **query):
+    limit_query = {"limit": min(limit, 100) if limit else limit}
+    limit_query.update(query)
+
+    while True:
+        entities, cursor = await get_page(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            resource=resource,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+            **limit_query
+        )
+        yield entities
+
+        if limit:
+            limit -= 100
+            limit_query["limit"] = min(limit, 100)
+
+        limit_query["cursor"] = cursor
+        if not cursor or (limit is not None and limit <= 0):
+            break
+
+
+async def _fill(queue, pages):
+    try:
+        async for entities in pages:
+            await queue.put(entities)
+    except CancelledError:
+        raise
+    except Exception:
+        await queue.put(None)
+        raise
+    await queue.put(None)
+
+
+async def get_first(sdk_version, host, api_version, user, resource, language, timeout, transport, **query):
+    entities, cursor = await get_page(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        resource=resource,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+        **query
+    )
+    return entities[0]
+
+
+async def get_id(sdk_version, host, api_version, user, resource, id, language, timeout, transport, **query):
+    cache = starkinfra.cache if not query else None
+    entity = cache.get(resource=resource, id=id, user=user) if cache else None
+    if entity is not None:
+        return from_api_json(resource, entity)
+
+    async def get():
+        json = (await fetch(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            method="GET",
+            path="{endpoint}/{id}".format(endpoint=endpoint(resource), id=id),
+            query=query,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+        )).json()
+        entity = json[last_name(resource)]
+        if cache:
+            cache.set(resource=resource, id=id, user=user, json=entity)
+        return entity
+
+    single_flight = starkinfra.single_flight
+    if single_flight:
+        key = (resource["name"], id, dumps(query, sort_keys=True, default=str), api_version, language,
+               getattr(user, "environment", None), getattr(user, "id", None), getattr(user, "workspace_id", None))
+        entity = await _single_flight(single_flight, key, get)
+    else:
+        entity = await get()
+    return from_api_json(resource, entity)
+
+
+# futures of the gets in flight, by event loop and key, counted in the shared SingleFlight
+_calls = {}
+
+
+async def _single_flight(single_flight, key, get):
+    loop = get_event_loop()
+    key = (loop, key)
+    with single_flight._lock:
+        call = _calls.get(key)
+        if call is None:
+            call = _calls[key] = loop.create_future()
+            single_flight.requests += 1
+            leader = True
+        else:
+            single_flight.coalesced += 1
+            leader = False
+
+    if not leader:
+        return deepcopy(await shield(call))
+
+    try:
+        entity = await get()
+    except CancelledError:
+        call.cancel()
+        raise
+    except Exception as error:
+        call.set_exception(error)
+        call.exception()
+        raise
+    else:
+        call.set_result(entity)
+    finally:
+        with single_flight._lock:
+            del _calls[key]
+    return entity
+
+
+async def get_many(sdk_version, host, api_version, user, resource, ids, language, timeout, transport, key="id", chunk_size=100, workers=4, **query):
+    semaphore = Semaphore(workers)
+
+    async def get(chunk):
+        filters = {key + "s": chunk}
+        filters.update(query)
+        entities = []
+        async with semaphore:
+            async for page in _get_pages(
+                host=host,
+                sdk_version=sdk_version,
+                user=user,
+                resource=resource,
+                api_version=api_version,
+                language=language,
+                timeout=timeout,
+                transport=transport,
+                limit=len(chunk),
+                **filters
+            ):
+                entities.extend(page)
+        return entities
+
+    unique = _unique(ids)
+    found = {}
+    for entities in await gather(*[get(chunk) for chunk in _chunks(unique, min(chunk_size, 100))]):
+        for entity in entities:
+            found[getattr(entity, key)] = entity
+    return _result(ids, unique, found)
+
+
+async def get_content(sdk_version, host, api_version, user, resource, id, sub_resource_name, language, timeout, transport, **query):
+    return (await fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}/{sub_resource_name}".format(
+            endpoint=endpoint(resource),
+            id=id,
+            sub_resource_name=sub_resource_name,
+        ),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )).content
+
+
+async def get_sub_resource(sdk_version, host, api_version, user, resource, id, sub_resource, language, timeout, transport, **query):
+    entity = (await fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}/{sub_resource}".format(
+            endpoint=endpoint(resource),
+            id=id,
+            sub_resource=endpoint(sub_resource),
+        ),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )).json()[last_name(sub_resource)]
+    return from_api_json(sub_resource, entity)
+
+
+async def get_sub_resources(sdk_version, host, api_version, user, resource, id, sub_resource, language, timeout, transport, **query):
+    entities = (await fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}/{sub_resource}".format(
+            endpoint=endpoint(resource),
+            id=id,
+            sub_resource=endpoint(sub_resource),
+        ),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )).json()[last_name_plural(sub_resource)]
+    return [from_api_json(sub_resource, entity) for entity in entities]
+
+
+async def post_multi(sdk_version, host, api_version, user, resource, entities, language, timeout, transport, **query):
+    json = (await fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="POST",
+        path=endpoint(resource),
+        payload={last_name_plural(resource): [api_json(entity) for entity in entities]},
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )).json()
+    entities = json[last_name_plural(resource)]
+    return [from_api_json(resource, entity) for entity in entities]
+
+
+async def post_single(sdk_version, host, api_version, user, resource, entity, language, timeout, transport, **query):
+    payload = api_json(entity)
+    json = (await fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="POST",
+        path=endpoint(resource),
+        payload=payload,
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )).json()
+    entity_json = json[last_name(resource)]
+    return from_api_json(resource, entity_json)
+
+
+async def delete_id(sdk_version, host, api_version, user, resource, id, language, timeout, transport, **query):
+    json = (await fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="DELETE",
+        path="{endpoint}/{id}".format(endpoint=endpoint(resource), id=id),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )).json()
+    entity = json[last_name(resource)]
+    return from_api_json(resource, entity)
+
+
+async def patch_id(sdk_version, host, api_version, user, resource, id, payload, language, timeout, transport, **query):
+    json = (await fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="PATCH",
+        path="{endpoint}/{id}".format(endpoint=endpoint(resource), id=id),
+        payload=cast_json_to_api_format(payload),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )).json()
+    entity = json[last_name(resource)]
+    return from_api_json(resource, entity)
+
+
+async def get_raw(sdk_version, host, api_version, path, user, language, timeout, transport, **query):
+    return (await fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path=path,
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )).json()
@@ -0,0 +1,196 @@
+from time import time
+from weakref import WeakKeyDictionary
+from asyncio import open_connection, wait_for, get_event_loop, Semaphore, IncompleteReadError
+from ssl import create_default_context
+from ..utils.compatibility import urlsplit
+from ..utils.transport import Response, _idempotent_methods
+
+
+class AsyncHttpTransport:
+    """# AsyncHttpTransport object
+    The AsyncHttpTransport is the asyncio counterpart of starkinfra.HttpTransport.
+    It keeps a pool of persistent (keep-alive) HTTP/1.1 connections for each host on
+    the running event loop, so a single thread may keep many API calls in flight at once.
+    The starkinfra.aio functions use a process-wide AsyncHttpTransport by default, but you
+    may set your own at starkinfra.aio.transport to tune the pool.
+    ## Parameters (optional):
+    - max_connections [integer, default 100]: maximum number of simultaneous connections per host. Requests wait for a free connection once this limit is reached. ex: 100
+    - idle_timeout [float, default 30]: number of seconds an idle connection is kept open for reuse. ex: 30
+    - context [ssl.SSLContext, default None]: SSL context used to open HTTPS connections. Defaults to ssl.create_default_context(), created on the first HTTPS connection
+    A request that finds its reused connection closed by the server is only sent again if it was not
+    written yet or its method is idempotent.
+    ## Attributes (return-only):
+    - opened [integer]: number of connections opened by this transport. ex: 100
+    - reused [integer]: number of requests sent through an already open connection. ex: 1500
+    """
+
+    def __init__(self, max_connections=100, idle_timeout=30, context=None):
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self._context = context
+        self.opened = 0
+        self.reused = 0
+        self._pools = WeakKeyDictionary()
+
+    @property
+    def context(self):
+        if self._context is None:
+            self._context = create_default_context()
+        return self._context
+
+    @context.setter
+    def context(self, context):
+        self._context = context
+
+    async def request(self, method, url, body=None, headers=None, timeout=None):
+        url = urlsplit(url)
+        port = url.port or (443 if url.scheme == "https" else 80)
+        origin = (url.scheme, url.hostname, port)
+        path = (url.path or "/") + ("?" + url.query if url.query else "")
+        message = _message(method, url.hostname, url.port, path, body or b"", headers or {})
+
+        pool = self._pool()
+        async with pool.slot(origin, self.max_connections):
+            connection, is_reused = await self._acquire(pool, origin, timeout)
+            while True:
+                sent = False
+                try:
+                    await wait_for(_write(connection, message), timeout)
+                    sent = True
+                    response, will_close = await wait_for(_read(connection), timeout)
+                    break
+                except (IncompleteReadError, ConnectionError):
+                    _close(connection)
+                    if not is_reused or (sent and method not in _idempotent_methods):
+                        raise
+                except BaseException:
+                    _close(connection)
+                    raise
+                connection, is_reused = await self._open(origin, timeout), False
+            pool.release(origin, connection, will_close)
+
+        return response
+
+    def close(self):
+        pools, self._pools = self._pools, WeakKeyDictionary()
+        for loop, pool in list(pools.items()):
+            pool.close(closed=loop.is_closed())
+
+    def _pool(self):
+        loop = get_event_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            # connections of a finished event loop can neither be reused nor closed, so they are only dropped
+            for other in [other for other in list(self._pools.keys()) if other.is_closed()]:
+                self._pools.pop(other).close(closed=True)
+            pool = self._pools[loop] = _Pool()
+        return pool
+
+    async def _acquire(self, pool, origin, timeout):
+        idle = pool.idle.get(origin, [])
+        while idle:
+            connection, last_used = idle.pop()
+            if time() - last_used > self.idle_timeout or connection[0].at_eof():
+                _close(connection)
+                continue
+            self.reused += 1
+            return connection, True
+        return await self._open(origin, timeout), False
+
+    async def _open(self, origin, timeout):
+        scheme, host, port = origin
+        self.opened += 1
+        return await wait_for(
+            open_connection(host, port, ssl=self.context if scheme == "https" else None),
+            timeout,
+        )
+
+
+class _Pool:
+
+    def __init__(self):
+        self.idle = {}
+        self.slots = {}
+
+    def slot(self, origin, max_connections):
+        if origin not in self.slots:
+            self.slots[origin] = Semaphore(max_connections)
+        return self.slots[origin]
+
+    def release(self, origin, connection, will_close):
+        if will_close:
+            _close(connection)
+            return
+        self.idle.setdefault(origin, []).append((connection, time()))
+
+    def close(self, closed=False):
+        idle, self.idle = self.idle, {}
+        if closed:
+            return
+        for connections in idle.values():
+            for connection, _ in connections:
+                _close(connection)
+
+
+def _message(method, host, port, path, body, headers):
+    lines = [
+        "{method} {path} HTTP/1.1".format(method=method, path=path),
+        "Host: {host}".format(host=host if port is None else "{host}:{port}".format(host=host, port=port)),
+        "Content-Length: {length}".format(length=len(body)),
+    ]
+    lines += ["{key}: {value}".format(key=key, value=value) for key, value in headers.items()]
+    return "\r\n".join(lines).encode("latin-1") + b"\r\n\r\n" + body
+
+
+async def _write(connection, message):
+    writer = connection[1]
+    writer.write(message)
+    await writer.drain()
+
+
+async def _read(connection):
+    reader = connection[0]
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("connection closed by the server")
+    version, status = status_line.decode("latin-1").split(" ", 2)[:2]
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        key, value = line.decode("latin-1").split(":", 1)
+        headers[key.strip().lower()] = value.strip()
+
+    connection_header = headers.get("connection", "").lower()
+    will_close = connection_header == "close" or (version == "HTTP/1.0" and connection_header != "keep-alive")
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        content = await _read_chunks(reader)
+    elif "content-length" in headers:
+        content = await reader.readexactly(int(headers["content-length"]))
+    elif status in ("204", "304"):
+        content = b""
+    else:
+        content = await reader.read()
+        will_close = True
+
+    return Response(status=int(status), content=content, headers=headers), will_close
+
+
+async def _read_chunks(reader):
+    chunks = []
+    while True:
+        size = int((await reader.readline()).split(b";")[0].strip(), 16)
+        if size == 0:
+            break
+        chunks.append(await reader.readexactly(size))
+        await reader.readline()
+    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+        pass
+    return b"".join(chunks)
+
+
+def _close(connection):
+    connection[1].close()
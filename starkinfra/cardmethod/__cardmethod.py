@@ -1,5 +1,6 @@
 from starkcore.utils.subresource import SubResource
 from starkinfra.utils import rest
+from starkinfra.utils.catalog import Catalog
 
 
 class CardMethod(SubResource):
@@ -20,12 +21,16 @@ class CardMethod(SubResource):
 
 _resource = {"class": CardMethod, "name": "CardMethod"}
 
+catalog = Catalog(resource=_resource, fields=["code", "name", "number"])
 
-def query(search=None, user=None):
+
+def query(search=None, prefetch=None, compact=False, user=None):
     """# Retrieve CardMethods
     Receive a generator of CardMethod objects previously created in the Stark Infra API
     ## Parameters (optional):
     - search [string, default None]: keyword to search for code, name, number or short_code
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of CardMethod objects with updated attributes
@@ -33,5 +38,7 @@ def query(search=None, user=None):
     return rest.get_stream(
         resource=_resource,
         search=search,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
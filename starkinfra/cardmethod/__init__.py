@@ -1 +1 @@
-from .__cardmethod import query
+from .__cardmethod import query, catalog
@@ -1,4 +1,4 @@
-from starkcore.utils.api import from_api_json
+from ...utils.api import from_api_json
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_datetime_or_date, check_timedelta
 from .__discount import Discount
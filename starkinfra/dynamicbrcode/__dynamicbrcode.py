@@ -1,7 +1,6 @@
-from json import dumps
 from ..utils import rest
+from ..utils.template import Template
 from ..utils import parse
-from starkcore.utils.api import api_json
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 
@@ -49,6 +48,15 @@ class DynamicBrcode(Resource):
 
 
 _resource = {"class": DynamicBrcode, "name": "DynamicBrcode"}
+_response_due = Template([
+    "version", "created", "due", "key_id", "status", "reconciliation_id", "nominal_amount", "sender_name",
+    "receiver_name", "receiver_street_line", "receiver_city", "receiver_state_code", "receiver_zip_code", "expiration",
+    "sender_tax_id", "receiver_tax_id", "fine", "interest", "discounts", "description",
+])
+_response_instant = Template([
+    "version", "created", "key_id", "status", "reconciliation_id", "amount", "cashier_type", "cashier_bank_code",
+    "cash_amount", "expiration", "sender_name", "sender_tax_id", "amount_type", "description",
+])
 
 
 def create(brcodes, user=None):
@@ -77,7 +85,21 @@ def get(uuid, user=None):
     return rest.get_id(resource=_resource, id=uuid, user=user)
 
 
-def query(limit=None, after=None, before=None, external_id=None, uuids=None, tags=None, user=None):
+def get_many(uuids, workers=4, user=None):
+    """# Retrieve several DynamicBrcodes
+    Receive the DynamicBrcode objects previously created in the Stark Infra API by their uuids. The uuids are queried in chunks of 100 sent at the same time
+    ## Parameters (required):
+    - uuids [list of strings]: list of object unique uuids. ex: ["97756273400d42ce9086404fe10ea0d6", "e3da0b6d56fa4045b9b295b2be82436e"]
+    ## Parameters (optional):
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
+    ## Return:
+    - list of DynamicBrcode objects in the same order as the uuids, with None in place of the ones not found. Its missing attribute lists the uuids not found
+    """
+    return rest.get_many(resource=_resource, ids=uuids, key="uuid", workers=workers, user=user)
+
+
+def query(limit=None, after=None, before=None, external_id=None, uuids=None, tags=None, prefetch=None, compact=False, user=None):
     """# Retrieve DynamicBrcodes
     Receive a generator of DynamicBrcode objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -87,6 +109,8 @@ def query(limit=None, after=None, before=None, external_id=None, uuids=None, tag
     - external_ids [list of strings, default None]: list of external_ids to filter retrieved objects. ex: ["my_external_id1", "my_external_id2"]
     - uuids [list of strings, default None]: list of uuids to filter retrieved objects. ex: ["901e71f2447c43c886f58366a5432c4b", "4e2eab725ddd495f9c98ffd97440702d"]
     - tags [list of strings, default None]: list of tags to filter retrieved objects. ex: ["travel", "food"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of DynamicBrcode objects with updated attributes
@@ -99,6 +123,8 @@ def query(limit=None, after=None, before=None, external_id=None, uuids=None, tag
         external_id=external_id,
         uuids=uuids,
         tags=tags,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
@@ -167,29 +193,28 @@ def response_due(version, created, due, key_id, status, reconciliation_id, nomin
     ## Return:
     - Dumped JSON string that must be returned to us
     """
-    params = {
-        "version": version,
-        "created": created,
-        "due": due,
-        "keyId": key_id,
-        "status": status,
-        "reconciliationId": reconciliation_id,
-        "nominalAmount": nominal_amount,
-        "senderName": sender_name,
-        "receiverName": receiver_name,
-        "receiverStreetLine": receiver_street_line,
-        "receiverCity": receiver_city,
-        "receiverStateCode": receiver_state_code,
-        "receiverZipCode": receiver_zip_code,
-        "expiration": expiration,
-        "senderTaxId": sender_tax_id,
-        "receiverTaxId": receiver_tax_id,
-        "fine": fine,
-        "interest": interest,
-        "discounts": discounts,
-        "description": description,
-    }
-    return dumps(api_json(params))
+    return _response_due.render(
+        version=version,
+        created=created,
+        due=due,
+        key_id=key_id,
+        status=status,
+        reconciliation_id=reconciliation_id,
+        nominal_amount=nominal_amount,
+        sender_name=sender_name,
+        receiver_name=receiver_name,
+        receiver_street_line=receiver_street_line,
+        receiver_city=receiver_city,
+        receiver_state_code=receiver_state_code,
+        receiver_zip_code=receiver_zip_code,
+        expiration=expiration,
+        sender_tax_id=sender_tax_id,
+        receiver_tax_id=receiver_tax_id,
+        fine=fine,
+        interest=interest,
+        discounts=discounts,
+        description=description,
+    )
 
 
 def response_instant(version, created, key_id, status, reconciliation_id, amount, expiration=None, sender_name=None, sender_tax_id=None,
@@ -218,23 +243,22 @@ def response_instant(version, created, key_id, status, reconciliation_id, amount
     ## Return:
     - Dumped JSON string that must be returned to us
     """
-    params = {
-        "version": version,
-        "created": created,
-        "keyId": key_id,
-        "status": status,
-        "reconciliationId": reconciliation_id,
-        "amount": amount,
-        "cashierType": cashier_type,
-        "cashierBankCode": cashier_bank_code,
-        "cashAmount": cash_amount,
-        "expiration": expiration,
-        "senderName": sender_name,
-        "senderTaxId": sender_tax_id,
-        "amountType": amount_type,
-        "description": description,
-    }
-    return dumps(api_json(params))
+    return _response_instant.render(
+        version=version,
+        created=created,
+        key_id=key_id,
+        status=status,
+        reconciliation_id=reconciliation_id,
+        amount=amount,
+        cashier_type=cashier_type,
+        cashier_bank_code=cashier_bank_code,
+        cash_amount=cash_amount,
+        expiration=expiration,
+        sender_name=sender_name,
+        sender_tax_id=sender_tax_id,
+        amount_type=amount_type,
+        description=description,
+    )
 
 
 def verify(uuid, signature, user=None):
@@ -1,33 +1,24 @@
+from importlib import import_module
 from ..utils import rest
 from ..utils.parse import parse_and_verify
-from starkcore.utils.api import from_api_json
+from ..utils.api import from_api_json
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
-from ..creditnote.log.__log import _resource as _creditnote_log_resource
-from ..pixkey.log.__log import _resource as _pixkey_log_resource
-from ..pixclaim.log.__log import _resource as _pixclaim_log_resource
-from ..pixrequest.log.__log import _resource as _pixrequest_log_resource
-from ..pixreversal.log.__log import _resource as _pixreversal_log_resource
-from ..pixchargeback.log.__log import _resource as _pixchargeback_log_resource
-from ..pixinfraction.log.__log import _resource as _pixinfraction_log_resource
-from ..issuingcard.log.__log import _resource as _issuingcard_log_resource
-from ..issuinginvoice.log.__log import _resource as _issuinginvoice_log_resource
-from ..issuingpurchase.log.__log import _resource as _issuingpurchase_log_resource
-
-
-_resource_by_subscription = {
-    "pix-key": _pixkey_log_resource,
-    "pix-claim": _pixclaim_log_resource,
-    "pix-chargeback": _pixchargeback_log_resource,
-    "pix-infraction": _pixinfraction_log_resource,
-    "pix-request.in": _pixrequest_log_resource,
-    "pix-request.out": _pixrequest_log_resource,
-    "pix-reversal.in": _pixreversal_log_resource,
-    "pix-reversal.out": _pixreversal_log_resource,
-    "issuing-card": _issuingcard_log_resource,
-    "issuing-invoice": _issuinginvoice_log_resource,
-    "issuing-purchase": _issuingpurchase_log_resource,
-    "credit-note": _creditnote_log_resource,
+
+
+_log_packages = {
+    "pix-key": "pixkey",
+    "pix-claim": "pixclaim",
+    "pix-chargeback": "pixchargeback",
+    "pix-infraction": "pixinfraction",
+    "pix-request.in": "pixrequest",
+    "pix-request.out": "pixrequest",
+    "pix-reversal.in": "pixreversal",
+    "pix-reversal.out": "pixreversal",
+    "issuing-card": "issuingcard",
+    "issuing-invoice": "issuinginvoice",
+    "issuing-purchase": "issuingpurchase",
+    "credit-note": "creditnote",
 }
 
 
@@ -38,28 +29,56 @@ class Event(Resource):
     list all generated updates on entities.
     ## Attributes:
     - id [string]: unique id returned when the Event is created. ex: "5656565656565656"
-    - log [Log]: a Log object from one of the subscribed services (PixRequestLog, PixReversalLog)
+    - log [Log]: a Log object from one of the subscribed services (PixRequestLog, PixReversalLog). Decoded on first access
     - created [datetime.datetime]: creation datetime for the notification Event. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     - is_delivered [bool]: true if the Event has been successfully delivered to the user url. ex: False
     - subscription [string]: service that triggered this Event. Options: "pix-request.in", "pix-request.out", "pix-reversal.in", "pix-reversal.out", "pix-key", "pix-claim", "pix-infraction", "pix-chargeback", "issuing-card", "issuing-invoice", "issuing-purchase", "credit-note"
     - workspace_id [string]: ID of the Workspace that generated this Event. Mostly used when multiple Workspaces have Webhooks registered to the same endpoint. ex: "4545454545454545"
     """
 
+    _decode_log = True
+    _slots = ("_log", "_log_package")
+
     def __init__(self, log, created, is_delivered, subscription, workspace_id, id):
         Resource.__init__(self, id=id)
 
-        self.log = log
         self.created = check_datetime(created)
         self.is_delivered = is_delivered
         self.subscription = subscription
         self.workspace_id = workspace_id
-        if subscription in _resource_by_subscription:
-            self.log = from_api_json(resource=_resource_by_subscription[subscription], json=log)
+        self._log = log
+        self._log_package = _log_packages.get(subscription) if self._decode_log else None
+
+    @property
+    def log(self):
+        if self._log_package is not None and isinstance(self._log, dict):
+            self._log = from_api_json(resource=_log_resource(self._log_package), json=self._log)
+        self._log_package = None
+        return self._log
+
+    @log.setter
+    def log(self, log):
+        self._log = log
+        self._log_package = None
 
 
 _resource = {"class": Event, "name": "Event"}
 
 
+class _RawLogEvent(Event):
+
+    _decode_log = False
+
+
+_RawLogEvent.__name__ = Event.__name__
+
+_raw_log_resource = {"class": _RawLogEvent, "name": "Event"}
+
+
+def _log_resource(package):
+    return import_module("starkinfra.{package}.log.__log".format(package=package))._resource
+
+
 def get(id, user=None):
     """# Retrieve a specific notification Event
     Receive a single notification Event object previously created in the Stark Infra API by its id
@@ -73,7 +92,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, is_delivered=None, user=None):
+def query(limit=None, after=None, before=None, is_delivered=None, decode_log=True, prefetch=None, compact=False, user=None):
     """# Retrieve notification Events
     Receive a generator of notification Event objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -81,21 +100,26 @@ def query(limit=None, after=None, before=None, is_delivered=None, user=None):
     - after [datetime.date or string, default None]: date filter for objects created only after specified date. ex: datetime.date(2020, 3, 10)
     - before [datetime.date or string, default None]: date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - is_delivered [bool, default None]: bool to filter successfully delivered events. ex: True or False
+    - decode_log [bool, default True]: if False, the Event log is kept as the dictionary received from the API instead of being decoded into a Log object. ex: False
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of Event objects with updated attributes
     """
     return rest.get_stream(
-        resource=_resource,
+        resource=_resource if decode_log else _raw_log_resource,
         limit=limit,
         after=check_date(after),
         before=check_date(before),
         is_delivered=is_delivered,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
 
-def page(cursor=None, limit=None, after=None, before=None, is_delivered=None, user=None):
+def page(cursor=None, limit=None, after=None, before=None, is_delivered=None, decode_log=True, user=None):
     """# Retrieve paged Events
     Receive a list of up to 100 Event objects previously created in the Stark Infra API and the cursor to the next page.
     Use this function instead of query if you want to manually page your requests.
@@ -105,13 +129,14 @@ def page(cursor=None, limit=None, after=None, before=None, is_delivered=None, us
     - after [datetime.date or string, default None]: date filter for objects created only after specified date. ex: datetime.date(2020, 3, 10)
     - before [datetime.date or string, default None]: date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - is_delivered [bool, default None]: bool to filter successfully delivered events. ex: True or False
+    - decode_log [bool, default True]: if False, the Event log is kept as the dictionary received from the API instead of being decoded into a Log object. ex: False
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - list of Event objects with updated attributes
     - cursor to retrieve the next page of Event objects
     """
     return rest.get_page(
-        resource=_resource,
+        resource=_resource if decode_log else _raw_log_resource,
         cursor=cursor,
         limit=limit,
         after=check_date(after),
@@ -152,7 +177,7 @@ def update(id, is_delivered, user=None):
     return rest.patch_id(resource=_resource, id=id, user=user, payload=payload)
 
 
-def parse(content, signature, user=None):
+def parse(content, signature, decode_log=True, user=None):
     """# Create a single notification Event from a content string
     Create a single Event object received from Event listening at subscribed user endpoint.
     If the provided digital signature does not check out with the StarkInfra public key, a
@@ -161,6 +186,7 @@ def parse(content, signature, user=None):
     - content [string]: response content from request received at user endpoint (not parsed)
     - signature [string]: base-64 digital signature received at response header "Digital-Signature"
     ## Parameters (optional):
+    - decode_log [bool, default True]: if False, the Event log is kept as the dictionary received from the API instead of being decoded into a Log object. ex: False
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - Parsed Event object
@@ -170,6 +196,6 @@ def parse(content, signature, user=None):
         content=content,
         signature=signature,
         user=user,
-        resource=_resource,
+        resource=_resource if decode_log else _raw_log_resource,
         key="event",
     )
@@ -1,3 +1,4 @@
 from .__event import query, page, get, parse, delete, update
+from .__parserpool import ParserPool
 from .attempt.__attempt import Attempt
 from . import attempt
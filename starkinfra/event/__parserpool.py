@@ -0,0 +1,116 @@
+from json import loads
+from threading import BoundedSemaphore
+from multiprocessing import cpu_count
+from ellipticcurve import PublicKey, Signature
+from ..utils.api import from_api_json
+from ..utils import parse as _parse
+from ..utils.verifier import _Key, _is_signature_valid
+from .__event import _resource, parse
+
+
+_keys = {}
+
+
+class ParserPool:
+    """# Event ParserPool object
+    The ParserPool verifies and parses Event contents received at your webhook endpoint in a pool of
+    worker processes, so a single receiver can use all the machine cores.
+    The Stark Infra public key is fetched once in the calling process and sent to the workers, which keep
+    their own precomputed verification tables. Contents whose signature does not match in the workers are
+    checked again in the calling process, where the public key may be refreshed.
+    Submissions block while max_pending contents are waiting to be parsed.
+    ## Parameters (optional):
+    - processes [integer, default None]: number of worker processes. Defaults to the number of cores. ex: 4
+    - max_pending [integer, default None]: maximum number of submitted contents waiting to be parsed. Defaults to 8 per process. ex: 64
+    - user [Organization/Project object, default None]: Organization or Project object used to fetch the public key. Not necessary if starkinfra.user was set before the first submission.
+    """
+
+    def __init__(self, processes=None, max_pending=None, user=None):
+        # concurrent.futures is missing on Python 2, where starkinfra.event must still be importable
+        from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+        self._future = Future
+        self.processes = processes or cpu_count()
+        self.max_pending = max_pending or self.processes * 8
+        self.user = user
+        self._slots = BoundedSemaphore(self.max_pending)
+        self._executor = ProcessPoolExecutor(max_workers=self.processes)
+        self._fallback = ThreadPoolExecutor(max_workers=1)
+
+    def submit(self, content, signature):
+        """# Submit an Event content to be parsed
+        ## Parameters (required):
+        - content [string]: response content from request received at user endpoint (not parsed)
+        - signature [string]: base-64 digital signature received at response header "Digital-Signature"
+        ## Return:
+        - concurrent.futures.Future resolving to the parsed Event object or raising starkinfra.error.InvalidSignatureError. Use asyncio.wrap_future to await it.
+        """
+        pem = self._public_key()
+        self._slots.acquire()
+        future = self._future()
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            task = self._executor.submit(_parse_event, pem, content, signature)
+        except:
+            self._slots.release()
+            raise
+        task.add_done_callback(lambda task: self._resolve(task, future, content, signature))
+        return future
+
+    def parse(self, content, signature):
+        """# Parse an Event content in the pool
+        ## Parameters (required):
+        - content [string]: response content from request received at user endpoint (not parsed)
+        - signature [string]: base-64 digital signature received at response header "Digital-Signature"
+        ## Return:
+        - Parsed Event object
+        """
+        return self.submit(content=content, signature=signature).result()
+
+    def close(self):
+        """# Close the pool
+        Wait for the pending contents to be parsed and stop the worker processes.
+        """
+        self._executor.shutdown(wait=True)
+        self._fallback.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _public_key(self):
+        return _parse.verifier._get_key(user=self.user).public_key.toPem()
+
+    def _resolve(self, task, future, content, signature):
+        try:
+            event = task.result()
+        except Exception as exception:
+            future.set_exception(exception)
+            return
+        if event is not None:
+            future.set_result(event)
+            return
+        self._fallback.submit(_run, future, parse, content=content, signature=signature, user=self.user)
+
+
+def _run(future, function, **kwargs):
+    try:
+        future.set_result(function(**kwargs))
+    except Exception as exception:
+        future.set_exception(exception)
+
+
+def _parse_event(pem, content, signature):
+    key = _keys.get(pem)
+    if key is None:
+        key = _keys[pem] = _Key(PublicKey.fromPem(pem))
+    try:
+        signature = Signature.fromBase64(signature)
+    except:
+        return None
+    if not _is_signature_valid(content=content, signature=signature, key=key):
+        return None
+    event = from_api_json(resource=_resource, json=loads(content, strict=False)["event"])
+    event.log
+    return event
@@ -42,7 +42,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, event_ids=None, webhook_ids=None, user=None):
+def query(limit=None, after=None, before=None, event_ids=None, webhook_ids=None, prefetch=None, compact=False, user=None):
     """# Retrieve event.Attempts
     Receive a generator of event.Attempt objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -51,6 +51,8 @@ def query(limit=None, after=None, before=None, event_ids=None, webhook_ids=None,
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - event_ids [list of strings, default None]: list of Event ids to filter attempts. ex: ["5656565656565656", "4545454545454545"]
     - webhook_ids [list of strings, default None]: list of Webhook ids to filter attempts. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of event.Attempt objects with updated attributes
@@ -62,6 +64,8 @@ def query(limit=None, after=None, before=None, event_ids=None, webhook_ids=None,
         before=check_date(before),
         event_ids=event_ids,
         webhook_ids=webhook_ids,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
@@ -63,7 +63,21 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, status=None, tags=None, ids=None, after=None, before=None, user=None):
+def get_many(ids, workers=4, user=None):
+    """# Retrieve several IndividualIdentitys
+    Receive the IndividualIdentity objects previously created in the Stark Infra API by their ids. The ids are queried in chunks of 100 sent at the same time
+    ## Parameters (required):
+    - ids [list of strings]: list of object unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of IndividualIdentity objects in the same order as the ids, with None in place of the ones not found. Its missing attribute lists the ids not found
+    """
+    return rest.get_many(resource=_resource, ids=ids, workers=workers, user=user)
+
+
+def query(limit=None, status=None, tags=None, ids=None, after=None, before=None, prefetch=None, compact=False, user=None):
     """# Retrieve IndividualIdentities
     Receive a generator of IndividualIdentity objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -73,6 +87,8 @@ def query(limit=None, status=None, tags=None, ids=None, after=None, before=None,
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "canceled", "processing", "failed", "success"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IndividualIdentity objects with updated attributes
@@ -85,6 +101,8 @@ def query(limit=None, status=None, tags=None, ids=None, after=None, before=None,
         status=status,
         tags=tags,
         ids=ids,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
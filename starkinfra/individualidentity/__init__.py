@@ -1,3 +1,3 @@
 from . import log
 from .log.__log import Log
-from .__individualidentity import create, get, query, page, cancel, update
+from .__individualidentity import create, get, get_many, query, page, cancel, update
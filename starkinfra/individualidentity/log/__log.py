@@ -1,7 +1,7 @@
 from ...utils import rest
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
-from starkcore.utils.api import from_api_json
+from ...utils.api import from_api_json
 from ..__individualidentity import _resource as _individualIdentity_resource
 
 
@@ -19,6 +19,8 @@ class Log(Resource):
     - created [datetime.datetime]: creation datetime for the log. ex: datetime.datetime(2020, 3, 10, 10, 30, 0, 0)
     """
 
+    _slots = ("individual",)
+
     def __init__(self, id, created, type, errors, identity):
         Resource.__init__(self, id=id)
 
@@ -44,7 +46,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, types=None, identities_ids=None, user=None):
+def query(limit=None, after=None, before=None, types=None, identities_ids=None, prefetch=None, compact=False, user=None):
     """# Retrieve individualidentity.Logs
     Receive a generator of individualidentity.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -53,6 +55,8 @@ def query(limit=None, after=None, before=None, types=None, identities_ids=None,
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter for log event types. ex: ["created", "canceled", "processing", "failed", "success"]
     - identities_ids [list of strings, default None]: list of IndividualIdentity ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of individualidentity.Log objects with updated attributes
@@ -64,6 +68,8 @@ def query(limit=None, after=None, before=None, types=None, identities_ids=None,
         before=check_date(before),
         types=types,
         identities_ids=identities_ids,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
@@ -34,4 +34,4 @@ def get(user=None):
     ## Return:
     - IssuingBalance object with updated attributes
     """
-    return next(rest.get_stream(resource=_resource, user=user))
+    return rest.get_first(resource=_resource, user=user)
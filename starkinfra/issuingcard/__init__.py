@@ -1,3 +1,3 @@
 from . import log
 from .log.__log import Log
-from .__issuingcard import create, get, query, page, update, cancel
+from .__issuingcard import create, get, get_many, query, page, update, cancel
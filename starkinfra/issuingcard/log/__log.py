@@ -1,4 +1,4 @@
-from starkcore.utils.api import from_api_json
+from ...utils.api import from_api_json
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 from ...utils import rest
@@ -42,7 +42,21 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(ids=None, card_ids=None, types=None, after=None, before=None, limit=None, user=None):
+def get_many(ids, workers=4, user=None):
+    """# Retrieve several IssuingCard.Logs
+    Receive the IssuingCard.Log objects previously created in the Stark Infra API by their ids. The ids are queried in chunks of 100 sent at the same time
+    ## Parameters (required):
+    - ids [list of strings]: list of object unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of IssuingCard.Log objects in the same order as the ids, with None in place of the ones not found. Its missing attribute lists the ids not found
+    """
+    return rest.get_many(resource=_resource, ids=ids, workers=workers, user=user)
+
+
+def query(ids=None, card_ids=None, types=None, after=None, before=None, limit=None, prefetch=None, compact=False, user=None):
     """# Retrieve issuingcard.Log
     Receive a generator of issuingcard.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -52,6 +66,8 @@ def query(ids=None, card_ids=None, types=None, after=None, before=None, limit=No
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter for log event types. ex: ["blocked", "canceled", "created", "expired", "unblocked", "updated"]
     - card_ids [list of strings, default None]: list of IssuingCard ids to filter logs. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of issuingcard.Log objects with updated attributes
@@ -64,6 +80,8 @@ def query(ids=None, card_ids=None, types=None, after=None, before=None, limit=No
         before=check_date(before),
         types=types,
         card_ids=card_ids,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
@@ -65,7 +65,21 @@ def get(id, expand=None, user=None):
     return rest.get_id(resource=_resource, id=id, expand=expand, user=user)
 
 
-def query(limit=None, ids=None, after=None, before=None, status=None, tags=None, expand=None, user=None):
+def get_many(ids, workers=4, user=None):
+    """# Retrieve several IssuingHolders
+    Receive the IssuingHolder objects previously created in the Stark Infra API by their ids. The ids are queried in chunks of 100 sent at the same time
+    ## Parameters (required):
+    - ids [list of strings]: list of object unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
+    ## Return:
+    - list of IssuingHolder objects in the same order as the ids, with None in place of the ones not found. Its missing attribute lists the ids not found
+    """
+    return rest.get_many(resource=_resource, ids=ids, workers=workers, user=user)
+
+
+def query(limit=None, ids=None, after=None, before=None, status=None, tags=None, expand=None, prefetch=None, compact=False, user=None):
     """# Retrieve IssuingHolders
     Receive a generator of IssuingHolder objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -76,6 +90,8 @@ def query(limit=None, ids=None, after=None, before=None, status=None, tags=None,
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["active", "blocked", "canceled"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - expand [string, default None]: fields to expand information. Options: ["rules"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of IssuingHolder objects with updated attributes
@@ -89,6 +105,8 @@ def query(limit=None, ids=None, after=None, before=None, status=None, tags=None,
         status=status,
         tags=tags,
         expand=expand,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
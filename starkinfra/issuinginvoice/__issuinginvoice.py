@@ -69,7 +69,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, tags=None, user=None):
+def query(limit=None, after=None, before=None, status=None, tags=None, prefetch=None, compact=False, user=None):
     """# Retrieve IssuingInvoices
     Receive a generator of IssuingInvoice objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -78,6 +78,8 @@ def query(limit=None, after=None, before=None, status=None, tags=None, user=None
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["created", "expired", "overdue", "paid"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingInvoice objects with updated attributes
@@ -89,6 +91,8 @@ def query(limit=None, after=None, before=None, status=None, tags=None, user=None
         before=check_date(before),
         tags=tags,
         limit=limit,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
@@ -1 +1 @@
-from .__log import get, query, page
+from .__log import get, get_many, query, page
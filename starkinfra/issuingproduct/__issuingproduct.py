@@ -28,11 +28,13 @@ class IssuingProduct(Resource):
 _resource = {"class": IssuingProduct, "name": "IssuingProduct"}
 
 
-def query(limit=None, user=None):
+def query(limit=None, prefetch=None, compact=False, user=None):
     """# Retrieve IssuingProducts
     Receive a generator of IssuingProduct objects previously registered in the Stark Infra API
     ## Parameters (optional):
     - limit [integer, default None]: maximum number of objects to be retrieved. Unlimited if None. ex: 35
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of IssuingProduct objects with updated attributes
@@ -40,6 +42,8 @@ def query(limit=None, user=None):
     return rest.get_stream(
         resource=_resource,
         limit=limit,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
@@ -1,7 +1,6 @@
-from json import dumps
 from ..utils import rest
+from ..utils.template import Template
 from ..utils.parse import parse_and_verify
-from starkcore.utils.api import api_json
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 
@@ -88,6 +87,7 @@ class IssuingPurchase(Resource):
 
 
 _resource = {"class": IssuingPurchase, "name": "IssuingPurchase"}
+_response = Template(["status", "amount", "reason", "tags"], root="authorization")
 
 
 def get(id, user=None):
@@ -103,8 +103,22 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
+def get_many(ids, workers=4, user=None):
+    """# Retrieve several IssuingPurchases
+    Receive the IssuingPurchase objects previously created in the Stark Infra API by their ids. The ids are queried in chunks of 100 sent at the same time
+    ## Parameters (required):
+    - ids [list of strings]: list of object unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
+    ## Return:
+    - list of IssuingPurchase objects in the same order as the ids, with None in place of the ones not found. Its missing attribute lists the ids not found
+    """
+    return rest.get_many(resource=_resource, ids=ids, workers=workers, user=user)
+
+
 def query(ids=None, limit=None, after=None, before=None, end_to_end_ids=None, holder_ids=None, card_ids=None,
-          status=None, user=None):
+          status=None, prefetch=None, compact=False, user=None):
     """# Retrieve IssuingPurchase
     Receive a generator of IssuingPurchase objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -116,6 +130,8 @@ def query(ids=None, limit=None, after=None, before=None, end_to_end_ids=None, ho
     - holder_ids [list of strings, default []]: card holder IDs. ex: ["5656565656565656", "4545454545454545"]
     - card_ids [list of strings, default []]: card  IDs. ex: ["5656565656565656", "4545454545454545"]
     - status [list of strings, default None]: filter for status of retrieved objects. ex: ["approved", "canceled", "denied", "confirmed", "voided"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of IssuingPurchase objects with updated attributes
@@ -130,6 +146,8 @@ def query(ids=None, limit=None, after=None, before=None, end_to_end_ids=None, ho
         holder_ids=holder_ids,
         card_ids=card_ids,
         status=status,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
@@ -204,10 +222,9 @@ def response(status, amount=None, reason=None, tags=None):
     ## Return:
     - Dumped JSON string that must be returned to us on the IssuingPurchase request
     """
-    params = {"authorization": {
-        "status": status,
-        "amount": amount,
-        "reason": reason,
-        "tags": tags,
-    }}
-    return dumps(api_json(params))
+    return _response.render(
+        status=status,
+        amount=amount,
+        reason=reason,
+        tags=tags,
+    )
@@ -0,0 +1,209 @@
+from datetime import datetime, timedelta
+from threading import Lock
+from starkinfra.merchantcategory.__merchantcategory import catalog as _category_catalog
+
+
+_card_reasons = {"blocked": "blocked", "canceled": "invalidCard", "expired": "cardExpired"}
+_holder_reasons = {"blocked": "blocked", "canceled": "invalidCard"}
+
+
+class RuleEngine:
+    """# RuleEngine object
+    The RuleEngine evaluates IssuingPurchase authorization requests against the IssuingRules of their
+    IssuingCards and IssuingHolders locally, so authorizations can be answered without calling the API.
+    Rules are compiled into sets of accepted codes and the amount spent in each rule interval is counted
+    in memory, starting from the rule counter_amount when the card or holder is added.
+    A purchase is approved if every applicable rule of its card and holder has enough amount left,
+    and if the card and holder have at least one applicable rule when they have any rules.
+    The category types of the merchant category codes are taken from starkinfra.merchantcategory.catalog
+    when the first card or holder with rules by category type is added, so evaluate never calls the API.
+    ## Parameters (optional):
+    - utc_offset [integer, default -3]: offset in hours of the timezone in which the rule intervals start. ex: 0
+    - categories [list of MerchantCategory objects, default None]: merchant categories used to resolve category types instead of the catalog. ex: list(starkinfra.merchantcategory.query())
+    """
+
+    def __init__(self, utc_offset=-3, categories=None):
+        self.utc_offset = timedelta(hours=utc_offset)
+        self._lock = Lock()
+        self._cards = {}
+        self._holders = {}
+        self._category_types = None
+        self._last = None
+        if categories is not None:
+            self.load_categories(categories)
+
+    def add_card(self, card):
+        """# Add an IssuingCard and its rules
+        ## Parameters (required):
+        - card [IssuingCard object]: card retrieved with its rules expanded. ex: starkinfra.issuingcard.get("5656565656565656", expand=["rules"])
+        """
+        compiled = _Owner(id=card.id, status=card.status, rules=self._compile(card.rules), holder_id=card.holder_id)
+        if compiled.uses_types and self._category_types is None:
+            self.load_categories()
+        with self._lock:
+            self._cards[card.id] = compiled
+
+    def add_holder(self, holder):
+        """# Add an IssuingHolder and its rules
+        ## Parameters (required):
+        - holder [IssuingHolder object]: holder retrieved with its rules expanded. ex: starkinfra.issuingholder.get("5656565656565656", expand=["rules"])
+        """
+        compiled = _Owner(id=holder.id, status=holder.status, rules=self._compile(holder.rules))
+        if compiled.uses_types and self._category_types is None:
+            self.load_categories()
+        with self._lock:
+            self._holders[holder.id] = compiled
+
+    def load_categories(self, categories=None):
+        """# Load the category types of the merchant category codes
+        Called when the first card or holder with rules by category type is added. Call it again to pick up catalog updates.
+        ## Parameters (optional):
+        - categories [list of MerchantCategory objects, default None]: merchant categories to be used. Defaults to the ones in starkinfra.merchantcategory.catalog
+        """
+        if categories is None:
+            categories = _category_catalog
+        self._category_types = dict((category.code, category.type) for category in categories if category.code)
+
+    def remove_card(self, id):
+        with self._lock:
+            self._cards.pop(id, None)
+
+    def remove_holder(self, id):
+        with self._lock:
+            self._holders.pop(id, None)
+
+    def evaluate(self, purchase, commit=True):
+        """# Evaluate an IssuingPurchase authorization request
+        ## Parameters (required):
+        - purchase [IssuingPurchase object]: authorization request. ex: starkinfra.issuingpurchase.parse(content, signature)
+        ## Parameters (optional):
+        - commit [bool, default True]: whether an approved amount is added to the rule counters. ex: False
+        ## Return:
+        - dictionary with the status, amount and reason to be sent with starkinfra.issuingpurchase.response(**decision), or None if the purchase card was not added to the engine
+        """
+        card = self._cards.get(purchase.card_id)
+        if card is None:
+            return None
+        holder = self._holders.get(card.holder_id)
+        period = self._periods(purchase.created)
+        category_type = self._category_types.get(purchase.merchant_category_code, "") if (
+            card.uses_types or (holder is not None and holder.uses_types)
+        ) else None
+
+        with self._lock:
+            card_rules = card.applicable(purchase, category_type)
+            reason = _check(card, card_rules, _card_reasons, "cardRuleMismatch")
+            holder_rules = []
+            if reason is None and holder is not None:
+                holder_rules = holder.applicable(purchase, category_type)
+                reason = _check(holder, holder_rules, _holder_reasons, "holderRuleMismatch")
+            if reason is not None:
+                return _decision("denied", reason=reason)
+
+            rules = card_rules + holder_rules
+            amount = purchase.amount
+            exceeded = [rule for rule in rules if rule.available(period) < rule.cost(purchase)]
+            if exceeded:
+                partial = purchase.is_partial_allowed and not any(rule.currency_code for rule in rules)
+                amount = min(rule.available(period) for rule in rules) if partial else 0
+                if amount <= 0:
+                    return _decision(
+                        "denied",
+                        reason="insufficientCardLimit" if exceeded[0] in card_rules else "insufficientHolderLimit",
+                    )
+            if commit:
+                for rule in rules:
+                    rule.spend(amount if exceeded else rule.cost(purchase), period)
+        return _decision("approved", amount=amount)
+
+    def _compile(self, rules):
+        return [_CompiledRule(rule, self._periods(None)) for rule in rules or []]
+
+    def _periods(self, created):
+        moment = (created.replace(tzinfo=None) if created else datetime.utcnow()) + self.utc_offset
+        date = moment.date()
+        last = self._last
+        if last is not None and last[0] == date:
+            return last[1]
+        year, week, _ = date.isocalendar()
+        periods = {
+            "instant": None,
+            "day": date.toordinal(),
+            "week": (year, week),
+            "month": (date.year, date.month),
+            "year": date.year,
+            "lifetime": 0,
+        }
+        self._last = (date, periods)
+        return periods
+
+
+class _Owner:
+
+    def __init__(self, id, status, rules, holder_id=None):
+        self.id = id
+        self.status = status
+        self.rules = rules
+        self.holder_id = holder_id
+        self.uses_types = any(rule.category_types for rule in rules)
+
+    def applicable(self, purchase, category_type):
+        return [rule for rule in self.rules if rule.matches(purchase, category_type)]
+
+
+class _CompiledRule:
+
+    def __init__(self, rule, periods):
+        self.amount = rule.amount
+        self.interval = rule.interval or "lifetime"
+        self.currency_code = rule.currency_code if rule.currency_code not in (None, "BRL") else None
+        self.category_codes = set(category.code for category in rule.categories if category.code)
+        self.category_types = set(category.type for category in rule.categories if category.type and not category.code)
+        self.has_categories = bool(rule.categories)
+        self.countries = set(country.code for country in rule.countries) or None
+        self.methods = set(method.code for method in rule.methods) or None
+        self.period = periods[self.interval]
+        self.counter = rule.counter_amount or 0
+
+    def matches(self, purchase, category_type):
+        if self.currency_code is not None and purchase.merchant_currency_code != self.currency_code:
+            return False
+        if self.has_categories and purchase.merchant_category_code not in self.category_codes \
+                and category_type not in self.category_types:
+            return False
+        if self.countries is not None and purchase.merchant_country_code not in self.countries:
+            return False
+        if self.methods is not None and purchase.method_code not in self.methods:
+            return False
+        return True
+
+    def cost(self, purchase):
+        return purchase.merchant_amount if self.currency_code is not None else purchase.amount
+
+    def available(self, periods):
+        if self.interval == "instant":
+            return self.amount
+        if periods[self.interval] != self.period:
+            return self.amount
+        return self.amount - self.counter
+
+    def spend(self, amount, periods):
+        if self.interval == "instant":
+            return
+        period = periods[self.interval]
+        if period != self.period:
+            self.period = period
+            self.counter = 0
+        self.counter += amount
+
+
+def _check(owner, rules, reasons, mismatch):
+    if owner.status in reasons:
+        return reasons[owner.status]
+    if owner.rules and not rules:
+        return mismatch
+    return None
+
+
+def _decision(status, amount=None, reason=None):
+    return {"status": status, "amount": amount, "reason": reason}
@@ -1,2 +1,3 @@
 from .__issuingrule import IssuingRule
 from .__issuingrule import parse_rules
+from .__engine import RuleEngine
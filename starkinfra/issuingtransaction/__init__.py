@@ -1 +1 @@
-from .__issuingtransaction import get, query, page
+from .__issuingtransaction import get, get_many, query, page
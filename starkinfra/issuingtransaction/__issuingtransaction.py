@@ -43,8 +43,22 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
+def get_many(ids, workers=4, user=None):
+    """# Retrieve several IssuingTransactions
+    Receive the IssuingTransaction objects previously created in the Stark Infra API by their ids. The ids are queried in chunks of 100 sent at the same time
+    ## Parameters (required):
+    - ids [list of strings]: list of object unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of IssuingTransaction objects in the same order as the ids, with None in place of the ones not found. Its missing attribute lists the ids not found
+    """
+    return rest.get_many(resource=_resource, ids=ids, workers=workers, user=user)
+
+
 def query(source=None, tags=None, external_ids=None, after=None, before=None,
-          ids=None, limit=None, user=None):
+          ids=None, limit=None, prefetch=None, compact=False, user=None):
     """# Retrieve IssuingTransaction
     Receive a generator of IssuingTransaction objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -55,6 +69,8 @@ def query(source=None, tags=None, external_ids=None, after=None, before=None,
     - status [string, default None]: filter for status of retrieved objects. ex: "approved", "canceled", "denied", "confirmed" or "voided"
     - ids [list of strings, default [], default None]: purchase IDs
     - limit [integer, default None]: maximum number of objects to be retrieved. Unlimited if None. ex: 35
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingTransaction objects with updated attributes
@@ -68,6 +84,8 @@ def query(source=None, tags=None, external_ids=None, after=None, before=None,
         before=check_date(before),
         ids=ids,
         limit=limit,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
@@ -64,7 +64,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(external_ids=None, after=None, before=None, limit=None, tags=None, user=None):
+def query(external_ids=None, after=None, before=None, limit=None, tags=None, prefetch=None, compact=False, user=None):
     """# Retrieve IssuingWithdrawals
     Receive a generator of IssuingWithdrawal objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -73,6 +73,8 @@ def query(external_ids=None, after=None, before=None, limit=None, tags=None, use
     - after [datetime.date or string, default None] date filter for objects created only after specified date. ex: datetime.date(2020, 3, 10)
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of IssuingWithdrawal objects with updated attributes
@@ -84,6 +86,8 @@ def query(external_ids=None, after=None, before=None, limit=None, tags=None, use
         before=check_date(before),
         tags=tags,
         limit=limit,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
@@ -1 +1 @@
-from .__merchantcategory import query
+from .__merchantcategory import query, catalog
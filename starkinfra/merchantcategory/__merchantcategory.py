@@ -1,5 +1,6 @@
 from starkcore.utils.subresource import SubResource
 from starkinfra.utils import rest
+from starkinfra.utils.catalog import Catalog
 
 
 class MerchantCategory(SubResource):
@@ -25,12 +26,16 @@ class MerchantCategory(SubResource):
 
 _resource = {"class": MerchantCategory, "name": "MerchantCategory"}
 
+catalog = Catalog(resource=_resource, fields=["code", "type", "name", "number"])
 
-def query(search=None, user=None):
+
+def query(search=None, prefetch=None, compact=False, user=None):
     """# Retrieve MerchantCategories
     Receive a generator of MerchantCategory objects previously created in the Stark Infra API
     ## Parameters (optional):
     - search [string, default None]: keyword to search for code, type, name or number
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of MerchantCategory objects with updated attributes
@@ -38,5 +43,7 @@ def query(search=None, user=None):
     return rest.get_stream(
         resource=_resource,
         search=search,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
@@ -1 +1 @@
-from .__merchantcountry import query
+from .__merchantcountry import query, catalog
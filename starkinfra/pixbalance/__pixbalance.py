@@ -35,4 +35,4 @@ def get(user=None):
     ## Return:
     - PixBalance object with updated attributes
     """
-    return next(rest.get_stream(resource=_resource, user=user))
+    return rest.get_first(resource=_resource, user=user)
@@ -84,7 +84,21 @@ def get(id, user=None):
     return rest.get_id(id=id, resource=_resource, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, ids=None, flow=None, tags=None, user=None):
+def get_many(ids, workers=4, user=None):
+    """# Retrieve several PixChargebacks
+    Receive the PixChargeback objects previously created in the Stark Infra API by their ids. The ids are queried in chunks of 100 sent at the same time
+    ## Parameters (required):
+    - ids [list of strings]: list of object unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of PixChargeback objects in the same order as the ids, with None in place of the ones not found. Its missing attribute lists the ids not found
+    """
+    return rest.get_many(resource=_resource, ids=ids, workers=workers, user=user)
+
+
+def query(limit=None, after=None, before=None, status=None, ids=None, flow=None, tags=None, prefetch=None, compact=False, user=None):
     """# Retrieve PixChargebacks
     Receive a generator of PixChargeback objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -95,6 +109,8 @@ def query(limit=None, after=None, before=None, status=None, ids=None, flow=None,
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - flow [string, default None]: direction of the Pix Chargeback. Options: "in" for received chargebacks, "out" for chargebacks you requested
     - tags [list of strings, default None]: filter for tags of retrieved objects. ex: ["travel", "food"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixChargeback objects with updated attributes
@@ -109,6 +125,8 @@ def query(limit=None, after=None, before=None, status=None, ids=None, flow=None,
         ids=ids,
         flow=flow,
         tags=tags,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
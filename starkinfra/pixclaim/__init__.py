@@ -1,3 +1,3 @@
-from .__pixclaim import create, get, query, page, update
+from .__pixclaim import create, get, get_many, query, page, update
 from .log.__log import Log
 from . import log
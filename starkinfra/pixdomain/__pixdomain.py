@@ -1,6 +1,6 @@
 from ..utils import rest
 from .__certificate import _resource as _certificate_resource
-from starkcore.utils.api import from_api_json
+from ..utils.api import from_api_json
 from starkcore.utils.subresource import SubResource
 
 
@@ -25,12 +25,14 @@ def _parse_certificates(certificates):
 _resource = {"class": PixDomain, "name": "PixDomain"}
 
 
-def query(user=None):
+def query(prefetch=None, compact=False, user=None):
     """# Retrieve PixDomains
     Receive a generator of PixDomain objects.
     ## Parameters (optional):
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixDomain objects with updated attributes
     """
-    return rest.get_stream(resource=_resource, user=user)
+    return rest.get_stream(resource=_resource, prefetch=prefetch, compact=compact, user=user)
@@ -1,3 +1,3 @@
-from .__pixinfraction import create, get, query, page, update, cancel
+from .__pixinfraction import create, get, get_many, query, page, update, cancel
 from .log.__log import Log
 from . import log
@@ -78,7 +78,21 @@ def get(id, user=None):
     return rest.get_id(id=id, resource=_resource, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, ids=None, type=None, flow=None, tags=None, user=None):
+def get_many(ids, workers=4, user=None):
+    """# Retrieve several PixInfractions
+    Receive the PixInfraction objects previously created in the Stark Infra API by their ids. The ids are queried in chunks of 100 sent at the same time
+    ## Parameters (required):
+    - ids [list of strings]: list of object unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of PixInfraction objects in the same order as the ids, with None in place of the ones not found. Its missing attribute lists the ids not found
+    """
+    return rest.get_many(resource=_resource, ids=ids, workers=workers, user=user)
+
+
+def query(limit=None, after=None, before=None, status=None, ids=None, type=None, flow=None, tags=None, prefetch=None, compact=False, user=None):
     """# Retrieve PixInfractions
     Receive a generator of PixInfraction objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -90,6 +104,8 @@ def query(limit=None, after=None, before=None, status=None, ids=None, type=None,
     - type [list of strings, default None]: filter for the type of retrieved PixInfractions. Options: "fraud", "reversal", "reversalChargeback"
     - flow [string, default None]: direction of the PixInfraction flow. Options: "out" if you created the PixInfraction, "in" if you received the PixInfraction.
     - tags [list of strings, default None]: list of strings for tagging. ex: ["travel", "food"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixInfraction objects with updated attributes
@@ -105,6 +121,8 @@ def query(limit=None, after=None, before=None, status=None, ids=None, type=None,
         type=type,
         flow=flow,
         tags=tags,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
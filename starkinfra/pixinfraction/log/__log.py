@@ -1,7 +1,7 @@
 from starkcore.utils.checks import check_datetime, check_date
 from ..__pixinfraction import _resource as _pixinfraction_resource
 from starkcore.utils.resource import Resource
-from starkcore.utils.api import from_api_json
+from ...utils.api import from_api_json
 from ...utils import rest
 
 
@@ -41,7 +41,21 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(ids=None, limit=None, after=None, before=None, types=None, infraction_ids=None, user=None):
+def get_many(ids, workers=4, user=None):
+    """# Retrieve several PixInfraction.Logs
+    Receive the PixInfraction.Log objects previously created in the Stark Infra API by their ids. The ids are queried in chunks of 100 sent at the same time
+    ## Parameters (required):
+    - ids [list of strings]: list of object unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of PixInfraction.Log objects in the same order as the ids, with None in place of the ones not found. Its missing attribute lists the ids not found
+    """
+    return rest.get_many(resource=_resource, ids=ids, workers=workers, user=user)
+
+
+def query(ids=None, limit=None, after=None, before=None, types=None, infraction_ids=None, prefetch=None, compact=False, user=None):
     """# Retrieve PixInfraction.Logs
     Receive a generator of PixInfraction.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -51,6 +65,8 @@ def query(ids=None, limit=None, after=None, before=None, types=None, infraction_
     - before [datetime.date or string, default None]: date filter for objects created before a specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter retrieved objects by types. ex: ["created", "failed", "delivering", "delivered", "closed", "canceled"]
     - infraction_ids [list of strings, default None]: list of PixInfraction IDs to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of PixInfraction.Log objects with updated attributes
@@ -63,6 +79,8 @@ def query(ids=None, limit=None, after=None, before=None, types=None, infraction_
         before=check_date(before),
         types=types,
         infraction_ids=infraction_ids,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
@@ -82,7 +82,21 @@ def get(id, payer_id, end_to_end_id=None, user=None):
     return rest.get_id(id=id, payer_id=payer_id, end_to_end_id=end_to_end_id, resource=_resource, user=user)
 
 
-def query(limit=None, after=None, before=None, status=None, tags=None, ids=None, type=None, user=None):
+def get_many(ids, workers=4, user=None):
+    """# Retrieve several PixKeys
+    Receive the PixKey objects previously created in the Stark Infra API by their ids. The ids are queried in chunks of 100 sent at the same time
+    ## Parameters (required):
+    - ids [list of strings]: list of object unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of PixKey objects in the same order as the ids, with None in place of the ones not found. Its missing attribute lists the ids not found
+    """
+    return rest.get_many(resource=_resource, ids=ids, workers=workers, user=user)
+
+
+def query(limit=None, after=None, before=None, status=None, tags=None, ids=None, type=None, prefetch=None, compact=False, user=None):
     """# Retrieve PixKeys
     Receive a generator of PixKey objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -93,6 +107,8 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - type [string, default None]: filter for the type of retrieved PixKeys. Options: "cpf", "cnpj", "phone", "email" and "evp"
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixKey objects with updated attributes
@@ -107,6 +123,8 @@ def query(limit=None, after=None, before=None, status=None, tags=None, ids=None,
         tags=tags,
         ids=ids,
         type=type,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
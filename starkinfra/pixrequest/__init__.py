@@ -1,3 +1,3 @@
 from . import log
 from .log.__log import Log
-from .__pixrequest import create, get, query, page, parse, response
+from .__pixrequest import create, get, get_many, query, page, parse, response
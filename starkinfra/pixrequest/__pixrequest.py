@@ -1,7 +1,6 @@
-from json import dumps
 from ..utils import rest
+from ..utils.template import Template
 from ..utils.parse import parse_and_verify
-from starkcore.utils.api import api_json
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 
@@ -89,6 +88,7 @@ class PixRequest(Resource):
 
 
 _resource = {"class": PixRequest, "name": "PixRequest"}
+_response = Template(["status", "reason"], root="authorization")
 
 
 def create(requests, user=None):
@@ -117,8 +117,22 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
+def get_many(ids, workers=4, user=None):
+    """# Retrieve several PixRequests
+    Receive the PixRequest objects previously created in the Stark Infra API by their ids. The ids are queried in chunks of 100 sent at the same time
+    ## Parameters (required):
+    - ids [list of strings]: list of object unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of PixRequest objects in the same order as the ids, with None in place of the ones not found. Its missing attribute lists the ids not found
+    """
+    return rest.get_many(resource=_resource, ids=ids, workers=workers, user=user)
+
+
 def query(limit=None, after=None, before=None, status=None, ids=None, end_to_end_ids=None,
-          external_ids=None, tags=None, user=None):
+          external_ids=None, tags=None, prefetch=None, compact=False, user=None):
     """# Retrieve PixRequests
     Receive a generator of PixRequest objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -130,6 +144,8 @@ def query(limit=None, after=None, before=None, status=None, ids=None, end_to_end
     - end_to_end_ids [list of strings, default None]: central bank's unique transaction IDs. ex: ["E79457883202101262140HHX553UPqeq", "E79457883202101262140HHX553UPxzx"]
     - external_ids [list of strings, default None]: url safe strings that must be unique among all your PixRequests. Duplicated external IDs will cause failures. By default, this parameter will block any PixRequests that repeats amount and receiver information on the same date. ex: ["my-internal-id-123456", "my-internal-id-654321"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixRequest objects with updated attributes
@@ -144,6 +160,8 @@ def query(limit=None, after=None, before=None, status=None, ids=None, end_to_end
         end_to_end_ids=end_to_end_ids,
         external_ids=external_ids,
         tags=tags,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
@@ -220,10 +238,7 @@ def response(status, reason=None):
     ## Return:
     - Dumped JSON string that must be returned to us
     """
-    params = {
-        "authorization": {
-            "status": status,
-            "reason": reason,
-        }
-    }
-    return dumps(api_json(params))
+    return _response.render(
+        status=status,
+        reason=reason,
+    )
@@ -1,6 +1,6 @@
 from ...utils import rest
 from starkcore.utils.resource import Resource
-from starkcore.utils.api import from_api_json
+from ...utils.api import from_api_json
 from starkcore.utils.checks import check_datetime, check_date
 from ..__pixrequest import _resource as _pixrequest_resource
 
@@ -41,7 +41,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, types=None, request_ids=None, reconciliation_id=None, user=None):
+def query(limit=None, after=None, before=None, types=None, request_ids=None, reconciliation_id=None, prefetch=None, compact=False, user=None):
     """# Retrieve PixRequest.Logs
     Receive a generator of PixRequest.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -51,6 +51,8 @@ def query(limit=None, after=None, before=None, types=None, request_ids=None, rec
     - types [list of strings, default None]: filter retrieved objects by types. Options: ["sent", "denied", "failed", "created", "success", "approved", "credited", "refunded", "processing"]
     - request_ids [list of strings, default None]: list of PixRequest ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
     - reconciliation_id [string, default None]: PixRequest reconciliation id to filter retrieved objects. ex: "b77f5236-7ab9-4487-9f95-66ee6eaf1781"
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixRequest.Log objects with updated attributes
@@ -63,6 +65,8 @@ def query(limit=None, after=None, before=None, types=None, request_ids=None, rec
         types=types,
         request_ids=request_ids,
         reconciliation_id=reconciliation_id,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
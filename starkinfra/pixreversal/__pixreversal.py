@@ -1,8 +1,7 @@
-from json import dumps
-from starkcore.utils.api import api_json
 from starkcore.utils.resource import Resource
 from starkcore.utils.checks import check_datetime, check_date
 from ..utils import rest
+from ..utils.template import Template
 from ..utils.parse import parse_and_verify
 
 
@@ -48,6 +47,7 @@ class PixReversal(Resource):
 
 
 _resource = {"class": PixReversal, "name": "PixReversal"}
+_response = Template(["status", "reason"], root="authorization")
 
 
 def create(reversals, user=None):
@@ -76,8 +76,22 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
+def get_many(ids, workers=4, user=None):
+    """# Retrieve several PixReversals
+    Receive the PixReversal objects previously created in the Stark Infra API by their ids. The ids are queried in chunks of 100 sent at the same time
+    ## Parameters (required):
+    - ids [list of strings]: list of object unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of PixReversal objects in the same order as the ids, with None in place of the ones not found. Its missing attribute lists the ids not found
+    """
+    return rest.get_many(resource=_resource, ids=ids, workers=workers, user=user)
+
+
 def query(limit=None, after=None, before=None, status=None, ids=None, return_ids=None,
-          external_ids=None, tags=None, user=None):
+          external_ids=None, tags=None, prefetch=None, compact=False, user=None):
     """# Retrieve PixReversals
     Receive a generator of PixReversal objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -89,6 +103,8 @@ def query(limit=None, after=None, before=None, status=None, ids=None, return_ids
     - return_ids [list of strings, default None]: central bank's unique reversal transaction IDs. ex: ["D20018183202202030109X3OoBHG74wo", "D20018183202202030109X3OoBHG72rd"].
     - external_ids [list of strings, default None]: url safe strings that must be unique among all your PixReversals. Duplicated external IDs will cause failures. By default, this parameter will block any PixReversal that repeats amount and receiver information on the same date. ex: ["my-internal-id-123456", "my-internal-id-654321"]
     - tags [list of strings, default None]: tags to filter retrieved objects. ex: ["tony", "stark"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixReversal objects with updated attributes
@@ -104,6 +120,8 @@ def query(limit=None, after=None, before=None, status=None, ids=None, return_ids
         return_ids=return_ids,
         external_ids=external_ids,
         tags=tags,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
@@ -180,10 +198,7 @@ def response(status, reason=None):
     ## Return:
     - Dumped JSON string that must be returned to us
     """
-    params = {
-        "authorization": {
-            "status": status,
-            "reason": reason,
-        }
-    }
-    return dumps(api_json(params))
+    return _response.render(
+        status=status,
+        reason=reason,
+    )
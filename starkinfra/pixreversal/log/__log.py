@@ -1,6 +1,6 @@
 from ...utils import rest
 from starkcore.utils.resource import Resource
-from starkcore.utils.api import from_api_json
+from ...utils.api import from_api_json
 from starkcore.utils.checks import check_datetime, check_date
 from ..__pixreversal import _resource as _pixreversal_resource
 
@@ -41,7 +41,7 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, after=None, before=None, types=None, reversal_ids=None, user=None):
+def query(limit=None, after=None, before=None, types=None, reversal_ids=None, prefetch=None, compact=False, user=None):
     """# Retrieve PixReversal.Logs
     Receive a generator of PixReversal.Log objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -50,6 +50,8 @@ def query(limit=None, after=None, before=None, types=None, reversal_ids=None, us
     - before [datetime.date or string, default None]: date filter for objects created before a specified date. ex: datetime.date(2020, 3, 10)
     - types [list of strings, default None]: filter retrieved objects by types. Options: ["sent", "denied", "failed", "created", "success", "approved", "credited", "refunded", "processing"]
     - reversal_ids [list of strings, default None]: list of PixReversal IDs to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixReversal.Log objects with updated attributes
@@ -61,6 +63,8 @@ def query(limit=None, after=None, before=None, types=None, reversal_ids=None, us
         before=check_date(before),
         types=types,
         reversal_ids=reversal_ids,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
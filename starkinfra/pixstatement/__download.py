@@ -0,0 +1,194 @@
+from os import remove, rename, makedirs
+from os.path import exists, getsize, join
+from re import compile
+from time import sleep
+from socket import timeout
+from threading import Thread, Lock
+from starkcore.error import InternalServerError, UnknownError
+from ..utils import rest
+from ..utils.request import _TransportError, _ServerError
+from ..utils.compatibility import Queue, Empty, HTTPException, ConnectionResetError
+from .__pixstatement import _resource, get
+from .__reader import read_csv
+
+
+_content_range_pattern = compile(r"^bytes (\d+)-")
+_unsatisfied_range_pattern = compile(r"^bytes \*/(\d+)$")
+
+# connection errors, timeouts and 5xx responses. API, authentication, verification and disk errors are raised at once
+_retryable = (_TransportError, _ServerError, InternalServerError, HTTPException, ConnectionResetError, timeout)
+
+
+class _RangeRejected(UnknownError):
+
+    def __init__(self):
+        UnknownError.__init__(self, "the server rejected the range of the resumed download")
+
+
+def download_csv(id, path, verify=True, retries=5, chunk_size=65536, user=None):
+    """# Download a .csv PixStatement to a file
+    Retrieve a specific PixStatement by its ID in a .csv file and write it to the disk as it arrives.
+    The content is written to a "<path>.part" file first. If the connection drops or the API answers with a 5xx status,
+    the download is resumed from the last written byte using HTTP range requests, also when the function is called
+    again after a failure. Other errors are raised at once.
+    Once complete, the file checksum and its number of rows are checked against the PixStatement transaction_count
+    before the file is moved to the requested path.
+    ## Parameters (required):
+    - id [string]: object unique id. ex: "5656565656565656"
+    - path [string]: path of the file to be written. ex: "statement.zip"
+    ## Parameters (optional):
+    - verify [bool, default True]: whether to check the downloaded file against the PixStatement transaction_count. ex: False
+    - retries [integer, default 5]: number of times the download is resumed after a failure. ex: 10
+    - chunk_size [integer, default 65536]: maximum number of bytes read from the connection at once. ex: 1048576
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - number of bytes written
+    """
+    transaction_count = get(id, user=user).transaction_count if verify else None
+    return _download(
+        id=id,
+        path=path,
+        transaction_count=transaction_count,
+        verify=verify,
+        retries=retries,
+        chunk_size=chunk_size,
+        user=user,
+    )
+
+
+def download_csvs(statements, directory, verify=True, retries=5, workers=4, user=None):
+    """# Download several .csv PixStatements in parallel
+    Download the .csv file of each PixStatement to "<directory>/<id>.zip" on a pool of background threads,
+    with the same resuming and verification as download_csv. Files that already exist are not downloaded again,
+    so the function may be called again to finish the downloads after a failure.
+    ## Parameters (required):
+    - statements [list of PixStatement objects or strings]: PixStatements or their ids. ex: starkinfra.pixstatement.query(limit=10)
+    - directory [string]: directory where the files are written. ex: "statements"
+    ## Parameters (optional):
+    - verify [bool, default True]: whether to check the downloaded files against the PixStatement transaction_count. ex: False
+    - retries [integer, default 5]: number of times each download is resumed after a failure. ex: 10
+    - workers [integer, default 4]: number of files downloaded at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - dictionary of PixStatement id to file path. The first error is raised once the other downloads finish
+    """
+    if not exists(directory):
+        makedirs(directory)
+
+    pending = Queue()
+    for statement in statements:
+        pending.put(statement)
+    paths = {}
+    errors = []
+    lock = Lock()
+
+    def drain():
+        while True:
+            try:
+                statement = pending.get_nowait()
+            except Empty:
+                return
+            id = getattr(statement, "id", statement)
+            path = join(directory, "{id}.zip".format(id=id))
+            try:
+                if not exists(path):
+                    transaction_count = getattr(statement, "transaction_count", None)
+                    if verify and transaction_count is None:
+                        transaction_count = get(id, user=user).transaction_count
+                    _download(
+                        id=id,
+                        path=path,
+                        transaction_count=transaction_count,
+                        verify=verify,
+                        retries=retries,
+                        user=user,
+                    )
+            except Exception as exception:
+                with lock:
+                    errors.append(exception)
+                continue
+            with lock:
+                paths[id] = path
+
+    threads = [Thread(target=drain) for _ in range(min(workers, pending.qsize()))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return paths
+
+
+def _download(id, path, transaction_count, verify, retries, chunk_size=65536, user=None):
+    part = path + ".part"
+    attempt = 0
+    while True:
+        offset = getsize(part) if exists(part) else 0
+        try:
+            _fetch(id=id, part=part, offset=offset, chunk_size=chunk_size, user=user)
+        except _RangeRejected:
+            attempt += 1
+            if attempt > retries:
+                raise
+            _remove(part)
+            continue
+        except _retryable:
+            attempt += 1
+            if attempt > retries:
+                raise
+            sleep(min(0.1 * 2 ** attempt, 5))
+            continue
+        if verify:
+            _verify(part, transaction_count)
+        break
+
+    size = getsize(part)
+    if exists(path):
+        remove(path)
+    rename(part, path)
+    return size
+
+
+def _fetch(id, part, offset, chunk_size, user):
+    response = rest.get_content_response(
+        resource=_resource,
+        id=id,
+        sub_resource_name="csv",
+        headers={"Range": "bytes={offset}-".format(offset=offset)} if offset else None,
+        user=user,
+    )
+    try:
+        if response.status == 416:
+            match = _unsatisfied_range_pattern.match(response.headers.get("content-range", ""))
+            if match is not None and int(match.group(1)) == offset:
+                return
+            raise _RangeRejected()
+        match = _content_range_pattern.match(response.headers.get("content-range", ""))
+        resumed = response.status == 206 and match is not None and int(match.group(1)) == offset
+        with open(part, "ab" if resumed else "wb") as file:
+            for chunk in response.iterate(chunk_size):
+                file.write(chunk)
+    finally:
+        response.close()
+
+
+def _verify(part, transaction_count):
+    try:
+        rows = sum(1 for _ in read_csv(part))
+    except ValueError as exception:
+        _remove(part)
+        raise UnknownError("downloaded statement is corrupted: {message}".format(message=exception))
+    if transaction_count is not None and rows != transaction_count:
+        _remove(part)
+        raise UnknownError("downloaded statement has {rows} rows, but {count} were expected".format(
+            rows=rows,
+            count=transaction_count,
+        ))
+
+
+def _remove(path):
+    if exists(path):
+        remove(path)
@@ -0,0 +1,189 @@
+from os import remove, rename, close
+from os.path import exists
+from mmap import mmap, ACCESS_READ
+from json import dumps, loads
+from heapq import merge
+from struct import Struct
+from tempfile import mkstemp
+from .__reader import _read_rows, _converters, _row
+
+
+_magic = b"SPXIDX01"
+_header = Struct("<8sIQQQ")
+_offset = Struct("<Q")
+_run_key = Struct("<H")
+_run_size = 1 << 20
+
+
+class StatementIndex:
+    """# StatementIndex object
+    The StatementIndex opens an index file built by pixstatement.build_index and looks up
+    the PixStatement rows by end-to-end id or return id with a binary search over the
+    memory-mapped file, so lookups take microseconds and the statement is never loaded in memory.
+    ## Parameters (required):
+    - path [string]: path of the index file. ex: "statement.idx"
+    ## Parameters (optional):
+    - types [dictionary of string to function, default None]: functions used to convert the values of each column, by snake case column name. ex: {"amount": int}
+    ## Attributes (return-only):
+    - names [list of strings]: snake case column names of the statement. ex: ["end_to_end_id", "amount"]
+    """
+
+    def __init__(self, path, types=None):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+        except:
+            self._file.close()
+            raise
+        magic, self._width, self._count, records, self._entries = _header.unpack(self._map[:_header.size])
+        if magic != _magic:
+            self.close()
+            raise ValueError("{path} is not a PixStatement index".format(path=path))
+        self._stride = self._width + _offset.size
+        self.names = loads(self._map[records:self._map.find(b"\n", records)].decode("utf-8"))
+        self._converters = _converters(self.names, types)
+
+    def get(self, id):
+        """# Retrieve the rows of an id
+        ## Parameters (required):
+        - id [string]: end-to-end id or return id. ex: "E79457883202101262140HHX553UPqeq"
+        ## Return:
+        - list of dictionaries mapping each snake case column name to the row value, in statement order. Empty if the id is not in the statement
+        """
+        return [self._record(offset) for offset in self._offsets(id)]
+
+    def __contains__(self, id):
+        return bool(self._offsets(id))
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        """# Close the index file
+        """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _key(self, index):
+        start = self._entries + index * self._stride
+        return self._map[start:start + self._width]
+
+    def _offsets(self, id):
+        key = id.encode("utf-8")
+        if len(key) > self._width:
+            return []
+        key = key.ljust(self._width, b"\x00")
+
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        offsets = []
+        while low < self._count and self._key(low) == key:
+            start = self._entries + low * self._stride + self._width
+            offsets.append(_offset.unpack(self._map[start:start + _offset.size])[0])
+            low += 1
+        return offsets
+
+    def _record(self, offset):
+        values = loads(self._map[offset:self._map.find(b"\n", offset)].decode("utf-8"))
+        return _row(self.names, self._converters, values)
+
+
+def build_index(source, path, keys=("end_to_end_id", "return_id")):
+    """# Build a PixStatement index
+    Read a PixStatement .csv file once and write an index file mapping its end-to-end ids and
+    return ids to the statement rows, which may then be opened with pixstatement.StatementIndex.
+    Keys are sorted in bounded batches on temporary files, so statements of any size can be indexed.
+    ## Parameters (required):
+    - source [string, file object or iterable of bytes]: path of the downloaded file, binary file object or chunks of the file content. ex: "statement.zip"
+    - path [string]: path of the index file to be written. ex: "statement.idx"
+    ## Parameters (optional):
+    - keys [list of strings, default ["end_to_end_id", "return_id"]]: snake case columns to be indexed. Empty values are not indexed. ex: ["end_to_end_id"]
+    ## Return:
+    - number of rows written to the index
+    """
+    temporary = path + ".tmp"
+    runs = []
+    try:
+        with open(temporary, "wb") as file:
+            file.write(_header.pack(_magic, 0, 0, 0, 0))
+            records = file.tell()
+            rows = _read_rows(source)
+            names = next(rows, None) or []
+            file.write(dumps(names).encode("utf-8") + b"\n")
+            columns = [names.index(key) for key in keys if key in names]
+
+            count = 0
+            entries = []
+            for values in rows:
+                offset = file.tell()
+                file.write(dumps(values).encode("utf-8") + b"\n")
+                for column in columns:
+                    if column < len(values) and values[column]:
+                        entries.append((values[column].encode("utf-8"), offset))
+                if len(entries) >= _run_size:
+                    runs.append(_write_run(entries))
+                    entries = []
+                count += 1
+            runs.append(_write_run(entries))
+
+            width = max([width for _, width in runs] + [1])
+            start = file.tell()
+            total = 0
+            for key, offset in merge(*[_read_run(run) for run in runs]):
+                file.write(key.ljust(width, b"\x00") + _offset.pack(offset))
+                total += 1
+
+            file.seek(0)
+            file.write(_header.pack(_magic, width, total, records, start))
+    except:
+        _remove(temporary)
+        raise
+    finally:
+        for run, _ in runs:
+            _remove(run)
+
+    _remove(path)
+    rename(temporary, path)
+    return count
+
+
+def _write_run(entries):
+    entries.sort()
+    descriptor, path = mkstemp(suffix=".run")
+    close(descriptor)
+    width = 0
+    with open(path, "wb") as file:
+        for key, offset in entries:
+            file.write(_run_key.pack(len(key)) + key + _offset.pack(offset))
+            width = max(width, len(key))
+    return path, width
+
+
+def _read_run(run):
+    path, _ = run
+    with open(path, "rb") as file:
+        while True:
+            size = file.read(_run_key.size)
+            if not size:
+                return
+            key = file.read(_run_key.unpack(size)[0])
+            yield key, _offset.unpack(file.read(_offset.size))[0]
+
+
+def _remove(path):
+    if exists(path):
+        remove(path)
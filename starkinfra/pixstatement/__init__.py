@@ -1 +1,4 @@
-from .__pixstatement import create, get, query, page, csv
+from .__pixstatement import create, get, get_many, query, page, csv, csv_stream
+from .__download import download_csv, download_csvs
+from .__reader import read_csv
+from .__index import build_index, StatementIndex
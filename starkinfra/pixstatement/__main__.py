@@ -0,0 +1,39 @@
+from sys import stdout, exit
+from json import dumps
+from argparse import ArgumentParser
+from .__index import build_index, StatementIndex
+
+
+def main(arguments=None):
+    parser = ArgumentParser(prog="python -m starkinfra.pixstatement", description="Index and search PixStatement .csv files")
+    commands = parser.add_subparsers(dest="command")
+
+    index = commands.add_parser("index", help="build an index file from a PixStatement .csv or .zip file")
+    index.add_argument("source", help="path of the PixStatement .csv or .zip file")
+    index.add_argument("path", help="path of the index file to be written")
+    index.add_argument("--key", action="append", dest="keys", help="snake case column to be indexed. Defaults to end_to_end_id and return_id")
+
+    lookup = commands.add_parser("lookup", help="print the rows of end-to-end ids or return ids as JSON lines")
+    lookup.add_argument("path", help="path of the index file")
+    lookup.add_argument("ids", nargs="+", help="end-to-end ids or return ids")
+
+    arguments = parser.parse_args(arguments)
+    if arguments.command == "index":
+        count = build_index(arguments.source, arguments.path, keys=arguments.keys or ("end_to_end_id", "return_id"))
+        stdout.write("{count} rows indexed at {path}\n".format(count=count, path=arguments.path))
+        return 0
+    if arguments.command == "lookup":
+        found = True
+        with StatementIndex(arguments.path) as statement:
+            for id in arguments.ids:
+                rows = statement.get(id)
+                found = found and bool(rows)
+                for row in rows:
+                    stdout.write(dumps(row, default=str) + "\n")
+        return 0 if found else 1
+    parser.print_help()
+    return 2
+
+
+if __name__ == "__main__":
+    exit(main())
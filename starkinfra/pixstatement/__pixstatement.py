@@ -65,12 +65,28 @@ def get(id, user=None):
     return rest.get_id(id=id, resource=_resource, user=user)
 
 
-def query(limit=None, ids=None, user=None):
+def get_many(ids, workers=4, user=None):
+    """# Retrieve several PixStatements
+    Receive the PixStatement objects previously created in the Stark Infra API by their ids. The ids are queried in chunks of 100 sent at the same time
+    ## Parameters (required):
+    - ids [list of strings]: list of object unique ids. ex: ["5656565656565656", "4545454545454545"]
+    ## Parameters (optional):
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - list of PixStatement objects in the same order as the ids, with None in place of the ones not found. Its missing attribute lists the ids not found
+    """
+    return rest.get_many(resource=_resource, ids=ids, workers=workers, user=user)
+
+
+def query(limit=None, ids=None, prefetch=None, compact=False, user=None):
     """# Retrieve PixStatements
     Receive a generator of PixStatement objects previously created in the Stark Infra API
     ## Parameters (optional):
     - limit [integer, default None]: maximum number of objects to be retrieved. Unlimited if None. ex: 35
     - ids [list of strings, default None]: list of ids to filter retrieved objects. ex: ["5656565656565656", "4545454545454545"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of PixStatement objects with updated attributes
@@ -80,6 +96,8 @@ def query(limit=None, ids=None, user=None):
         resource=_resource,
         limit=limit,
         ids=ids,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
@@ -116,3 +134,18 @@ def csv(id, user=None):
     - .zip file containing a PixStatement in .csv format
     """
     return rest.get_content(resource=_resource, id=id, user=user, sub_resource_name="csv")
+
+
+def csv_stream(id, chunk_size=65536, user=None):
+    """# Stream a .csv PixStatement
+    Retrieve a specific PixStatement by its ID in a .csv file, yielding its content in chunks as they arrive
+    instead of keeping the whole file in memory.
+    ## Parameters (required):
+    - id [string]: object unique id. ex: "5656565656565656"
+    ## Parameters (optional):
+    - chunk_size [integer, default 65536]: maximum number of bytes in each chunk. ex: 1048576
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+    ## Return:
+    - generator of bytes chunks of a .zip file containing a PixStatement in .csv format
+    """
+    return rest.get_content_stream(resource=_resource, id=id, user=user, sub_resource_name="csv", chunk_size=chunk_size)
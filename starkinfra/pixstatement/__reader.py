@@ -0,0 +1,129 @@
+from io import RawIOBase, BufferedReader, TextIOWrapper
+from re import compile
+from csv import reader
+from datetime import datetime
+from starkcore.utils.case import camel_to_snake
+from ..utils.unzip import unzip
+
+
+_zip_signature = b"PK\x03\x04"
+_integer_pattern = compile(r"^-?\d+$")
+_datetime_pattern = compile(r"^(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?\+00:00$")
+
+
+def read_csv(source, types=None):
+    """# Read the rows of a PixStatement .csv file
+    Parse a PixStatement .csv file incrementally, keeping only the current row in memory.
+    The source may be the zip archive returned by the API or the .csv file it contains.
+    Columns whose name ends with "amount" or is "fee" are converted to integers and datetime
+    values are converted to datetime.datetime. Empty values are converted to None.
+    ## Parameters (required):
+    - source [string, file object or iterable of bytes]: path of the downloaded file, binary file object or chunks of the file content. ex: starkinfra.pixstatement.csv_stream("5656565656565656")
+    ## Parameters (optional):
+    - types [dictionary of string to function, default None]: functions used to convert the values of each column, by snake case column name. ex: {"amount": int}
+    ## Return:
+    - generator of dictionaries mapping each snake case column name to the row value
+    """
+    rows = _read_rows(source)
+    names = next(rows, None)
+    if names is None:
+        return
+    converters = _converters(names, types)
+    for values in rows:
+        yield _row(names, converters, values)
+
+
+def _read_rows(source):
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            for row in _read_rows(file):
+                yield row
+        return
+
+    if hasattr(source, "read"):
+        file = source
+        source = iter(lambda: file.read(65536), b"")
+
+    chunks = iter(source)
+    first = b""
+    for first in chunks:
+        if first:
+            break
+    chunks = _chain(first, chunks)
+    if first.startswith(_zip_signature):
+        chunks = unzip(chunks)
+
+    text = TextIOWrapper(BufferedReader(_ChunkReader(chunks)), encoding="utf-8-sig", newline="")
+    rows = reader(text)
+    header = next(rows, None)
+    if header is None:
+        return
+    yield [camel_to_snake(name.strip()).replace(" ", "_").lower() for name in header]
+    for values in rows:
+        if values:
+            yield values
+
+
+def _converters(names, types):
+    return [_converter(name, types or {}) for name in names]
+
+
+def _row(names, converters, values):
+    return dict(
+        (name, converter(value) if value != "" else None)
+        for name, converter, value in zip(names, converters, values)
+    )
+
+
+def _converter(name, types):
+    if name in types:
+        return types[name]
+    if name.endswith("amount") or name == "fee":
+        return _integer
+    return _value
+
+
+def _integer(value):
+    if _integer_pattern.match(value):
+        return int(value)
+    return _value(value)
+
+
+def _value(value):
+    match = _datetime_pattern.match(value)
+    if match is None:
+        return value
+    year, month, day, hour, minute, second, fraction = match.groups()
+    return datetime(
+        int(year), int(month), int(day), int(hour), int(minute), int(second),
+        int(fraction.ljust(6, "0")) if fraction else 0,
+    )
+
+
+def _chain(first, chunks):
+    yield first
+    for chunk in chunks:
+        yield chunk
+
+
+class _ChunkReader(RawIOBase):
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = b""
+        self._offset = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while self._offset >= len(self._buffer):
+            self._buffer = next(self._chunks, None)
+            self._offset = 0
+            if self._buffer is None:
+                self._buffer = b""
+                return 0
+        size = min(len(buffer), len(self._buffer) - self._offset)
+        buffer[:size] = self._buffer[self._offset:self._offset + size]
+        self._offset += size
+        return size
@@ -70,7 +70,21 @@ def get(uuid, user=None):
     return rest.get_id(resource=_resource, id=uuid, user=user)
 
 
-def query(limit=None, after=None, before=None, uuids=None, tags=None, user=None):
+def get_many(uuids, workers=4, user=None):
+    """# Retrieve several StaticBrcodes
+    Receive the StaticBrcode objects previously created in the Stark Infra API by their uuids. The uuids are queried in chunks of 100 sent at the same time
+    ## Parameters (required):
+    - uuids [list of strings]: list of object unique uuids. ex: ["97756273400d42ce9086404fe10ea0d6", "e3da0b6d56fa4045b9b295b2be82436e"]
+    ## Parameters (optional):
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
+    ## Return:
+    - list of StaticBrcode objects in the same order as the uuids, with None in place of the ones not found. Its missing attribute lists the uuids not found
+    """
+    return rest.get_many(resource=_resource, ids=uuids, key="uuid", workers=workers, user=user)
+
+
+def query(limit=None, after=None, before=None, uuids=None, tags=None, prefetch=None, compact=False, user=None):
     """# Retrieve StaticBrcodes
     Receive a generator of StaticBrcode objects previously created in the Stark Infra API
     ## Parameters (optional):
@@ -79,6 +93,8 @@ def query(limit=None, after=None, before=None, uuids=None, tags=None, user=None)
     - before [datetime.date or string, default None] date filter for objects created only before specified date. ex: datetime.date(2020, 3, 10)
     - uuids [list of strings, default None]: list of uuids to filter retrieved objects. ex: ["97756273400d42ce9086404fe10ea0d6", "e3da0b6d56fa4045b9b295b2be82436e"]
     - tags [list of strings, default None]: list of tags to filter retrieved objects. ex: ["travel", "food"]
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call
     ## Return:
     - generator of StaticBrcode objects with updated attributes
@@ -90,6 +106,8 @@ def query(limit=None, after=None, before=None, uuids=None, tags=None, user=None)
         before=check_date(before),
         uuids=uuids,
         tags=tags,
+        prefetch=prefetch,
+        compact=compact,
         user=user,
     )
 
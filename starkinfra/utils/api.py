@@ -0,0 +1,120 @@
+from datetime import date, datetime, timedelta
+from starkcore.utils.case import camel_to_snake, snake_to_camel
+from starkcore.utils.subresource import SubResource
+
+
+_fields = {}
+_attributes = {}
+_camels = {}
+
+
+def from_api_json(resource, json):
+    """# Build an object from its API JSON
+    Same as starkcore's from_api_json, but the constructor parameters of each class and the snake case
+    name of each JSON key are worked out only once and kept, instead of on every object.
+    ## Parameters (required):
+    - resource [dictionary]: resource dictionary with the class and name of the object. ex: {"class": PixRequest, "name": "PixRequest"}
+    - json [dictionary]: API JSON of the object. ex: {"amount": 1000, "endToEndId": "E20018183202201201450u34sDGd19lz"}
+    ## Return:
+    - object of the resource class
+    """
+    cls = resource["class"]
+    fields = _fields.get(cls)
+    if fields is None:
+        fields = _fields[cls] = _field_map(cls)
+    defaults, names = fields
+
+    parameters = defaults.copy()
+    for key, value in json.items():
+        name = names.get(key, 0)
+        if name == 0:
+            name = names[key] = _parameter(key, defaults)
+        if name is not None:
+            parameters[name] = value
+    return cls(**parameters)
+
+
+def api_json(entity):
+    """# Convert an object to its API JSON
+    Same as starkcore's api_json, but the public attribute names of each class and the camel case
+    name of each attribute are worked out only once and kept, instead of on every object.
+    ## Parameters (required):
+    - entity [object or dictionary]: object to be converted. ex: starkinfra.PixRequest(...)
+    ## Return:
+    - dictionary with camel case keys and API formatted values, without None values
+    """
+    if isinstance(entity, dict):
+        return cast_json_to_api_format(entity)
+    json = {}
+    for attribute in _public_attributes(entity):
+        value = getattr(entity, attribute)
+        if not callable(value):
+            json[attribute] = value
+    return cast_json_to_api_format(json)
+
+
+def cast_json_to_api_format(json):
+    camels = _camels
+    casted = {}
+    for key, value in json.items():
+        if value is None:
+            continue
+        camel = camels.get(key)
+        if camel is None:
+            camel = camels[key] = snake_to_camel(key)
+        casted[camel] = cast_values(value)
+    return casted
+
+
+def cast_values(value):
+    kind = type(value)
+    if kind is str or kind is int or kind is bool or kind is float:
+        return value
+
+    if kind is datetime:
+        return value.strftime("%Y-%m-%dT%H:%M:%S+00:00")
+
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
+
+    if isinstance(value, timedelta):
+        return int(value.total_seconds())
+
+    if isinstance(value, SubResource):
+        return api_json(value)
+
+    if isinstance(value, dict):
+        return cast_json_to_api_format(value)
+
+    if not isinstance(value, list):
+        return value
+
+    return [cast_values(item) for item in value]
+
+
+def _field_map(cls):
+    parameters = set(cls.__init__.__code__.co_varnames) - {"self"}
+    return dict.fromkeys(parameters), {}
+
+
+def _parameter(key, defaults):
+    name = camel_to_snake(key)
+    return name if name in defaults else None
+
+
+def _public_attributes(entity):
+    cls = entity.__class__
+    instance = getattr(entity, "__dict__", None)
+    if instance is None or "__slots__" in vars(cls):
+        return [attribute for attribute in dir(entity) if not attribute.startswith("_")]
+
+    keys = tuple(instance)
+    cached = _attributes.get(cls)
+    if cached is None or cached[0] != keys:
+        names = set(
+            attribute for attribute in dir(cls)
+            if not attribute.startswith("_") and not callable(getattr(cls, attribute))
+        )
+        names.update(key for key in keys if not key.startswith("_"))
+        cached = _attributes[cls] = (keys, sorted(names))
+    return cached[1]
@@ -1,4 +1,4 @@
-from random import choice
+from os import urandom
 from datetime import datetime
 
 
@@ -6,10 +6,42 @@ _randomSource = [c for c in "abcdefghijklmnopqrstuvwxyz"]
 _randomSource += [c.upper() for c in _randomSource]
 _randomSource += [c for c in "0123456789"]
 
+_randomLength = 11
+# random bytes are mapped to characters by their value modulo 62, discarding the values
+# from 248 on, so every character has the same probability
+_byteTable = bytes(bytearray(ord(_randomSource[value % len(_randomSource)]) for value in range(256)))
+_rejectedBytes = bytes(bytearray(range(256 - 256 % len(_randomSource), 256)))
+
 
 def create(bank_code):
-    return "{bank_code}{date}{randomString}".format(
+    return create_many(bank_code, 1)[0]
+
+
+def create_many(bank_code, n, prefix=""):
+    head = "{prefix}{bank_code}{date}".format(
+        prefix=prefix,
         bank_code=bank_code,
         date=datetime.utcnow().strftime("%Y%m%d%H%M"),
-        randomString=''.join(choice(_randomSource) for _ in range(11)),
     )
+    ids = [head + randomString for randomString in _random_strings(n)]
+    if len(set(ids)) == len(ids):
+        return ids
+
+    unique = set()
+    ids = [id for id in ids if not (id in unique or unique.add(id))]
+    while len(ids) < n:
+        id = head + _random_strings(1)[0]
+        if id not in unique:
+            unique.add(id)
+            ids.append(id)
+    return ids
+
+
+def _random_strings(n):
+    size = n * _randomLength
+    characters = b""
+    while len(characters) < size:
+        missing = size - len(characters)
+        characters += urandom(missing + missing // 30 + 16).translate(_byteTable, _rejectedBytes)
+    characters = characters[:size].decode("ascii")
+    return [characters[index:index + _randomLength] for index in range(0, size, _randomLength)]
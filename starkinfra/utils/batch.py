@@ -0,0 +1,96 @@
+from threading import Thread, Lock
+from .compatibility import Queue, Empty
+
+
+class Batch(list):
+    """# Batch object
+    List of the objects retrieved by a get_many function, in the same order as the requested ids,
+    with None in place of each id that was not found in the Stark Infra API.
+    ## Attributes:
+    - missing [list of strings]: requested ids that were not found, in input order. ex: ["5656565656565656"]
+    """
+
+    def __init__(self, entities, missing):
+        list.__init__(self, entities)
+        self.missing = missing
+
+    def __repr__(self):
+        return "Batch({entities}, missing={missing})".format(
+            entities=list.__repr__(self),
+            missing=self.missing,
+        )
+
+
+def get_many(ids, fetch, key="id", chunk_size=100, workers=4):
+    """# Retrieve objects by their ids in concurrent chunks
+    Split the ids into chunks the API accepts in a single query and fetch them on a pool of background threads.
+    ## Parameters (required):
+    - ids [list of strings]: ids of the objects to be retrieved. Repeated ids are only requested once. ex: ["5656565656565656", "4545454545454545"]
+    - fetch [function]: function that receives a list of ids and returns the objects found
+    ## Parameters (optional):
+    - key [string, default "id"]: attribute holding the id of each object. ex: "uuid"
+    - chunk_size [integer, default 100]: maximum number of ids sent in each request. ex: 100
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    ## Return:
+    - Batch list of objects in the order of the ids, with None in place of the ids that were not found
+    """
+    unique = _unique(ids)
+    chunks = Queue()
+    for chunk in _chunks(unique, chunk_size):
+        chunks.put(chunk)
+    found = {}
+    errors = []
+    lock = Lock()
+
+    threads = [
+        Thread(target=_drain, args=(chunks, fetch, key, found, errors, lock))
+        for _ in range(min(workers, chunks.qsize()))
+    ]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+    return _result(ids, unique, found)
+
+
+def _drain(chunks, fetch, key, found, errors, lock):
+    while not errors:
+        try:
+            chunk = chunks.get_nowait()
+        except Empty:
+            return
+        try:
+            entities = fetch(chunk)
+        except Exception as exception:
+            with lock:
+                errors.append(exception)
+            return
+        with lock:
+            for entity in entities:
+                found[getattr(entity, key)] = entity
+
+
+def _unique(ids):
+    unique = []
+    seen = set()
+    for id in ids:
+        if id not in seen:
+            seen.add(id)
+            unique.append(id)
+    return unique
+
+
+def _chunks(ids, size):
+    return [ids[start:start + size] for start in range(0, len(ids), size)]
+
+
+def _result(ids, unique, found):
+    return Batch(
+        entities=[found.get(id) for id in ids],
+        missing=[id for id in unique if id not in found],
+    )
@@ -0,0 +1,104 @@
+from re import compile
+from threading import Thread, Lock
+from starkcore.error import InputErrors
+from .compatibility import Queue, Empty
+
+
+_element_pattern = compile(r"^Element (\d+)")
+
+
+class Result:
+    """# Bulk Result object
+    The Result object gathers the outcome of a bulk creation, mapping every input element
+    to either the object created in the Stark Infra API or the errors that prevented its creation.
+    ## Attributes:
+    - created [dictionary of integer to object]: created objects by their index in the input list. ex: {0: PixRequest[5656565656565656]}
+    - errors [dictionary of integer to list of exceptions]: errors by the index of the failed element in the input list. Elements of a chunk whose request failed for any other reason get that exception. ex: {1: [Error(invalidAmount)]}
+    """
+
+    def __init__(self):
+        self.created = {}
+        self.errors = {}
+
+    def __repr__(self):
+        return "Result(created={created}, errors={errors})".format(
+            created=len(self.created),
+            errors=len(self.errors),
+        )
+
+
+def create(module, entities, chunk_size=100, workers=4, **kwargs):
+    """# Create objects in concurrent chunks
+    Split a list of objects into chunks the API accepts in a single request and send them to the
+    module's create function on a pool of background threads.
+    When the API rejects some elements of a chunk, the remaining elements of that chunk are sent again,
+    so a single invalid element does not prevent the creation of the others.
+    ## Parameters (required):
+    - module [module]: SDK module with a create function that receives a list of objects. ex: starkinfra.pixrequest
+    - entities [list of objects]: objects to be created in the API. ex: [PixRequest(...), PixRequest(...)]
+    ## Parameters (optional):
+    - chunk_size [integer, default 100]: maximum number of objects sent in each request. ex: 100
+    - workers [integer, default 4]: number of requests sent at the same time. ex: 8
+    - kwargs [keyword arguments]: any other parameter accepted by the module's create function. ex: user=project
+    ## Return:
+    - bulk Result object with the created objects and the errors mapped to their input indexes
+    """
+    result = Result()
+    chunks = Queue()
+    for start in range(0, len(entities), chunk_size):
+        chunks.put(list(range(start, min(start + chunk_size, len(entities)))))
+    lock = Lock()
+
+    threads = [
+        Thread(target=_drain, args=(module, entities, chunks, result, lock, kwargs))
+        for _ in range(min(workers, chunks.qsize()))
+    ]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return result
+
+
+def _drain(module, entities, chunks, result, lock, kwargs):
+    while True:
+        try:
+            indexes = chunks.get_nowait()
+        except Empty:
+            return
+        created, errors = _create_chunk(module, entities, indexes, kwargs)
+        with lock:
+            result.created.update(created)
+            result.errors.update(errors)
+
+
+def _create_chunk(module, entities, indexes, kwargs):
+    errors = {}
+    while indexes:
+        try:
+            created = module.create([entities[index] for index in indexes], **kwargs)
+        except InputErrors as exception:
+            rejected = _map_errors(exception.errors, indexes)
+            if not rejected:
+                errors.update((index, exception.errors) for index in indexes)
+                return {}, errors
+            errors.update(rejected)
+            indexes = [index for index in indexes if index not in rejected]
+            continue
+        except Exception as exception:
+            errors.update((index, [exception]) for index in indexes)
+            return {}, errors
+        return dict(zip(indexes, created)), errors
+    return {}, errors
+
+
+def _map_errors(errors, indexes):
+    rejected = {}
+    for error in errors:
+        match = _element_pattern.match(error.message or "")
+        if not match or int(match.group(1)) >= len(indexes):
+            return {}
+        rejected.setdefault(indexes[int(match.group(1))], []).append(error)
+    return rejected
@@ -0,0 +1,188 @@
+from time import time
+from json import dumps, loads
+from sqlite3 import connect
+from threading import Lock
+from collections import OrderedDict
+
+
+_logs = [
+    "CreditNoteLog", "IndividualDocumentLog", "IndividualIdentityLog", "IssuingCardLog", "IssuingHolderLog",
+    "IssuingInvoiceLog", "IssuingPurchaseLog", "PixChargebackLog", "PixClaimLog", "PixInfractionLog",
+    "PixKeyLog", "PixRequestLog", "PixReversalLog",
+]
+_default_rules = dict([(name, True) for name in _logs] + [
+    ("PixRequest", ["success", "failed"]),
+    ("PixReversal", ["success", "failed"]),
+    ("PixStatement", ["success", "failed"]),
+    ("IssuingTransaction", True),
+    ("EventAttempt", True),
+])
+
+
+class Cache:
+    """# Cache object
+    The Cache keeps the objects retrieved by the get functions, so objects that can no longer change,
+    such as logs or PixRequests in a final status, are not fetched again from the Stark Infra API.
+    Set it at starkinfra.cache to enable it. Only the resources listed in rules are cached, and only
+    while they are in one of the listed statuses. Entries are kept per user and expire after their ttl.
+    ## Parameters (optional):
+    - backend [MemoryBackend or DiskBackend object, default MemoryBackend()]: storage of the cached objects. Any object with get(key), set(key, value, ttl) and clear() methods may be used
+    - ttl [integer, default 86400]: number of seconds an object is kept. ex: 3600
+    - ttls [dictionary of string to integer, default None]: number of seconds an object is kept by resource name, overriding ttl. ex: {"PixRequest": 600}
+    - rules [dictionary of string to list of strings or True, default None]: statuses in which each resource can be cached by resource name, or True to cache it in any status. Defaults to logs, EventAttempts, IssuingTransactions and PixRequests, PixReversals and PixStatements in a final status. ex: {"PixRequest": ["success", "failed"], "PixRequestLog": True}
+    ## Attributes (return-only):
+    - hits [integer]: number of objects retrieved from the cache. ex: 1500
+    - misses [integer]: number of cacheable objects fetched from the API because they were not in the cache. ex: 120
+    - skipped [integer]: number of fetched objects that were not cached because of their status. ex: 15
+    """
+
+    def __init__(self, backend=None, ttl=86400, ttls=None, rules=None):
+        self.backend = backend or MemoryBackend()
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.rules = _default_rules if rules is None else rules
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self._lock = Lock()
+
+    def get(self, resource, id, user):
+        name = resource["name"]
+        if name not in self.rules:
+            return None
+        value = self.backend.get(_key(name, id, user))
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return loads(value)
+
+    def set(self, resource, id, user, json):
+        name = resource["name"]
+        statuses = self.rules.get(name)
+        if not statuses:
+            return
+        if statuses is not True and json.get("status") not in statuses:
+            with self._lock:
+                self.skipped += 1
+            return
+        self.backend.set(_key(name, id, user), dumps(json), self.ttls.get(name, self.ttl))
+
+    def clear(self):
+        """# Clear the cache
+        Remove all cached objects and reset the hits, misses and skipped counters.
+        """
+        self.backend.clear()
+        with self._lock:
+            self.hits = self.misses = self.skipped = 0
+
+
+class MemoryBackend:
+    """# MemoryBackend object
+    Keeps the cached objects in the process memory, discarding the least recently used ones once max_size is reached.
+    ## Parameters (optional):
+    - max_size [integer, default 10000]: maximum number of cached objects. ex: 50000
+    ## Attributes (return-only):
+    - evictions [integer]: number of objects discarded to respect max_size. ex: 30
+    """
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            del self._entries[key]
+            value, expiration = entry
+            if expiration < time():
+                return None
+            self._entries[key] = entry
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, time() + ttl)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskBackend:
+    """# DiskBackend object
+    Keeps the cached objects in a SQLite file, so they survive restarts and may be shared by several processes.
+    The least recently used objects are discarded once max_size is reached.
+    ## Parameters (required):
+    - path [string]: path of the cache file. ex: "starkinfra-cache.db"
+    ## Parameters (optional):
+    - max_size [integer, default 100000]: maximum number of cached objects. ex: 1000000
+    ## Attributes (return-only):
+    - evictions [integer]: number of objects discarded to respect max_size. ex: 30
+    """
+
+    def __init__(self, path, max_size=100000):
+        self.path = path
+        self.max_size = max_size
+        self.evictions = 0
+        self._lock = Lock()
+        self._connection = connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT, expiration REAL, used REAL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries (used)")
+
+    def get(self, key):
+        now = time()
+        with self._lock, self._connection:
+            row = self._connection.execute("SELECT value, expiration FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            value, expiration = row
+            if expiration < now:
+                self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            self._connection.execute("UPDATE entries SET used = ? WHERE key = ?", (now, key))
+            return value
+
+    def set(self, key, value, ttl):
+        now = time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, expiration, used) VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl, now),
+            )
+            size = self._connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            if size > self.max_size:
+                self._connection.execute(
+                    "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY used LIMIT ?)",
+                    (size - self.max_size,),
+                )
+                self.evictions += size - self.max_size
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries")
+
+    def close(self):
+        self._connection.close()
+
+
+def _key(name, id, user):
+    return "{name}/{id}/{environment}/{user}/{workspace}".format(
+        name=name,
+        id=id,
+        environment=getattr(user, "environment", None),
+        user=getattr(user, "id", None),
+        workspace=getattr(user, "workspace_id", None),
+    )
@@ -0,0 +1,166 @@
+from os.path import exists, getmtime
+from re import compile
+from time import time
+from json import dump, load
+from bisect import bisect_left
+from threading import Lock
+from .api import from_api_json
+from .compatibility import replace
+from . import rest
+
+
+_word_pattern = compile(r"\w+")
+
+
+class Catalog:
+    """# Catalog object
+    The Catalog keeps the whole list of a reference resource, such as MerchantCategories, MerchantCountries
+    and CardMethods, in memory, indexed by each field for instant lookups and prefix searches.
+    It is loaded from the Stark Infra API on first use and loaded again once refresh_interval seconds have passed.
+    If a path is informed, the list is also saved to that file, which is used instead of the API while it
+    is recent enough, and as a fallback if the API cannot be reached.
+    The objects returned are copies, so they may be freely modified.
+    ## Parameters (required):
+    - resource [dictionary]: resource dictionary with the class and name of the objects. ex: {"class": MerchantCountry, "name": "MerchantCountry"}
+    - fields [list of strings]: snake case attributes to be indexed. ex: ["code", "name", "number"]
+    ## Parameters (optional):
+    - path [string, default None]: path of the snapshot file. ex: "merchant-categories.json"
+    - refresh_interval [integer, default 86400]: number of seconds after which the catalog is loaded again. ex: 3600
+    - user [Organization/Project object, default None]: Organization or Project object used to load the catalog. Not necessary if starkinfra.user was set before the first lookup.
+    """
+
+    def __init__(self, resource, fields, path=None, refresh_interval=86400, user=None):
+        self.resource = resource
+        self.fields = fields
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.user = user
+        self._lock = Lock()
+        self._state = None
+
+    def get(self, code):
+        """# Retrieve an object by its code
+        ## Parameters (required):
+        - code [string]: object code. ex: "BRA"
+        ## Return:
+        - copy of the object with the given code, or None if there is none
+        """
+        state = self._current()
+        indexes = state.indexes["code"].get(code)
+        return _copy(state.entities[indexes[0]]) if indexes else None
+
+    def filter(self, **fields):
+        """# Retrieve objects by their field values
+        ## Parameters (required):
+        - fields [keyword arguments]: indexed fields and their exact values. ex: type="food"
+        ## Return:
+        - list of copies of the objects with all the given values, in catalog order
+        """
+        state = self._current()
+        selected = None
+        for field, value in fields.items():
+            indexes = set(state.indexes[field].get(value, ()))
+            selected = indexes if selected is None else selected & indexes
+        if selected is None:
+            selected = range(len(state.entities))
+        return [_copy(state.entities[index]) for index in sorted(selected)]
+
+    def search(self, keyword):
+        """# Search objects by keyword
+        Match the objects whose indexed fields contain a word starting with the keyword, ignoring case,
+        in the same way as the search parameter of the query functions.
+        ## Parameters (required):
+        - keyword [string]: beginning of a word of any indexed field. ex: "fast"
+        ## Return:
+        - list of copies of the matching objects, in catalog order
+        """
+        state = self._current()
+        keyword = keyword.lower()
+        words = state.words
+        selected = set()
+        position = bisect_left(words, (keyword, -1))
+        while position < len(words) and words[position][0].startswith(keyword):
+            selected.add(words[position][1])
+            position += 1
+        return [_copy(state.entities[index]) for index in sorted(selected)]
+
+    def load(self, user=None):
+        """# Load the catalog from the Stark Infra API
+        Load the catalog immediately, also saving the snapshot file if a path was informed.
+        ## Parameters (optional):
+        - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
+        ## Return:
+        - number of objects in the catalog
+        """
+        with self._lock:
+            self._state = self._fetch(user=user)
+            return len(self._state.entities)
+
+    def __len__(self):
+        return len(self._current().entities)
+
+    def __iter__(self):
+        return iter(self.filter())
+
+    def _current(self):
+        state = self._state
+        if state is not None and time() - state.loaded < self.refresh_interval:
+            return state
+        with self._lock:
+            state = self._state
+            if state is not None and time() - state.loaded < self.refresh_interval:
+                return state
+            if self.path and exists(self.path) and time() - getmtime(self.path) < self.refresh_interval:
+                self._state = self._read(loaded=getmtime(self.path))
+                return self._state
+            try:
+                self._state = self._fetch(user=self.user)
+            except Exception:
+                if state is None:
+                    if not (self.path and exists(self.path)):
+                        raise
+                    state = self._read(loaded=time())
+                state.loaded = time()
+                self._state = state
+            return self._state
+
+    def _fetch(self, user=None):
+        raw = []
+        for page in rest.get_json_pages(resource=self.resource, user=user or self.user):
+            raw.extend(page)
+        if self.path:
+            temporary = self.path + ".tmp"
+            with open(temporary, "w") as file:
+                dump(raw, file)
+            replace(temporary, self.path)
+        return _State(resource=self.resource, fields=self.fields, raw=raw, loaded=time())
+
+    def _read(self, loaded):
+        with open(self.path) as file:
+            raw = load(file)
+        return _State(resource=self.resource, fields=self.fields, raw=raw, loaded=loaded)
+
+
+class _State:
+
+    def __init__(self, resource, fields, raw, loaded):
+        self.loaded = loaded
+        self.entities = [from_api_json(resource, json) for json in raw]
+        self.indexes = dict((field, {}) for field in set(fields) | {"code"})
+        words = set()
+        for index, entity in enumerate(self.entities):
+            for field, index_by_value in self.indexes.items():
+                value = getattr(entity, field, None)
+                if value is None:
+                    continue
+                index_by_value.setdefault(value, []).append(index)
+                if field in fields:
+                    words.add((str(value).lower(), index))
+                    words.update((word, index) for word in _word_pattern.findall(str(value).lower()))
+        self.words = sorted(words)
+
+
+def _copy(entity):
+    copy = entity.__class__.__new__(entity.__class__)
+    copy.__dict__.update(entity.__dict__)
+    return copy
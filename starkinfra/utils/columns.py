@@ -0,0 +1,219 @@
+from re import compile
+from array import array
+from starkcore.utils.case import camel_to_snake, snake_to_camel
+from starkcore.utils.checks import check_datetime
+from .relay import redirect_relay, set_transport
+from .prefetch import prefetch as _prefetch
+from . import rest
+
+
+_datetime_pattern = compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+
+
+class Categorical:
+    """# Categorical column
+    Column of repeated strings stored as integer codes into a list of categories.
+    Use pandas.Categorical.from_codes(column.codes, column.categories) to build a dataframe column.
+    ## Attributes:
+    - codes [array.array of integers]: index of each value in categories, or -1 for None. ex: array("i", [0, 1, 0])
+    - categories [list of strings]: distinct values in order of appearance. ex: ["success", "failed"]
+    """
+
+    def __init__(self, codes, categories):
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        categories = self.categories
+        return (categories[code] if code >= 0 else None for code in self.codes)
+
+    def __repr__(self):
+        return "Categorical({values})".format(values=list(self))
+
+
+def query(module, fields=None, categorical=("status",), **filters):
+    """# Retrieve objects as columns
+    Stream the pages returned by the module's query function directly into column-oriented batches,
+    without building a resource object for each element.
+    Integer and float fields become array.array columns, datetime strings become lists of datetime.datetime,
+    the categorical fields become Categorical columns and any other field becomes a list.
+    ## Parameters (required):
+    - module [module]: SDK module with a query function. ex: starkinfra.pixrequest
+    ## Parameters (optional):
+    - fields [list of strings, default None]: snake case attributes to be retrieved. Defaults to all attributes of the first element. ex: ["id", "amount", "status", "created"]
+    - categorical [list of strings, default ["status"]]: attributes stored as Categorical columns. ex: ["status", "flow"]
+    - filters [keyword arguments]: any other parameter accepted by the module's query function. ex: after="2022-01-01", limit=1000, prefetch=2
+    ## Return:
+    - generator of dictionaries mapping each field to the column of one page. ex: {"amount": array("q", [1000, 2000])}
+    """
+    with redirect_relay(_relay):
+        pages = module.query(**filters)
+
+    columns = None
+    for entities in pages:
+        if not entities:
+            continue
+        if columns is None:
+            keys = list(entities[0]) if fields is None else [snake_to_camel(field) for field in fields]
+            columns = [_Column(name=camel_to_snake(key), key=key, categorical=camel_to_snake(key) in categorical) for key in keys]
+        yield dict((column.name, column.build(entities)) for column in columns)
+
+
+def to_columns(module, fields=None, categorical=("status",), **filters):
+    """# Retrieve all objects as columns
+    Same as query, but all pages are gathered in a single dictionary of columns.
+    ## Parameters (required):
+    - module [module]: SDK module with a query function. ex: starkinfra.pixrequest
+    ## Parameters (optional):
+    - fields [list of strings, default None]: snake case attributes to be retrieved. Defaults to all attributes of the first element. ex: ["id", "amount", "status", "created"]
+    - categorical [list of strings, default ["status"]]: attributes stored as Categorical columns. ex: ["status", "flow"]
+    - filters [keyword arguments]: any other parameter accepted by the module's query function. ex: after="2022-01-01", limit=1000, prefetch=2
+    ## Return:
+    - dictionary mapping each field to its column. ex: {"amount": array("q", [1000, 2000, 1500])}
+    """
+    merged = {}
+    for batch in query(module, fields=fields, categorical=categorical, **filters):
+        for name, column in batch.items():
+            merged[name] = _concatenate(merged[name], column) if name in merged else column
+    return merged
+
+
+def write(module, path, format="parquet", fields=None, **filters):
+    """# Write objects to a columnar file
+    Stream the pages returned by the module's query function into an Apache Parquet or Arrow IPC file,
+    writing one record batch per page so memory usage does not grow with the number of objects.
+    Requires the pyarrow package.
+    ## Parameters (required):
+    - module [module]: SDK module with a query function. ex: starkinfra.pixrequest
+    - path [string]: path of the file to be written. ex: "requests.parquet"
+    ## Parameters (optional):
+    - format [string, default "parquet"]: file format. Options: "parquet", "arrow"
+    - fields [list of strings, default None]: snake case attributes to be retrieved. Defaults to all attributes of the first element. ex: ["id", "amount", "status", "created"]
+    - filters [keyword arguments]: any other parameter accepted by the module's query function. ex: after="2022-01-01", limit=1000, prefetch=2
+    ## Return:
+    - number of objects written
+    """
+    try:
+        import pyarrow
+        from pyarrow import parquet, ipc
+    except ImportError:
+        raise ImportError("pyarrow is required to write columnar files. Install it with: pip install pyarrow")
+    if format not in ("parquet", "arrow"):
+        raise ValueError("format must be either \"parquet\" or \"arrow\"")
+
+    writer = None
+    schema = None
+    count = 0
+    try:
+        for batch in query(module, fields=fields, categorical=(), **filters):
+            arrays = [pyarrow.array(column) for column in batch.values()]
+            if schema is None:
+                schema = pyarrow.schema([
+                    pyarrow.field(name, array.type if not pyarrow.types.is_null(array.type) else pyarrow.string())
+                    for name, array in zip(batch, arrays)
+                ])
+                writer = parquet.ParquetWriter(path, schema) if format == "parquet" else ipc.new_file(path, schema)
+            record_batch = pyarrow.RecordBatch.from_arrays(
+                [array.cast(field.type) for array, field in zip(arrays, schema)],
+                schema=schema,
+            )
+            if format == "parquet":
+                writer.write_table(pyarrow.Table.from_batches([record_batch]))
+            else:
+                writer.write_batch(record_batch)
+            count += record_batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+class _Column:
+
+    def __init__(self, name, key, categorical):
+        self.name = name
+        self.key = key
+        self.kind = "categorical" if categorical else None
+        self.categories = []
+        self.indexes = {}
+
+    def build(self, entities):
+        key = self.key
+        values = [entity.get(key) for entity in entities]
+        if self.kind is None:
+            self.kind = _kind(values)
+        if self.kind is None:
+            return values
+        if self.kind == "categorical":
+            return Categorical(codes=array("i", [self._code(value) for value in values]), categories=self.categories)
+        if self.kind == "datetime":
+            return [check_datetime(value) for value in values]
+        if self.kind in ("q", "d"):
+            try:
+                return array(self.kind, values)
+            except TypeError:
+                self.kind = "list"
+        return values
+
+    def _code(self, value):
+        if value is None:
+            return -1
+        code = self.indexes.get(value)
+        if code is None:
+            code = self.indexes[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+
+def _kind(values):
+    kinds = set()
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            return "list"
+        if isinstance(value, int):
+            kinds.add("q")
+        elif isinstance(value, float):
+            kinds.add("d")
+        elif isinstance(value, str) and _datetime_pattern.match(value):
+            kinds.add("datetime")
+        else:
+            return "list"
+    if kinds == {"q"}:
+        return "q"
+    if kinds in ({"d"}, {"q", "d"}):
+        return "d"
+    if kinds == {"datetime"}:
+        return "datetime"
+    if not kinds:
+        return None
+    return "list"
+
+
+def _concatenate(left, right):
+    if isinstance(left, Categorical) and isinstance(right, Categorical) and left.categories is right.categories:
+        left.codes.extend(right.codes)
+        return left
+    if isinstance(left, array) and isinstance(right, array) and left.typecode == right.typecode:
+        left.extend(right)
+        return left
+    if not isinstance(left, list):
+        left = list(left)
+    left.extend(right)
+    return left
+
+
+def _relay(func, *args, **kwargs):
+    set_transport(kwargs)
+    if func is not rest._get_stream:
+        return func(*args, **kwargs)
+    kwargs.pop("compact", None)
+    prefetch = kwargs.pop("prefetch", None)
+    pages = rest._get_json_pages(*args, **kwargs)
+    if prefetch:
+        pages = _prefetch(pages, size=prefetch)
+    return pages
@@ -0,0 +1,68 @@
+from threading import Lock
+
+
+_classes = {}
+_lock = Lock()
+_excluded = {"__dict__", "__weakref__", "__slots__", "__init__", "__module__", "__qualname__", "__doc__"}
+
+
+def compact(resource):
+    """# Retrieve the compact counterpart of a resource
+    The compact class has the same name, constructor, properties and methods as the resource class,
+    but stores its attributes in __slots__ instead of a per-instance __dict__, which considerably
+    reduces the memory used by each object.
+    The slots are the constructor parameters of the class and its bases, plus the names listed in
+    their _slots attribute. Any other attribute set by the constructor is kept in a __dict__ created
+    on first use.
+    Compact objects are not instances of the resource class and cannot be pickled.
+    On Python 2, whose resource classes are old-style, the resource is returned unchanged.
+    ## Parameters (required):
+    - resource [dictionary]: resource dictionary with the class and name of the objects. ex: {"class": PixRequest, "name": "PixRequest"}
+    ## Return:
+    - resource dictionary whose class builds compact objects
+    """
+    if not isinstance(resource["class"], type):
+        # the old-style classes of Python 2 call their base constructors unbound, which requires instances of the class
+        return resource
+    cls = _classes.get(resource["class"])
+    if cls is None:
+        with _lock:
+            cls = _classes.get(resource["class"])
+            if cls is None:
+                cls = _classes[resource["class"]] = _compact_class(resource["class"])
+    return {"class": cls, "name": resource["name"]}
+
+
+def _compact_class(cls):
+    namespace = {}
+    for base in reversed(cls.__mro__[:-1]):
+        namespace.update((key, value) for key, value in vars(base).items() if key not in _excluded)
+    attributes = _attributes(cls, namespace)
+    namespace.update({
+        "__slots__": attributes + ("__dict__",),
+        "__init__": cls.__init__,
+        "__dir__": _dir,
+        "__module__": cls.__module__,
+        "__doc__": cls.__doc__,
+    })
+    return type(cls.__name__, (object,), namespace)
+
+
+def _attributes(cls, namespace):
+    attributes = []
+    for base in reversed(cls.__mro__[:-1]):
+        init = vars(base).get("__init__")
+        code = getattr(init, "__code__", None)
+        parameters = code.co_varnames[1:code.co_argcount + getattr(code, "co_kwonlyargcount", 0)] if code else ()
+        for attribute in tuple(parameters) + tuple(vars(base).get("_slots", ())):
+            if attribute not in namespace and attribute not in attributes:
+                attributes.append(attribute)
+    return tuple(attributes)
+
+
+def _dir(entity):
+    cls = type(entity)
+    return sorted(
+        name for name in set(dir(cls)) | set(entity.__dict__)
+        if name not in cls.__slots__ or hasattr(entity, name)
+    )
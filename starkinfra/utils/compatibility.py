@@ -0,0 +1,17 @@
+from sys import version_info as pyVersion
+
+
+if pyVersion.major == 3:
+    from queue import Queue, Full, Empty
+    from urllib.parse import urlsplit
+    from http.client import HTTPConnection, HTTPSConnection, BadStatusLine, HTTPException, IncompleteRead
+    from time import monotonic
+    from os import replace
+    ConnectionResetError = ConnectionError
+if pyVersion.major == 2:
+    from socket import error as ConnectionResetError
+    from time import time as monotonic
+    from os import rename as replace
+    from Queue import Queue, Full, Empty
+    from urlparse import urlsplit
+    from httplib import HTTPConnection, HTTPSConnection, BadStatusLine, HTTPException, IncompleteRead
@@ -0,0 +1,86 @@
+from ellipticcurve.math import Math
+from ellipticcurve.point import Point
+
+
+_window_bits = 4
+
+
+def _multiply(table, scalar, x, y, z, curve):
+    P = curve.P
+    mask = len(table[0])
+    bits = mask.bit_length()
+    window = 0
+    while scalar:
+        digit = scalar & mask
+        if digit:
+            px, py = table[window][digit - 1]
+            if z == 0:
+                x, y, z = px, py, 1
+            else:
+                z2 = (z * z) % P
+                u2 = (px * z2) % P
+                s2 = (py * z2 * z) % P
+                if x == u2:
+                    if y != s2:
+                        x, y, z = 0, 0, 0
+                    else:
+                        doubled = Math._jacobianDouble(Point(x, y, z), curve.A, P)
+                        x, y, z = doubled.x, doubled.y, doubled.z
+                else:
+                    h = (u2 - x) % P
+                    r = (s2 - y) % P
+                    h2 = (h * h) % P
+                    h3 = (h * h2) % P
+                    u1h2 = (x * h2) % P
+                    nx = (r * r - h3 - 2 * u1h2) % P
+                    y = (r * (u1h2 - nx) - y * h3) % P
+                    x = nx
+                    z = (h * z) % P
+        scalar >>= bits
+        window += 1
+    return x, y, z
+
+
+def _generator_table(curve, bits=_window_bits):
+    name = "_starkinfraGeneratorTable{bits}_".format(bits=bits)
+    table = getattr(curve, name, None)
+    if table is None:
+        table = _table(curve, curve.G, bits=bits)
+        setattr(curve, name, table)
+    return table
+
+
+def _table(curve, point, bits=_window_bits):
+    A, P = curve.A, curve.P
+    mask = (1 << bits) - 1
+    windows = (curve.nBitLength + bits - 1) // bits
+    points = []
+    base = Point(point.x, point.y, 1)
+    for _ in range(windows):
+        current = base
+        points.append(current)
+        for _ in range(mask - 1):
+            current = Math._jacobianAdd(current, base, A, P)
+            points.append(current)
+        base = Math._jacobianAdd(current, base, A, P)
+
+    affine = _to_affine(points, P)
+    return [affine[index:index + mask] for index in range(0, len(affine), mask)]
+
+
+def _to_affine(points, P):
+    products = []
+    accumulated = 1
+    for point in points:
+        accumulated = (accumulated * point.z) % P
+        products.append(accumulated)
+
+    inverse = Math.inv(accumulated, P)
+    affine = [None] * len(points)
+    for index in range(len(points) - 1, -1, -1):
+        point = points[index]
+        z_inverse = (inverse * products[index - 1]) % P if index else inverse
+        inverse = (inverse * point.z) % P
+        z2 = (z_inverse * z_inverse) % P
+        affine[index] = ((point.x * z2) % P, (point.y * z2 * z_inverse) % P)
+    return affine
@@ -1,4 +1,4 @@
-from .bacenid import create as _create_bacen_id
+from .bacenid import create as _create_bacen_id, create_many as _create_bacen_ids
 
 
 def create(bank_code):
@@ -10,3 +10,15 @@ def create(bank_code):
     - Random endToEndId based on your bank code.
     """
     return "E" + _create_bacen_id(bank_code)
+
+
+def create_many(bank_code, n):
+    """
+    Generates n random end-to-end-ids based on your bank code (ISPB) at once, all unique
+    ## Parameters (required):
+    - bank_code [string]: Your bank code (ISPB). ex: "20018183"
+    - n [integer]: number of ids to be generated. ex: 100000
+    ## Return:
+    - list of random endToEndIds based on your bank code.
+    """
+    return _create_bacen_ids(bank_code, n, prefix="E")
@@ -0,0 +1,162 @@
+from json import loads
+from threading import Lock, Thread
+from ssl import create_default_context
+from asyncio import new_event_loop, run_coroutine_threadsafe
+from .transport import Transport, Response
+from .compatibility import urlsplit
+
+
+class Http2Transport(Transport):
+    """# Http2Transport object
+    The Http2Transport sends the requests to the Stark Infra API through HTTP/2 connections, which carry
+    many concurrent requests at once as multiplexed streams. A multi-threaded application can then keep
+    dozens of get, create and query calls in flight over a single TLS connection to each host,
+    instead of one HTTP/1.1 connection per request in flight.
+    The connections are kept by an httpcore pool driven by an asyncio event loop on a background thread
+    shared by all calling threads. It requires the httpx package with HTTP/2 support: pip install httpx[http2]
+    Set it at starkinfra.transport to use it on all requests.
+    ## Parameters (optional):
+    - max_connections [integer, default 10]: maximum number of simultaneous connections per host. New connections are only opened when the open ones have no free streams. ex: 2
+    - idle_timeout [float, default 30]: number of seconds an idle connection is kept open for reuse. ex: 30
+    - context [ssl.SSLContext, default None]: SSL context used to open HTTPS connections. Defaults to ssl.create_default_context(), created on the first request
+    ## Attributes (return-only):
+    - requests [integer]: number of requests sent by this transport. ex: 1500
+    - multiplexed [integer]: number of responses received over HTTP/2. ex: 1500
+    """
+
+    def __init__(self, max_connections=10, idle_timeout=30, context=None):
+        try:
+            import h2
+            import httpcore
+        except ImportError:
+            raise ImportError("httpx and h2 are required to use HTTP/2. Install them with: pip install httpx[http2]")
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.requests = 0
+        self.multiplexed = 0
+        self._context = context
+        self._httpcore = httpcore
+        self._pool = None
+        self._loop = None
+        self._thread = None
+        self._lock = Lock()
+
+    def request(self, method, url, body=None, headers=None, timeout=None):
+        return self._run(self._request(method, url, body, headers, timeout))
+
+    def stream(self, method, url, body=None, headers=None, timeout=None):
+        """# Send a request and stream its response
+        The response content is read in chunks with iterate(chunk_size). The stream is released
+        when the content is read to the end or when close() is called.
+        """
+        return _StreamResponse(self._run(self._send(method, url, body, headers, timeout)), self._run)
+
+    def close(self):
+        with self._lock:
+            loop, pool, thread = self._loop, self._pool, self._thread
+            self._loop = self._pool = self._thread = None
+        if loop is None:
+            return
+        run_coroutine_threadsafe(pool.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def _run(self, coroutine):
+        return run_coroutine_threadsafe(coroutine, self._start()).result()
+
+    def _start(self):
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    self._pool = self._httpcore.AsyncConnectionPool(
+                        http2=True,
+                        ssl_context=self._context or create_default_context(),
+                        max_connections=self.max_connections,
+                        keepalive_expiry=self.idle_timeout,
+                    )
+                    loop = new_event_loop()
+                    self._thread = Thread(target=loop.run_forever)
+                    self._thread.daemon = True
+                    self._thread.start()
+                    self._loop = loop
+        return self._loop
+
+    async def _request(self, method, url, body, headers, timeout):
+        response = await self._send(method, url, body, headers, timeout)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        return Response(
+            status=response.status,
+            content=content,
+            headers=_headers(response),
+        )
+
+    async def _send(self, method, url, body, headers, timeout):
+        headers = dict(headers or {})
+        headers["Host"] = urlsplit(url).netloc
+        if body:
+            headers["Content-Length"] = str(len(body))
+        request = self._httpcore.Request(
+            method=method,
+            url=url,
+            headers=headers,
+            content=body or None,
+            extensions={"timeout": dict.fromkeys(("connect", "read", "write", "pool"), timeout)},
+        )
+        response = await self._pool.handle_async_request(request)
+        self.requests += 1
+        if response.extensions.get("http_version") == b"HTTP/2":
+            self.multiplexed += 1
+        return response
+
+
+class _StreamResponse:
+
+    def __init__(self, response, run):
+        self.status = response.status
+        self.headers = _headers(response)
+        self._response = response
+        self._run = run
+
+    @property
+    def content(self):
+        return b"".join(self.iterate())
+
+    def json(self):
+        return loads(self.content.decode("utf-8"))
+
+    def iterate(self, chunk_size=65536):
+        chunks = self._response.aiter_stream()
+        buffer = b""
+        try:
+            while True:
+                chunk = self._run(_next(chunks))
+                if chunk is None:
+                    break
+                buffer += chunk
+                while len(buffer) >= chunk_size:
+                    yield buffer[:chunk_size]
+                    buffer = buffer[chunk_size:]
+            if buffer:
+                yield buffer
+        finally:
+            self.close()
+
+    def close(self):
+        response, self._response = self._response, None
+        if response is not None:
+            self._run(response.aclose())
+
+
+async def _next(chunks):
+    try:
+        return await chunks.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+def _headers(response):
+    return dict((key.decode("latin-1").lower(), value.decode("latin-1")) for key, value in response.headers)
@@ -0,0 +1,129 @@
+from threading import Thread, Event
+from datetime import timedelta
+from starkcore.utils.checks import check_date
+from .compatibility import Queue, Empty
+from .prefetch import _put
+from .relay import redirect_relay, use_transport, _context
+
+
+def query(module, after, before, shards=4, workers=None, buffer=1000, **filters):
+    """# Retrieve objects from several date ranges concurrently
+    Split the [after, before] interval into up to `shards` sub-ranges of whole days and drain each one
+    with its own query() cursor chain on a pool of background threads.
+    Since the shards cover disjoint date ranges and each query() returns its objects newest first,
+    the shards are yielded from the newest range to the oldest, so the merged stream is ordered by created.
+    Each shard keeps at most `buffer` objects in memory ahead of the caller, and its thread waits for the caller once it is full.
+    The threads send their requests through the transport set for the calling thread, such as by starkinfra.use_transport.
+    ## Parameters (required):
+    - module [module]: SDK module with a query function that accepts after and before filters. ex: starkinfra.pixrequest
+    - after [datetime.date or string]: date filter for objects created after a specified date. ex: datetime.date(2020, 3, 10)
+    - before [datetime.date or string]: date filter for objects created before a specified date. ex: datetime.date(2020, 3, 10)
+    ## Parameters (optional):
+    - shards [integer, default 4]: number of date sub-ranges to query. Limited to the number of days in the interval. ex: 12
+    - workers [integer, default None]: number of shards queried at the same time. Defaults to one thread per shard. ex: 4
+    - buffer [integer, default 1000]: maximum number of objects retrieved for each shard ahead of the caller. ex: 5000
+    - filters [keyword arguments]: any other parameter accepted by the module's query function. ex: status="success", user=project
+    ## Return:
+    - Query iterator of objects ordered by created, newest first. Its shards attribute holds the progress of each sub-range
+    """
+    ranges = _split(check_date(after), check_date(before), shards)
+    return Query(module=module, ranges=ranges, workers=workers or len(ranges), buffer=buffer, filters=filters)
+
+
+class Shard:
+    """# Shard object
+    The Shard object reports the progress of a single date sub-range of a parallel query.
+    ## Attributes:
+    - after [datetime.date]: first day covered by the shard. ex: datetime.date(2020, 3, 10)
+    - before [datetime.date]: last day covered by the shard. ex: datetime.date(2020, 3, 17)
+    - status [string]: current shard status. ex: "pending", "running", "success" or "failed"
+    - count [integer]: number of objects retrieved so far. ex: 1200
+    """
+
+    def __init__(self, after, before):
+        self.after = after
+        self.before = before
+        self.status = "pending"
+        self.count = 0
+
+    def __repr__(self):
+        return "Shard[{after}:{before}]({status}, {count})".format(
+            after=self.after,
+            before=self.before,
+            status=self.status,
+            count=self.count,
+        )
+
+
+class Query:
+
+    def __init__(self, module, ranges, workers, buffer, filters):
+        self.shards = [Shard(after=after, before=before) for after, before in ranges]
+        self._module = module
+        self._workers = workers
+        self._buffer = buffer
+        self._filters = filters
+
+    def __iter__(self):
+        buffers = [Queue(maxsize=self._buffer) for _ in self.shards]
+        pending = Queue()
+        for index in range(len(self.shards)):
+            pending.put(index)
+        stopped = Event()
+        context = (getattr(_context, "relay", None), getattr(_context, "transport", None))
+
+        for _ in range(min(self._workers, len(self.shards))):
+            thread = Thread(target=self._run, args=(context, pending, buffers, stopped))
+            thread.daemon = True
+            thread.start()
+
+        try:
+            for buffer in buffers:
+                while True:
+                    entity, exception = buffer.get()
+                    if exception is not None:
+                        raise exception
+                    if entity is None:
+                        break
+                    yield entity
+        finally:
+            stopped.set()
+
+    def _run(self, context, pending, buffers, stopped):
+        relay, transport = context
+        with redirect_relay(relay), use_transport(transport):
+            self._drain(pending, buffers, stopped)
+
+    def _drain(self, pending, buffers, stopped):
+        while not stopped.is_set():
+            try:
+                index = pending.get_nowait()
+            except Empty:
+                return
+
+            shard = self.shards[index]
+            shard.status = "running"
+            try:
+                for entity in self._module.query(after=shard.after, before=shard.before, **self._filters):
+                    shard.count += 1
+                    if not _put(buffers[index], (entity, None), stopped):
+                        return
+            except Exception as exception:
+                shard.status = "failed"
+                _put(buffers[index], (None, exception), stopped)
+                continue
+            shard.status = "success"
+            _put(buffers[index], (None, None), stopped)
+
+
+def _split(after, before, shards):
+    days = (before - after).days + 1
+    if days < 1:
+        raise ValueError("before must not be earlier than after")
+    shards = max(1, min(shards, days))
+    ranges = []
+    for index in range(shards):
+        start = after + timedelta(days=index * days // shards)
+        end = after + timedelta(days=(index + 1) * days // shards - 1)
+        ranges.append((start, end))
+    return list(reversed(ranges))
@@ -1,6 +1,30 @@
+from json import loads
+from .api import from_api_json
 from .relay import set_relay
-from starkcore.utils import parse
+from .verifier import Verifier
 
 
-parse_and_verify = set_relay(parse.parse_and_verify)
-verify = set_relay(parse.verify)
+verifier = Verifier()
+
+
+def _parse_and_verify(content, signature, sdk_version, api_version, host, resource, user, language, timeout, transport, key=None):
+    content = _verify(content, signature, sdk_version, api_version, host, user, language, timeout, transport)
+    json = loads(content, strict=False)
+    if key:
+        json = json[key]
+    return from_api_json(resource=resource, json=json)
+
+
+def _verify(content, signature, sdk_version, api_version, host, user, language, timeout, transport):
+    return verifier.verify(
+        content=content,
+        signature=signature,
+        user=user,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    )
+
+
+parse_and_verify = set_relay(_parse_and_verify)
+verify = set_relay(_verify)
@@ -0,0 +1,50 @@
+from threading import Thread, Event
+from .compatibility import Queue, Full
+
+
+_end = object()
+
+
+def prefetch(iterator, size):
+    """# Iterate in the background
+    Consume an iterator on a daemon thread, keeping at most `size` items buffered ahead of the caller.
+    Exceptions raised by the iterator are re-raised to the caller, and closing the returned
+    generator stops the background thread.
+    """
+    buffer = Queue(maxsize=size)
+    stopped = Event()
+
+    def produce():
+        try:
+            for item in iterator:
+                if not _put(buffer, (item, None), stopped):
+                    return
+        except Exception as exception:
+            _put(buffer, (_end, exception), stopped)
+            return
+        _put(buffer, (_end, None), stopped)
+
+    thread = Thread(target=produce)
+    thread.daemon = True
+    thread.start()
+
+    try:
+        while True:
+            item, exception = buffer.get()
+            if exception is not None:
+                raise exception
+            if item is _end:
+                break
+            yield item
+    finally:
+        stopped.set()
+
+
+def _put(buffer, item, stopped):
+    while not stopped.is_set():
+        try:
+            buffer.put(item, timeout=0.1)
+            return True
+        except Full:
+            pass
+    return False
@@ -0,0 +1,154 @@
+from time import sleep
+from random import uniform
+from threading import Lock
+from .compatibility import monotonic
+
+
+class RateLimiter:
+    """# RateLimiter object
+    The RateLimiter spaces out the requests sent to the Stark Infra API with a token bucket for each
+    resource and user, shared by all threads, so parallel jobs stay under the API rate limits.
+    Set it at starkinfra.rate_limiter to enable it.
+    When the API answers with status 429 (Too Many Requests), the rate of the bucket is halved and
+    every request to that resource waits for the Retry-After interval, or for a jittered exponential
+    backoff if there is none, before the request is retried. The rate then grows back slowly to its
+    configured value while requests succeed.
+    ## Parameters (optional):
+    - rate [float, default 10]: maximum number of requests per second to each resource. ex: 50
+    - burst [integer, default None]: number of requests that may be sent at once after an idle period. Defaults to the rate, with a minimum of 1. ex: 20
+    - rates [dictionary of string to float, default None]: maximum number of requests per second by resource name, overriding rate. ex: {"PixRequest": 100, "IssuingCard": 5}
+    - retries [integer, default 3]: number of times a request answered with status 429 is retried. ex: 5
+    - backoff [float, default 0.5]: base number of seconds waited before the first retry when the API does not send a Retry-After header. Doubled on each retry. ex: 1
+    - max_backoff [float, default 30]: maximum number of seconds waited before a retry. ex: 60
+    - min_rate [float, default 0.5]: minimum number of requests per second a bucket may be slowed down to. ex: 1
+    - recovery [float, default None]: number of requests per second regained each second while requests succeed. Defaults to a tenth of the bucket rate. ex: 5
+    ## Attributes (return-only):
+    - requests [integer]: number of requests sent. ex: 15000
+    - throttled [integer]: number of requests that had to wait for the bucket. ex: 1200
+    - throttled_time [float]: total number of seconds requests waited for the bucket. ex: 35.2
+    - rejected [integer]: number of responses with status 429. ex: 12
+    - retried [integer]: number of requests retried after a 429 response. ex: 12
+    """
+
+    def __init__(self, rate=10, burst=None, rates=None, retries=3, backoff=0.5, max_backoff=30, min_rate=0.5, recovery=None):
+        self.rate = rate
+        self.burst = burst
+        self.rates = rates or {}
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.min_rate = min_rate
+        self.recovery = recovery
+        self.requests = 0
+        self.throttled = 0
+        self.throttled_time = 0.0
+        self.rejected = 0
+        self.retried = 0
+        self._lock = Lock()
+        self._buckets = {}
+
+    def send(self, name, user, send):
+        """# Send a request through the rate limiter
+        ## Parameters (required):
+        - name [string]: resource name or path of the request. ex: "PixRequest"
+        - user [Organization/Project object]: user sending the request
+        - send [function]: function with no parameters that sends the request and returns its response
+        ## Return:
+        - response of the last attempt
+        """
+        key = _key(name, user)
+        attempt = 0
+        while True:
+            self._acquire(key, name)
+            response = send()
+            if response.status != 429:
+                self._succeed(key)
+                return response
+            self._reject(key, attempt, _retry_after(response))
+            if attempt >= self.retries:
+                return response
+            response.close()
+            attempt += 1
+            with self._lock:
+                self.retried += 1
+
+    def _bucket(self, key, name):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            limit = self.rates.get(name, self.rate)
+            burst = self.burst if self.burst is not None else max(1, limit)
+            bucket = self._buckets[key] = _Bucket(limit=limit, burst=burst)
+        return bucket
+
+    def _acquire(self, key, name):
+        wait = self._reserve(key, name)
+        if wait > 0:
+            sleep(wait)
+
+    def _reserve(self, key, name):
+        with self._lock:
+            bucket = self._bucket(key, name)
+            now = monotonic()
+            bucket.refill(now)
+            bucket.tokens -= 1
+            wait = -bucket.tokens / float(bucket.rate) if bucket.tokens < 0 else 0
+            self.requests += 1
+            if wait > 0:
+                self.throttled += 1
+                self.throttled_time += wait
+        return wait
+
+    def _succeed(self, key):
+        with self._lock:
+            bucket = self._buckets[key]
+            if bucket.rate < bucket.limit:
+                recovery = self.recovery if self.recovery is not None else bucket.limit / 10.0
+                bucket.rate = min(bucket.limit, bucket.rate + float(recovery) / bucket.rate)
+
+    def _reject(self, key, attempt, retry_after):
+        if retry_after is None:
+            retry_after = uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        retry_after = min(retry_after, self.max_backoff)
+        with self._lock:
+            self.rejected += 1
+            bucket = self._buckets[key]
+            now = monotonic()
+            bucket.refill(now)
+            if now >= bucket.decrease_after:
+                bucket.rate = max(self.min_rate, bucket.rate / 2.0)
+                bucket.decrease_after = now + max(retry_after, 1.0 / bucket.rate)
+            bucket.tokens = min(bucket.tokens, -retry_after * bucket.rate)
+
+
+class _Bucket:
+
+    def __init__(self, limit, burst):
+        self.limit = limit
+        self.rate = limit
+        self.burst = burst
+        self.tokens = burst
+        self.updated = monotonic()
+        self.decrease_after = float("-inf")
+
+    def refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+def _retry_after(response):
+    for key, value in (response.headers or {}).items():
+        if key.lower() == "retry-after":
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                return None
+    return None
+
+
+def _key(name, user):
+    return "{name}/{environment}/{user}/{workspace}".format(
+        name=name,
+        environment=getattr(user, "environment", None),
+        user=getattr(user, "id", None),
+        workspace=getattr(user, "workspace_id", None),
+    )
@@ -1,8 +1,12 @@
 import starkinfra
+from threading import local
+from contextlib import contextmanager
 from starkcore.utils.host import StarkHost
+from .request import _default_transport
 
 
 _api_version = "v2"
+_context = local()
 
 
 def set_relay(func):
@@ -15,5 +19,65 @@ def set_relay(func):
             "language": kwargs.get("language") or starkinfra.language,
             "timeout": kwargs.get("timeout") or starkinfra.timeout,
         })
-        return func(*args, **kwargs)
+        relay = getattr(_context, "relay", None)
+        if relay is not None:
+            return relay(func, *args, **kwargs)
+        return func(*args, **set_transport(kwargs))
     return wrapper
+
+
+def set_transport(kwargs):
+    kwargs["transport"] = kwargs.get("transport") or getattr(_context, "transport", None) or starkinfra.transport
+    if starkinfra.rate_limiter is not None:
+        kwargs["transport"] = _RateLimitedTransport(
+            transport=kwargs["transport"] or _default_transport,
+            rate_limiter=starkinfra.rate_limiter,
+            name=rate_limit_name(kwargs),
+            user=kwargs["user"],
+        )
+    return kwargs
+
+
+def rate_limit_name(kwargs):
+    return kwargs["resource"]["name"] if "resource" in kwargs else kwargs.get("path")
+
+
+@contextmanager
+def use_transport(transport):
+    """# Send the requests of a block of calls through a transport
+    Overrides starkinfra.transport for the calls made by the current thread inside the with block.
+    ## Parameters (required):
+    - transport [Transport object]: transport used to send the requests. ex: starkinfra.Http2Transport()
+    """
+    previous = getattr(_context, "transport", None)
+    _context.transport = transport
+    try:
+        yield transport
+    finally:
+        _context.transport = previous
+
+
+@contextmanager
+def redirect_relay(relay):
+    previous = getattr(_context, "relay", None)
+    _context.relay = relay
+    try:
+        yield
+    finally:
+        _context.relay = previous
+
+
+class _RateLimitedTransport:
+
+    def __init__(self, transport, rate_limiter, name, user):
+        self.transport = transport
+        self.rate_limiter = rate_limiter
+        self.name = name
+        self.user = user
+
+    def request(self, **request):
+        return self.rate_limiter.send(self.name, self.user, lambda: self.transport.request(**request))
+
+    def stream(self, **request):
+        stream = getattr(self.transport, "stream", self.transport.request)
+        return self.rate_limiter.send(self.name, self.user, lambda: stream(**request))
@@ -0,0 +1,144 @@
+from time import time
+from json import dumps
+from sys import version_info as python_version
+from starkcore.environment import Environment
+from starkcore.error import InternalServerError, InputErrors, UnknownError
+from starkcore.user.__publicuser import PublicUser
+from starkcore.utils.checks import check_user, check_language
+from starkcore.utils.host import StarkHost
+from starkcore.utils.url import urlencode
+from .transport import HttpTransport, Response
+from .signer import sign
+
+
+_default_transport = HttpTransport()
+
+
+# the request could not be sent or its response could not be read
+class _TransportError(UnknownError):
+    pass
+
+
+# the API answered with a 5xx status other than 500
+class _ServerError(UnknownError):
+    pass
+
+
+def fetch(host, sdk_version, user, method, path, payload=None, query=None,
+          api_version="v2", language="en-US", timeout=15, transport=None):
+    request = prepare(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method=method,
+        path=path,
+        payload=payload,
+        query=query,
+        api_version=api_version,
+        language=language,
+    )
+
+    try:
+        response = (transport or _default_transport).request(timeout=timeout, **request)
+    except Exception as exception:
+        raise _TransportError("{}: {}".format(exception.__class__.__name__, str(exception)))
+
+    return check(response)
+
+
+def stream(host, sdk_version, user, method, path, payload=None, query=None,
+           api_version="v2", language="en-US", timeout=15, transport=None, headers=None):
+    request = prepare(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method=method,
+        path=path,
+        payload=payload,
+        query=query,
+        api_version=api_version,
+        language=language,
+    )
+    request["headers"].update(headers or {})
+
+    transport = transport or _default_transport
+    try:
+        if hasattr(transport, "stream"):
+            response = transport.stream(timeout=timeout, **request)
+        else:
+            response = transport.request(timeout=timeout, **request)
+            response = Response(status=response.status, content=response.content, headers=response.headers)
+    except Exception as exception:
+        raise _TransportError("{}: {}".format(exception.__class__.__name__, str(exception)))
+
+    if response.status not in (200, 206) and not (response.status == 416 and "Range" in request["headers"]):
+        check(response)
+    return response
+
+
+def prepare(host, sdk_version, user, method, path, payload=None, query=None, api_version="v2", language="en-US"):
+    user = check_user(user)
+    language = check_language(language)
+
+    service = {
+        StarkHost.infra: "starkinfra",
+        StarkHost.bank: "starkbank",
+        StarkHost.sign: "starksign",
+    }[host]
+
+    url = {
+        Environment.production:  "https://api.{service}.com/",
+        Environment.sandbox:     "https://sandbox.api.{service}.com/",
+    }[user.environment].format(service=service) + api_version
+
+    url = "{base_url}/{path}{query}".format(base_url=url, path=path.lstrip("/"), query=urlencode(query))
+
+    agent = "Python-{major}.{minor}.{micro}-SDK-{host}-{sdk_version}".format(
+        major=python_version.major,
+        minor=python_version.minor,
+        micro=python_version.micro,
+        host=host,
+        sdk_version=sdk_version,
+    )
+
+    body = dumps(payload) if payload else ""
+    headers = {
+        "User-Agent": agent,
+        "Accept-Language": language,
+        "Content-Type": "application/json",
+    }
+    headers.update(_authentication_headers(user=user, body=body))
+
+    return {
+        "method": method,
+        "url": url,
+        "body": body.encode("utf-8"),
+        "headers": headers,
+    }
+
+
+def check(response):
+    if response.status == 500:
+        raise InternalServerError()
+    if response.status == 400:
+        raise InputErrors(response.json()["errors"])
+    if response.status > 500:
+        raise _ServerError(response.content)
+    if response.status != 200:
+        raise UnknownError(response.content)
+    return response
+
+
+def _authentication_headers(user, body):
+    if isinstance(user, PublicUser):
+        return {}
+
+    access_time = str(time())
+    message = "{access_id}:{access_time}:{body}".format(access_id=user.access_id(), access_time=access_time, body=body)
+    signature = sign(user=user, message=message)
+
+    return {
+        "Access-Id": user.access_id(),
+        "Access-Time": access_time,
+        "Access-Signature": signature,
+    }
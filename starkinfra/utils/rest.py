@@ -1,15 +1,373 @@
+import starkinfra
+from json import dumps
+from copy import deepcopy
 from .relay import set_relay
-from starkcore.utils import rest
-
-
-get_page = set_relay(rest.get_page)
-get_stream = set_relay(rest.get_stream)
-get_id = set_relay(rest.get_id)
-get_content = set_relay(rest.get_content)
-get_sub_resource = set_relay(rest.get_sub_resource)
-get_sub_resources = set_relay(rest.get_sub_resources)
-post_multi = set_relay(rest.post_multi)
-post_single = set_relay(rest.post_single)
-delete_id = set_relay(rest.delete_id)
-patch_id = set_relay(rest.patch_id)
-get_raw = set_relay(rest.get_raw)
+from .request import fetch, stream
+from .prefetch import prefetch as _prefetch
+from .compact import compact as _compact
+from .batch import get_many as _batch
+from .api import api_json, from_api_json, cast_json_to_api_format
+from starkcore.utils.api import endpoint, last_name, last_name_plural
+
+
+def _get_page(sdk_version, host, api_version, user, resource, language, timeout, transport, **query):
+    json = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path=endpoint(resource),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    ).json()
+    entities = [from_api_json(resource, entity) for entity in json[last_name_plural(resource)]]
+    cursor = json.get("cursor")
+    return entities, cursor
+
+
+def _get_stream(sdk_version, host, api_version, user, resource, language, timeout, transport, limit=None, prefetch=None, compact=False, **query):
+    if compact:
+        resource = _compact(resource)
+    pages = _get_pages(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        resource=resource,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+        limit=limit,
+        **query
+    )
+    if prefetch:
+        pages = _prefetch(pages, size=prefetch)
+
+    for entities in pages:
+        for entity in entities:
+            yield entity
+
+
+def _get_pages(sdk_version, host, api_version, user, resource, language, timeout, transport, limit=None, **query):
+    pages = _get_json_pages(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        resource=resource,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+        limit=limit,
+        **query
+    )
+    for entities in pages:
+        yield [from_api_json(resource, entity) for entity in entities]
+
+
+def _get_json_pages(sdk_version, host, api_version, user, resource, language, timeout, transport, limit=None, **query):
+    limit_query = {"limit": min(limit, 100) if limit else limit}
+    limit_query.update(query)
+
+    while True:
+        json = fetch(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            method="GET",
+            path=endpoint(resource),
+            query=limit_query,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+        ).json()
+        yield json[last_name_plural(resource)]
+
+        if limit:
+            limit -= 100
+            limit_query["limit"] = min(limit, 100)
+
+        limit_query["cursor"] = json.get("cursor")
+        if not limit_query["cursor"] or (limit is not None and limit <= 0):
+            break
+
+
+def _get_first(sdk_version, host, api_version, user, resource, language, timeout, transport, **query):
+    entities, cursor = _get_page(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        resource=resource,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+        **query
+    )
+    return entities[0]
+
+
+def _get_id(sdk_version, host, api_version, user, resource, id, language, timeout, transport, **query):
+    cache = starkinfra.cache if not query else None
+    entity = cache.get(resource=resource, id=id, user=user) if cache else None
+    if entity is not None:
+        return from_api_json(resource, entity)
+
+    def get():
+        json = fetch(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            method="GET",
+            path="{endpoint}/{id}".format(endpoint=endpoint(resource), id=id),
+            query=query,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+        ).json()
+        entity = json[last_name(resource)]
+        if cache:
+            cache.set(resource=resource, id=id, user=user, json=entity)
+        return entity
+
+    single_flight = starkinfra.single_flight
+    if single_flight:
+        key = (resource["name"], id, dumps(query, sort_keys=True, default=str), api_version, language,
+               getattr(user, "environment", None), getattr(user, "id", None), getattr(user, "workspace_id", None))
+        entity = single_flight.do(key, get, copy=deepcopy)
+    else:
+        entity = get()
+    return from_api_json(resource, entity)
+
+
+def _get_many(sdk_version, host, api_version, user, resource, ids, language, timeout, transport, key="id", chunk_size=100, workers=4, **query):
+    def get(chunk):
+        filters = {key + "s": chunk}
+        filters.update(query)
+        entities = []
+        for page in _get_json_pages(
+            host=host,
+            sdk_version=sdk_version,
+            user=user,
+            resource=resource,
+            api_version=api_version,
+            language=language,
+            timeout=timeout,
+            transport=transport,
+            limit=len(chunk),
+            **filters
+        ):
+            entities.extend(from_api_json(resource, entity) for entity in page)
+        return entities
+
+    return _batch(ids=ids, fetch=get, key=key, chunk_size=min(chunk_size, 100), workers=workers)
+
+
+def _get_content(sdk_version, host, api_version, user, resource, id, sub_resource_name, language, timeout, transport, **query):
+    return fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}/{sub_resource_name}".format(
+            endpoint=endpoint(resource),
+            id=id,
+            sub_resource_name=sub_resource_name,
+        ),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    ).content
+
+
+def _get_content_stream(sdk_version, host, api_version, user, resource, id, sub_resource_name, language, timeout, transport, chunk_size=65536, **query):
+    response = _get_content_response(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        resource=resource,
+        id=id,
+        sub_resource_name=sub_resource_name,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+        **query
+    )
+    try:
+        for chunk in response.iterate(chunk_size):
+            yield chunk
+    finally:
+        response.close()
+
+
+def _get_content_response(sdk_version, host, api_version, user, resource, id, sub_resource_name, language, timeout, transport, headers=None, **query):
+    return stream(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}/{sub_resource_name}".format(
+            endpoint=endpoint(resource),
+            id=id,
+            sub_resource_name=sub_resource_name,
+        ),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+        headers=headers,
+    )
+
+
+def _get_sub_resource(sdk_version, host, api_version, user, resource, id, sub_resource, language, timeout, transport, **query):
+    entity = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}/{sub_resource}".format(
+            endpoint=endpoint(resource),
+            id=id,
+            sub_resource=endpoint(sub_resource),
+        ),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    ).json()[last_name(sub_resource)]
+    return from_api_json(sub_resource, entity)
+
+
+def _get_sub_resources(sdk_version, host, api_version, user, resource, id, sub_resource, language, timeout, transport, **query):
+    entities = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path="{endpoint}/{id}/{sub_resource}".format(
+            endpoint=endpoint(resource),
+            id=id,
+            sub_resource=endpoint(sub_resource),
+        ),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    ).json()[last_name_plural(sub_resource)]
+    return [from_api_json(sub_resource, entity) for entity in entities]
+
+
+def _post_multi(sdk_version, host, api_version, user, resource, entities, language, timeout, transport, **query):
+    json = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="POST",
+        path=endpoint(resource),
+        payload={last_name_plural(resource): [api_json(entity) for entity in entities]},
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    ).json()
+    entities = json[last_name_plural(resource)]
+    return [from_api_json(resource, entity) for entity in entities]
+
+
+def _post_single(sdk_version, host, api_version, user, resource, entity, language, timeout, transport, **query):
+    payload = api_json(entity)
+    json = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="POST",
+        path=endpoint(resource),
+        payload=payload,
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    ).json()
+    entity_json = json[last_name(resource)]
+    return from_api_json(resource, entity_json)
+
+
+def _delete_id(sdk_version, host, api_version, user, resource, id, language, timeout, transport, **query):
+    json = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="DELETE",
+        path="{endpoint}/{id}".format(endpoint=endpoint(resource), id=id),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    ).json()
+    entity = json[last_name(resource)]
+    return from_api_json(resource, entity)
+
+
+def _patch_id(sdk_version, host, api_version, user, resource, id, payload, language, timeout, transport, **query):
+    json = fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="PATCH",
+        path="{endpoint}/{id}".format(endpoint=endpoint(resource), id=id),
+        payload=cast_json_to_api_format(payload),
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    ).json()
+    entity = json[last_name(resource)]
+    return from_api_json(resource, entity)
+
+
+def _get_raw(sdk_version, host, api_version, path, user, language, timeout, transport, **query):
+    return fetch(
+        host=host,
+        sdk_version=sdk_version,
+        user=user,
+        method="GET",
+        path=path,
+        query=query,
+        api_version=api_version,
+        language=language,
+        timeout=timeout,
+        transport=transport,
+    ).json()
+
+
+get_page = set_relay(_get_page)
+get_stream = set_relay(_get_stream)
+get_json_pages = set_relay(_get_json_pages)
+get_first = set_relay(_get_first)
+get_id = set_relay(_get_id)
+get_many = set_relay(_get_many)
+get_content = set_relay(_get_content)
+get_content_stream = set_relay(_get_content_stream)
+get_content_response = set_relay(_get_content_response)
+get_sub_resource = set_relay(_get_sub_resource)
+get_sub_resources = set_relay(_get_sub_resources)
+post_multi = set_relay(_post_multi)
+post_single = set_relay(_post_single)
+delete_id = set_relay(_delete_id)
+patch_id = set_relay(_patch_id)
+get_raw = set_relay(_get_raw)
@@ -0,0 +1,94 @@
+from hashlib import sha256
+from threading import Lock
+from ellipticcurve import PrivateKey, Signature
+from ellipticcurve.math import Math
+from ellipticcurve.utils.integer import RandomInteger
+from ellipticcurve.utils.binary import numberFromByteString
+from .curve import _generator_table, _multiply
+
+try:
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives.hashes import SHA256
+    from cryptography.hazmat.primitives.asymmetric.ec import ECDSA, SECP256K1, derive_private_key
+    from cryptography.hazmat.primitives.asymmetric.utils import decode_dss_signature
+except ImportError:
+    derive_private_key = None
+
+
+_signers = {}
+_lock = Lock()
+_max_signers = 100
+_window_bits = 6
+
+
+class Signer:
+    """# Signer object
+    The Signer signs the requests sent to the Stark Infra API with the private key of a user.
+    The private key is decoded only once and a table of multiples of the curve generator is
+    precomputed, so each signature costs a sequence of table lookups and additions.
+    If the cryptography package is installed, it is used to compute the signatures instead.
+    The SDK keeps one Signer per private key, so it is not necessary to create them.
+    ## Parameters (required):
+    - pem [string]: private key in PEM format. ex: project.pem
+    """
+
+    def __init__(self, pem):
+        self.pem = pem
+        self.private_key = PrivateKey.fromPem(pem)
+        self.curve = self.private_key.curve
+        self._generator_table = _generator_table(self.curve, bits=_window_bits)
+        self._fast_key = None
+        if derive_private_key is not None and self.curve.name == "secp256k1":
+            self._fast_key = derive_private_key(self.private_key.secret, SECP256K1(), default_backend())
+
+    def sign(self, message):
+        """# Sign a message
+        ## Parameters (required):
+        - message [string]: message to be signed. ex: "project/5656565656565656:1670000000.0:{}"
+        ## Return:
+        - base-64 DER encoded signature
+        """
+        if not isinstance(message, bytes):
+            message = message.encode("utf-8")
+        if self._fast_key is not None:
+            r, s = decode_dss_signature(self._fast_key.sign(message, ECDSA(SHA256())))
+        else:
+            r, s = self._sign(message)
+        if s > self.curve.N // 2:
+            s = self.curve.N - s
+        return Signature(r=r, s=s).toBase64()
+
+    def _sign(self, message):
+        curve = self.curve
+        N, P = curve.N, curve.P
+        secret = self.private_key.secret
+        digest = sha256(message).digest()
+        number = numberFromByteString(digest, curve.nBitLength)
+
+        for nonce in RandomInteger.rfc6979(digest, secret, curve, sha256):
+            x, y, z = _multiply(self._generator_table, nonce, 0, 0, 0, curve)
+            if z == 0:
+                continue
+            z_inverse = Math.inv(z, P)
+            r = (x * z_inverse * z_inverse) % P % N
+            s = ((number + r * secret) * Math.inv(nonce, N)) % N
+            if r and s:
+                return r, s
+
+
+def sign(user, message):
+    """# Sign a message with the private key of a user
+    ## Parameters (required):
+    - user [Organization/Project object]: Organization or Project object whose private key signs the message
+    - message [string]: message to be signed. ex: "project/5656565656565656:1670000000.0:{}"
+    ## Return:
+    - base-64 DER encoded signature
+    """
+    signer = _signers.get(user.pem)
+    if signer is None:
+        signer = Signer(user.pem)
+        with _lock:
+            if len(_signers) >= _max_signers:
+                _signers.clear()
+            _signers[user.pem] = signer
+    return signer.sign(message)
@@ -0,0 +1,64 @@
+from threading import Event, Lock
+
+
+class SingleFlight:
+    """# SingleFlight object
+    The SingleFlight coalesces concurrent identical calls to the get functions, so when several threads
+    retrieve the same object at once, with the same parameters and user, only one request is sent to the
+    Stark Infra API and all of them receive its result. Each thread still receives its own object.
+    Set it at starkinfra.single_flight to enable it.
+    ## Attributes (return-only):
+    - requests [integer]: number of requests sent on behalf of one or more calls. ex: 1500
+    - coalesced [integer]: number of calls that received the result of a request sent by another call. ex: 320
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.coalesced = 0
+        self._lock = Lock()
+        self._calls = {}
+
+    def do(self, key, function, copy=None):
+        """# Run a function once for concurrent calls with the same key
+        ## Parameters (required):
+        - key [hashable]: identifier of the call. ex: "PixRequest/5656565656565656"
+        - function [function]: function with no parameters to be run
+        ## Parameters (optional):
+        - copy [function, default None]: function applied to the result before it is returned to the coalesced calls. ex: deepcopy
+        ## Return:
+        - result of the function. Errors are raised to every coalesced call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.requests += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy(call.result) if copy else call.result
+
+        try:
+            call.result = function()
+        except Exception as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class _Call:
+
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
@@ -0,0 +1,71 @@
+from json import dumps
+from json.encoder import encode_basestring_ascii
+from .api import cast_values
+from starkcore.utils.case import snake_to_camel
+
+try:
+    from orjson import dumps as _fast_dumps
+except ImportError:
+    _fast_dumps = None
+
+
+class Template:
+    """# Template object
+    Serializes a fixed set of fields into the JSON string expected by the Stark Infra API, giving the
+    same result as dumps(api_json(fields)) without converting the key casing on every call.
+    The camel case keys are prepared once and strings, integers, booleans and lists of strings are written directly.
+    Other values, such as datetimes and lists of objects, go through api_json as usual.
+    If the orjson package is installed, it is used to serialize the result, in which case the JSON has no whitespace.
+    ## Parameters (required):
+    - fields [list of strings]: snake case field names, in output order. ex: ["status", "reason"]
+    ## Parameters (optional):
+    - root [string, default None]: key of an object wrapping the fields. ex: "authorization"
+    """
+
+    def __init__(self, fields, root=None):
+        self.fields = fields
+        self.root = root
+        self._keys = [(field, snake_to_camel(field)) for field in fields]
+        self._prefixes = [(field, dumps(key) + ": ") for field, key in self._keys]
+        self._open = "{" + dumps(root) + ": {" if root else "{"
+        self._close = "}}" if root else "}"
+
+    def render(self, **values):
+        """# Serialize the fields
+        ## Parameters (required):
+        - values [keyword arguments]: value of each field. None values are left out. ex: status="approved", reason=None
+        ## Return:
+        - JSON string
+        """
+        if _fast_dumps is not None:
+            return self._render_fast(values)
+
+        parts = []
+        for field, prefix in self._prefixes:
+            value = values.get(field)
+            if value is None:
+                continue
+            kind = type(value)
+            if kind is str:
+                parts.append(prefix + encode_basestring_ascii(value))
+            elif kind is int:
+                parts.append(prefix + int.__repr__(value))
+            elif kind is bool:
+                parts.append(prefix + ("true" if value else "false"))
+            elif kind is list and all(type(item) is str for item in value):
+                parts.append(prefix + "[" + ", ".join([encode_basestring_ascii(item) for item in value]) + "]")
+            else:
+                parts.append(prefix + dumps(cast_values(value)))
+        return self._open + ", ".join(parts) + self._close
+
+    def _render_fast(self, values):
+        json = {}
+        for field, key in self._keys:
+            value = values.get(field)
+            if value is None:
+                continue
+            kind = type(value)
+            json[key] = value if kind is str or kind is int or kind is bool or kind is float else cast_values(value)
+        if self.root:
+            json = {self.root: json}
+        return _fast_dumps(json).decode("utf-8")
@@ -0,0 +1,238 @@
+from ssl import create_default_context
+from json import loads
+from time import time
+from threading import Lock, BoundedSemaphore
+from .compatibility import urlsplit, HTTPConnection, HTTPSConnection, BadStatusLine, ConnectionResetError, IncompleteRead
+
+
+_idempotent_methods = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+
+class Response:
+
+    def __init__(self, status, content, headers=None):
+        self.status = status
+        self.content = content
+        self.headers = headers or {}
+
+    def json(self):
+        return loads(self.content.decode("utf-8"))
+
+    def iterate(self, chunk_size=65536):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+
+class StreamResponse:
+
+    def __init__(self, status, headers, raw, release):
+        self.status = status
+        self.headers = headers
+        self._raw = raw
+        self._release = release
+
+    @property
+    def content(self):
+        return b"".join(self.iterate())
+
+    def json(self):
+        return loads(self.content.decode("utf-8"))
+
+    def iterate(self, chunk_size=65536):
+        try:
+            while True:
+                chunk = self._raw.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+            if self._raw.length:
+                raise IncompleteRead(b"", self._raw.length)
+        finally:
+            self.close()
+
+    def close(self):
+        release, self._release = self._release, None
+        if release is not None:
+            release(self._raw.isclosed() and not self._raw.length)
+
+
+class Transport:
+    """# Transport object
+    Interface of the objects that send the HTTP requests of the SDK. Any object with the same methods
+    may be set at starkinfra.transport, or used on a block of calls with starkinfra.use_transport.
+    Subclasses must implement request. The default stream reads the whole response at once.
+    ## Methods:
+    - request(method, url, body=None, headers=None, timeout=None): send a request and return a response with status, headers and content attributes and a json method
+    - stream(method, url, body=None, headers=None, timeout=None): same as request, but the response content may be read in chunks with iterate(chunk_size) and must be released with close()
+    - close(): close the open connections
+    """
+
+    def request(self, method, url, body=None, headers=None, timeout=None):
+        raise NotImplementedError()
+
+    def stream(self, method, url, body=None, headers=None, timeout=None):
+        response = self.request(method=method, url=url, body=body, headers=headers, timeout=timeout)
+        return Response(
+            status=response.status,
+            content=response.content,
+            headers=response.headers,
+        )
+
+    def close(self):
+        pass
+
+
+class HttpTransport(Transport):
+    """# HttpTransport object
+    The HttpTransport keeps a thread-safe pool of persistent (keep-alive) HTTP/1.1 connections
+    for each host, so that consecutive requests to the Stark Infra API reuse an already
+    established TCP and TLS session instead of opening a new one on every call.
+    The SDK uses a process-wide HttpTransport by default, but you may set your own at
+    starkinfra.transport to tune the pool.
+    ## Parameters (optional):
+    - max_connections [integer, default 10]: maximum number of simultaneous connections per host. Requests wait for a free connection once this limit is reached. ex: 10
+    - idle_timeout [float, default 30]: number of seconds an idle connection is kept open for reuse. ex: 30
+    - context [ssl.SSLContext, default None]: SSL context used to open HTTPS connections. Defaults to ssl.create_default_context(), created on the first HTTPS connection
+    ## Attributes (return-only):
+    - opened [integer]: number of connections opened by this transport. ex: 2
+    - reused [integer]: number of requests sent through an already open connection. ex: 1500
+    """
+
+    def __init__(self, max_connections=10, idle_timeout=30, context=None):
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self._context = context
+        self.opened = 0
+        self.reused = 0
+        self._lock = Lock()
+        self._idle = {}
+        self._slots = {}
+
+    @property
+    def context(self):
+        if self._context is None:
+            self._context = create_default_context()
+        return self._context
+
+    @context.setter
+    def context(self, context):
+        self._context = context
+
+    def request(self, method, url, body=None, headers=None, timeout=None):
+        response = self.stream(method=method, url=url, body=body, headers=headers, timeout=timeout)
+        return Response(
+            status=response.status,
+            content=response.content,
+            headers=response.headers,
+        )
+
+    def stream(self, method, url, body=None, headers=None, timeout=None):
+        """# Send a request and stream its response
+        The response content is read in chunks with iterate(chunk_size). The connection only
+        goes back to the pool if the content is read to the end, otherwise it is closed.
+        A request that finds its reused connection closed by the server is sent again on a new
+        connection only if it was not written yet or its method is idempotent, so that a POST
+        or PATCH the server may have received is never sent twice.
+        """
+        url = urlsplit(url)
+        origin = (url.scheme, url.hostname, url.port)
+        path = url.path + ("?" + url.query if url.query else "")
+
+        slot = self._slot(origin)
+        slot.acquire()
+        try:
+            connection, is_reused = self._acquire(origin, timeout)
+            sent = False
+            try:
+                connection.request(method, path, body=body, headers=headers or {})
+                sent = True
+                response = connection.getresponse()
+            except (BadStatusLine, ConnectionResetError):
+                connection.close()
+                if not is_reused or (sent and method not in _idempotent_methods):
+                    raise
+                connection = self._open(origin, timeout)
+                try:
+                    response = self._send(connection, method, path, body, headers)
+                except Exception:
+                    connection.close()
+                    raise
+            except Exception:
+                connection.close()
+                raise
+        except Exception:
+            slot.release()
+            raise
+
+        def release(completed):
+            try:
+                self._release(origin, connection, response, completed)
+            finally:
+                slot.release()
+
+        return StreamResponse(
+            status=response.status,
+            headers=dict((key.lower(), value) for key, value in response.getheaders()),
+            raw=response,
+            release=release,
+        )
+
+    def close(self):
+        with self._lock:
+            connections = [connection for idle in self._idle.values() for connection, _ in idle]
+            self._idle = {}
+        for connection in connections:
+            connection.close()
+
+    def _slot(self, origin):
+        with self._lock:
+            if origin not in self._slots:
+                self._slots[origin] = BoundedSemaphore(self.max_connections)
+            return self._slots[origin]
+
+    def _acquire(self, origin, timeout):
+        expired = []
+        connection = None
+        with self._lock:
+            idle = self._idle.get(origin, [])
+            while idle:
+                candidate, last_used = idle.pop()
+                if time() - last_used > self.idle_timeout:
+                    expired.append(candidate)
+                    continue
+                connection = candidate
+                self.reused += 1
+                break
+
+        for candidate in expired:
+            candidate.close()
+
+        if connection is None:
+            return self._open(origin, timeout), False
+
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection, True
+
+    def _open(self, origin, timeout):
+        scheme, host, port = origin
+        with self._lock:
+            self.opened += 1
+        if scheme == "http":
+            return HTTPConnection(host, port, timeout=timeout)
+        return HTTPSConnection(host, port, timeout=timeout, context=self.context)
+
+    def _send(self, connection, method, path, body, headers):
+        connection.request(method, path, body=body, headers=headers or {})
+        return connection.getresponse()
+
+    def _release(self, origin, connection, response, completed):
+        if response.will_close or not completed:
+            connection.close()
+            return
+        with self._lock:
+            self._idle.setdefault(origin, []).append((connection, time()))
@@ -0,0 +1,93 @@
+from zlib import decompressobj, crc32, error, MAX_WBITS
+from struct import unpack, calcsize
+
+
+_local_header = "<IHHHHHIIIHH"
+_local_signature = 0x04034b50
+_descriptor_signature = 0x08074b50
+_has_descriptor = 0x08
+_deflated = 8
+_stored = 0
+_chunk_size = 65536
+
+
+def unzip(chunks):
+    """# Decompress the first file of a zip archive as it arrives
+    Read the archive sequentially from an iterable of bytes chunks, without needing to seek
+    to its central directory, so the file content is yielded with constant memory usage.
+    The CRC-32 checksum of the content is checked when the archive ends.
+    ## Parameters (required):
+    - chunks [iterable of bytes]: zip archive content. ex: starkinfra.pixstatement.csv_stream("5656565656565656")
+    ## Return:
+    - generator of decompressed bytes chunks
+    """
+    stream = _Stream(chunks)
+    header = stream.read(calcsize(_local_header))
+    signature, _, flags, method, _, _, crc, size, _, name_length, extra_length = unpack(_local_header, header)
+    if signature != _local_signature:
+        raise ValueError("content is not a zip archive")
+    stream.read(name_length + extra_length)
+
+    checksum = 0
+    if method == _deflated:
+        decompressor = decompressobj(-MAX_WBITS)
+        while not decompressor.eof:
+            chunk = stream.next(_chunk_size)
+            if chunk is None:
+                raise ValueError("zip archive ended unexpectedly")
+            try:
+                data = decompressor.decompress(chunk, _chunk_size)
+            except error as exception:
+                raise ValueError("zip archive is corrupted: {message}".format(message=exception))
+            stream.unread(decompressor.unconsumed_tail + decompressor.unused_data)
+            if data:
+                checksum = crc32(data, checksum)
+                yield data
+    elif method == _stored and not flags & _has_descriptor:
+        while size:
+            data = stream.next(min(size, _chunk_size))
+            if data is None:
+                raise ValueError("zip archive ended unexpectedly")
+            size -= len(data)
+            checksum = crc32(data, checksum)
+            yield data
+    else:
+        raise ValueError("unsupported zip compression method {method}".format(method=method))
+
+    if flags & _has_descriptor:
+        crc = unpack("<I", stream.read(4))[0]
+        if crc == _descriptor_signature:
+            crc = unpack("<I", stream.read(4))[0]
+    if checksum & 0xffffffff != crc:
+        raise ValueError("zip archive checksum does not match its content")
+
+
+class _Stream:
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def next(self, size=None):
+        if not self._buffer:
+            for chunk in self._chunks:
+                if chunk:
+                    self._buffer = chunk
+                    break
+            else:
+                return None
+        size = size or len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def unread(self, data):
+        self._buffer = data + self._buffer
+
+    def read(self, size):
+        data = b""
+        while len(data) < size:
+            chunk = self.next(size - len(data))
+            if chunk is None:
+                raise ValueError("zip archive ended unexpectedly")
+            data += chunk
+        return data
@@ -0,0 +1,190 @@
+import starkinfra
+from time import time
+from json import loads, dumps
+from hashlib import sha256
+from threading import Lock
+from ellipticcurve import PublicKey, Signature
+from ellipticcurve.math import Math
+from ellipticcurve.utils.binary import numberFromByteString
+from starkcore.error import InvalidSignatureError
+from . import rest
+from .curve import _generator_table, _table, _multiply
+
+
+class Verifier:
+    """# Verifier object
+    The Verifier checks the digital signatures that Stark Infra sends along with webhook
+    requests, such as Events and PixRequest authorizations.
+    It keeps the Stark Infra public key already decoded and precomputes tables of multiples
+    of the curve generator and of the public key, so each verification costs a sequence of
+    table lookups and additions instead of full scalar multiplications.
+    When a signature does not match, the public key is fetched again, at most once every
+    refresh_interval seconds, in case it has been rotated.
+    Fetched public keys are kept per environment of the user, so sandbox and production
+    webhooks may be verified by the same Verifier.
+    All parse functions use a process-wide Verifier by default.
+    ## Parameters (optional):
+    - public_key [string, default None]: Stark Infra public key in PEM format, used in every environment until it is refreshed. Fetched from the API on first use if None
+    - refresh_interval [integer, default 60]: minimum number of seconds between public key refreshes. ex: 60
+    - user [Organization/Project object, default None]: Organization or Project object used to fetch the public key. Not necessary if starkinfra.user was set before the first verification.
+    """
+
+    def __init__(self, public_key=None, refresh_interval=60, user=None):
+        self.refresh_interval = refresh_interval
+        self.user = user
+        self._lock = Lock()
+        self._keys = {}
+        self._updated = {}
+        self._default = None
+        self._default_updated = None
+        if public_key:
+            self._default = _Key(PublicKey.fromPem(public_key))
+            self._default_updated = time()
+
+    def verify(self, content, signature, user=None, **request):
+        """# Verify a signed content
+        ## Parameters (required):
+        - content [string]: content received at your endpoint (not parsed)
+        - signature [string]: base-64 digital signature received at request header "Digital-Signature"
+        ## Return:
+        - verified content string. A starkinfra.error.InvalidSignatureError is raised if the signature does not match
+        """
+        try:
+            signature = Signature.fromBase64(signature)
+        except:
+            raise InvalidSignatureError("The provided signature is not valid")
+
+        key = self._get_key(user=user, **request)
+        if _is_signature_valid(content=content, signature=signature, key=key):
+            return content
+
+        key = self._refresh_key(key, user=user, **request)
+        if key and _is_signature_valid(content=content, signature=signature, key=key):
+            return content
+
+        raise InvalidSignatureError("The provided signature and content do not match the public key")
+
+    def verify_many(self, items, user=None, **request):
+        """# Verify several signed contents at once
+        Useful to replay queued webhook requests. The public key is refreshed at most once for the whole batch.
+        ## Parameters (required):
+        - items [list of tuples]: list of (content, signature) pairs. ex: [(content, signature)]
+        ## Return:
+        - list of booleans indicating whether each signature matches its content
+        """
+        signatures = []
+        for _, signature in items:
+            try:
+                signatures.append(Signature.fromBase64(signature))
+            except:
+                signatures.append(None)
+
+        key = self._get_key(user=user, **request)
+        results = [
+            signature is not None and _is_signature_valid(content=content, signature=signature, key=key)
+            for (content, _), signature in zip(items, signatures)
+        ]
+        if all(results) or all(signature is None for signature in signatures):
+            return results
+
+        key = self._refresh_key(key, user=user, **request)
+        if not key:
+            return results
+        return [
+            result or (signature is not None and _is_signature_valid(content=content, signature=signature, key=key))
+            for result, (content, _), signature in zip(results, items, signatures)
+        ]
+
+    def _cached_key(self, user=None):
+        return self._keys.get(self._environment(user), self._default)
+
+    def _get_key(self, user=None, **request):
+        key = self._cached_key(user=user)
+        if key is not None:
+            return key
+        environment = self._environment(user)
+        with self._lock:
+            if environment not in self._keys:
+                self._set_key(environment, self._fetch_key(user=user, **request))
+            return self._keys[environment]
+
+    def _refresh_key(self, key, user=None, **request):
+        environment = self._environment(user)
+        with self._lock:
+            current = self._keys.get(environment, self._default)
+            if current is not key:
+                return current
+            updated = self._updated.get(environment, self._default_updated)
+            if updated and time() - updated < self.refresh_interval:
+                return None
+            public_key = self._fetch_key(user=user, **request)
+            if key is not None and public_key.toPem() == key.public_key.toPem():
+                self._updated[environment] = time()
+                return None
+            self._set_key(environment, public_key)
+            return self._keys[environment]
+
+    def _fetch_key(self, user=None, **request):
+        pem = rest.get_raw(
+            path="/public-key",
+            user=user or self.user,
+            limit=1,
+            **request
+        )["publicKeys"][0]["content"]
+        return PublicKey.fromPem(pem)
+
+    def _set_key(self, environment, public_key):
+        self._keys[environment] = _Key(public_key)
+        self._updated[environment] = time()
+
+    def _environment(self, user):
+        return getattr(user or self.user or starkinfra.user, "environment", None)
+
+
+class _Key:
+
+    def __init__(self, public_key):
+        curve = public_key.curve
+        self.public_key = public_key
+        self.curve = curve
+        self.is_valid = curve.contains(public_key.point)
+        self.generator_table = _generator_table(curve)
+        self.key_table = _table(curve, public_key.point)
+
+
+def _is_signature_valid(content, signature, key):
+    if _verify(content, signature, key):
+        return True
+
+    try:
+        normalized = dumps(loads(content), sort_keys=True)
+    except:
+        return False
+
+    return _verify(normalized, signature, key)
+
+
+def _verify(message, signature, key):
+    curve = key.curve
+    N, P = curve.N, curve.P
+    r, s = signature.r, signature.s
+    if not key.is_valid or not 1 <= r <= N - 1 or not 1 <= s <= N - 1:
+        return False
+
+    if not isinstance(message, bytes):
+        message = message.encode("utf-8")
+    number = numberFromByteString(sha256(message).digest(), curve.nBitLength)
+    inverse = Math.inv(s, N)
+
+    x, y, z = _multiply(key.generator_table, (number * inverse) % N, 0, 0, 0, curve)
+    x, y, z = _multiply(key.key_table, (r * inverse) % N, x, y, z, curve)
+    if z == 0:
+        return False
+
+    z2 = (z * z) % P
+    candidate = r
+    while candidate < P:
+        if (candidate * z2 - x) % P == 0:
+            return True
+        candidate += N
+    return False
@@ -50,16 +50,18 @@ def get(id, user=None):
     return rest.get_id(resource=_resource, id=id, user=user)
 
 
-def query(limit=None, user=None):
+def query(limit=None, prefetch=None, compact=False, user=None):
     """# Retrieve Webhook subcriptions
     Receive a generator of Webhook subcription objects previously created in the Stark Infra API
     ## Parameters (optional):
     - limit [integer, default None]: maximum number of objects to be retrieved. Unlimited if None. ex: 35
+    - prefetch [integer, default None]: number of pages to fetch on a background thread while the current page is processed. Disabled if None. ex: 2
+    - compact [bool, default False]: if True, objects are built with __slots__ instead of a per-instance __dict__, using considerably less memory. Compact objects are not instances of the resource class. ex: True
     - user [Organization/Project object, default None]: Organization or Project object. Not necessary if starkinfra.user was set before function call.
     ## Return:
     - generator of Webhook objects with updated attributes
     """
-    return rest.get_stream(resource=_resource, limit=limit, user=user)
+    return rest.get_stream(resource=_resource, limit=limit, prefetch=prefetch, compact=compact, user=user)
 
 
 def page(cursor=None, limit=None, user=None):
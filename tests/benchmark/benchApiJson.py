@@ -0,0 +1,41 @@
+from timeit import timeit
+import starkcore.utils.api as reference
+from starkinfra.utils import api
+from starkinfra.pixrequest.__pixrequest import _resource as _pixRequestResource
+from starkinfra.issuingpurchase.__issuingpurchase import _resource as _issuingPurchaseResource
+from starkinfra.creditnote.__creditnote import _resource as _creditNoteResource
+from starkinfra.creditnote.invoice import __invoice as _invoice
+from starkinfra.creditnote import __creditnote as _creditNote
+from tests.utils.resources import pixRequestJson, issuingPurchaseJson, creditNoteJson
+
+
+def measure(function, number=200):
+    return timeit(function, number=number) / number * 1e3
+
+
+def decode(module, resource, page):
+    # nested CreditNote objects are decoded by the constructors, so the modules are switched too
+    _creditNote.from_api_json = _invoice.from_api_json = module.from_api_json
+    return measure(lambda: [module.from_api_json(resource, json) for json in page])
+
+
+def main():
+    print("{:<16} {:>14} {:>14} {:>14} {:>14}".format("page of 100", "decode", "cached", "encode", "cached"))
+    for resource, json in [
+        (_pixRequestResource, pixRequestJson),
+        (_issuingPurchaseResource, issuingPurchaseJson),
+        (_creditNoteResource, creditNoteJson),
+    ]:
+        page = [dict(json, id=str(5137269514043392 + index)) for index in range(100)]
+        entities = [api.from_api_json(resource, json) for json in page]
+        print("{:<16} {:>11.3f} ms {:>11.3f} ms {:>11.3f} ms {:>11.3f} ms".format(
+            resource["name"],
+            decode(reference, resource, page),
+            decode(api, resource, page),
+            measure(lambda: [reference.api_json(entity) for entity in entities]),
+            measure(lambda: [api.api_json(entity) for entity in entities]),
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+from timeit import timeit
+from random import choice
+from datetime import datetime
+import starkinfra
+
+
+_randomSource = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+
+
+def reference(bank_code):
+    return "E{bank_code}{date}{randomString}".format(
+        bank_code=bank_code,
+        date=datetime.utcnow().strftime("%Y%m%d%H%M"),
+        randomString=''.join(choice(_randomSource) for _ in range(11)),
+    )
+
+
+def main(n=100000):
+    print("{:<32} {:>12} {:>16}".format("{} ids".format(n), "time", "ids per second"))
+    for name, function in [
+        ("random.choice per id", lambda: [reference("20018183") for _ in range(n)]),
+        ("endtoendid.create per id", lambda: [starkinfra.endtoendid.create("20018183") for _ in range(n)]),
+        ("endtoendid.create_many", lambda: starkinfra.endtoendid.create_many("20018183", n)),
+    ]:
+        seconds = timeit(function, number=3) / 3
+        print("{:<32} {:>9.1f} ms {:>16,.0f}".format(name, seconds * 1e3, n / seconds))
+
+
+if __name__ == "__main__":
+    main()
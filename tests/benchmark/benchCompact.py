@@ -0,0 +1,33 @@
+from gc import collect
+from tracemalloc import start, stop, take_snapshot
+from starkcore.utils.api import from_api_json
+from starkinfra.utils.compact import compact
+from starkinfra.pixrequest.__pixrequest import _resource as _pixRequestResource
+from starkinfra.issuingpurchase.__issuingpurchase import _resource as _issuingPurchaseResource
+from tests.utils.resources import pixRequestJson, issuingPurchaseJson
+
+
+def measure(resource, json, n=20000):
+    collect()
+    start()
+    before = take_snapshot()
+    entities = [from_api_json(resource, json) for _ in range(n)]
+    after = take_snapshot()
+    stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del entities
+    return size / n
+
+
+def main():
+    print("{:<16} {:>12} {:>12}".format("resource", "regular", "compact"))
+    for resource, json in [(_pixRequestResource, pixRequestJson), (_issuingPurchaseResource, issuingPurchaseJson)]:
+        print("{:<16} {:>10.0f} B {:>10.0f} B".format(
+            resource["name"],
+            measure(resource, json),
+            measure(compact(resource), json),
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import starkinfra
+from time import time, sleep
+from copy import deepcopy
+from urllib.parse import urlsplit, parse_qs
+from ellipticcurve import PrivateKey
+from tests.utils.server import startServer, JsonHandler, LocalTransport
+from tests.utils.resources import pixRequestJson
+
+
+class LatencyHandler(JsonHandler):
+
+    latency = 0.02
+
+    def do_GET(self):
+        sleep(self.latency)
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        if "ids" not in query:
+            json = deepcopy(pixRequestJson)
+            json["id"] = url.path.split("/")[-1]
+            return self.respond({"request": json})
+        entities = []
+        for id in query["ids"][0].split(","):
+            json = deepcopy(pixRequestJson)
+            json["id"] = id
+            entities.append(json)
+        self.respond({"requests": entities, "cursor": None})
+
+
+def main():
+    server, url = startServer(handler=LatencyHandler)
+    starkinfra.transport = LocalTransport(url=url, max_connections=8)
+    user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+    ids = [str(5000000000000000 + i) for i in range(1000)]
+    print("{} PixRequests, {:.0f} ms server latency".format(len(ids), LatencyHandler.latency * 1000))
+
+    start = time()
+    for id in ids[:100]:
+        starkinfra.pixrequest.get(id, user=user)
+    print("{:<24} {:>8.2f} s (estimated from the first 100)".format("get in a loop", (time() - start) * len(ids) / 100))
+
+    for workers in [1, 4, 8]:
+        start = time()
+        requests = starkinfra.pixrequest.get_many(ids, workers=workers, user=user)
+        assert [request.id for request in requests] == ids
+        print("{:<24} {:>8.2f} s".format("get_many(workers={})".format(workers), time() - start))
+
+    starkinfra.transport.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+from sys import executable
+from subprocess import check_output
+
+
+def measure(code, number=20):
+    script = "from time import perf_counter\nstart = perf_counter()\n{code}\nprint(perf_counter() - start)".format(code=code)
+    times = sorted(float(check_output([executable, "-c", script])) for _ in range(number))
+    return times[len(times) // 2] * 1e3
+
+
+def main():
+    print("{:<40} {:>10}".format("statement", "median"))
+    for name, code in [
+        ("import starkinfra", "import starkinfra"),
+        ("starkinfra.pixrequest", "import starkinfra\nstarkinfra.pixrequest.query"),
+        ("starkinfra.event", "import starkinfra\nstarkinfra.event.parse"),
+        ("every resource", "import starkinfra\n[getattr(starkinfra, name) for name in starkinfra.__all__]"),
+    ]:
+        print("{:<40} {:>7.1f} ms".format(name, measure(code)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import starkinfra
+from copy import deepcopy
+from time import time, sleep
+from threading import Lock, Thread
+from ellipticcurve import PrivateKey
+from tests.utils.server import startServer, JsonHandler, LocalTransport
+from tests.utils.resources import pixRequestJson
+
+
+class LimitedHandler(JsonHandler):
+
+    rate = 50
+    tokens = 10
+    updated = time()
+    lock = Lock()
+
+    def do_GET(self):
+        with self.lock:
+            now = time()
+            LimitedHandler.tokens = min(10, self.tokens + (now - self.updated) * self.rate)
+            LimitedHandler.updated = now
+            allowed = self.tokens >= 1
+            if allowed:
+                LimitedHandler.tokens -= 1
+        if not allowed:
+            return self.respond({"errors": [{"code": "tooManyRequests"}]}, status=429, headers={"Retry-After": "1"})
+        self.respond({"request": deepcopy(pixRequestJson)})
+
+
+def run(user, threads=16, seconds=5):
+    counts = {"success": 0, "error": 0}
+    lock = Lock()
+    end = time() + seconds
+
+    def work():
+        while time() < end:
+            try:
+                starkinfra.pixrequest.get("5137269514043392", user=user)
+                result = "success"
+            except Exception:
+                result = "error"
+                sleep(0.1)
+            with lock:
+                counts[result] += 1
+
+    workers = [Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return counts["success"] / float(seconds), counts["error"]
+
+
+def main():
+    server, url = startServer(handler=LimitedHandler)
+    starkinfra.transport = LocalTransport(url=url)
+    user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+    print("server limit: {} requests per second, 16 threads".format(LimitedHandler.rate))
+    print("{:<24} {:>14} {:>8} {:>8} {:>12}".format("client", "successes/s", "errors", "429s", "throttled"))
+
+    rate, errors = run(user)
+    print("{:<24} {:>14.1f} {:>8} {:>8} {:>12}".format("no rate limiter", rate, errors, errors, "-"))
+
+    for limit in [40, 50, 100]:
+        sleep(1)
+        starkinfra.rate_limiter = starkinfra.RateLimiter(rate=limit, burst=1)
+        rate, errors = run(user)
+        print("{:<24} {:>14.1f} {:>8} {:>8} {:>10.1f} s".format(
+            "RateLimiter(rate={})".format(limit), rate, errors, starkinfra.rate_limiter.rejected,
+            starkinfra.rate_limiter.throttled_time,
+        ))
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
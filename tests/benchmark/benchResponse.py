@@ -0,0 +1,69 @@
+from json import dumps
+from importlib import import_module
+from timeit import timeit
+from starkcore.utils.api import api_json
+import starkinfra
+
+
+template = import_module("starkinfra.utils.template")
+
+
+def pixRequestReference():
+    return dumps(api_json({"authorization": {"status": "denied", "reason": "invalidAccountNumber"}}))
+
+
+def issuingPurchaseReference():
+    return dumps(api_json({"authorization": {"status": "approved", "amount": 1000, "reason": None, "tags": ["purchase/123"]}}))
+
+
+def instantReference():
+    return dumps(api_json({
+        "version": 1, "created": "2022-02-15T20:45:08.210009+00:00", "keyId": "+5511989898989", "status": "paid",
+        "reconciliationId": "b77f5236-7ab9-4487-9f95-66ee6eaf1781", "amount": 100, "cashierType": None,
+        "cashierBankCode": None, "cashAmount": None, "expiration": 3600, "senderName": None, "senderTaxId": None,
+        "amountType": "fixed", "description": "Coffee",
+    }))
+
+
+def pixRequest():
+    return starkinfra.pixrequest.response(status="denied", reason="invalidAccountNumber")
+
+
+def issuingPurchase():
+    return starkinfra.issuingpurchase.response(status="approved", amount=1000, tags=["purchase/123"])
+
+
+def instant():
+    return starkinfra.dynamicbrcode.response_instant(
+        version=1, created="2022-02-15T20:45:08.210009+00:00", key_id="+5511989898989", status="paid",
+        reconciliation_id="b77f5236-7ab9-4487-9f95-66ee6eaf1781", amount=100, expiration=3600, amount_type="fixed",
+        description="Coffee",
+    )
+
+
+def measure(function, number=100000):
+    return timeit(function, number=number) / number * 1e6
+
+
+def main():
+    fastDumps = template._fast_dumps
+    print("{:<26} {:>10} {:>10} {:>10}".format("response", "api_json", "json", "orjson" if fastDumps else "-"))
+    for name, reference, function in [
+        ("pixrequest.response", pixRequestReference, pixRequest),
+        ("issuingpurchase.response", issuingPurchaseReference, issuingPurchase),
+        ("dynamicbrcode.instant", instantReference, instant),
+    ]:
+        template._fast_dumps = None
+        standard = measure(function)
+        template._fast_dumps = fastDumps
+        fast = measure(function) if fastDumps else None
+        print("{:<26} {:>7.2f} us {:>7.2f} us {:>10}".format(
+            name,
+            measure(reference),
+            standard,
+            "{:.2f} us".format(fast) if fast is not None else "-",
+        ))
+
+
+if __name__ == "__main__":
+    main()
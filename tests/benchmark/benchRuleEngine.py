@@ -0,0 +1,76 @@
+from time import perf_counter
+from random import Random
+from starkcore.utils.api import from_api_json
+from starkinfra import IssuingCard, IssuingHolder, IssuingRule, MerchantCategory, MerchantCountry, CardMethod
+from starkinfra.issuingrule import RuleEngine
+from starkinfra.issuingpurchase.__issuingpurchase import _resource as _purchaseResource
+from tests.utils.resources import issuingPurchaseJson
+
+
+categories = ["fastFoodRestaurants", "eatingPlacesRestaurants", "veterinaryServices", "airlines", "hotels"]
+countries = ["BRA", "USA", "ARG", "PRT"]
+methods = ["chip", "token", "server", "manual", "magstripe", "contactless"]
+
+
+def engine(cards, random):
+    engine = RuleEngine()
+    for index in range(cards):
+        rules = [
+            IssuingRule(
+                name="Rule {index}".format(index=rule),
+                amount=random.randint(10000, 1000000),
+                interval=random.choice(["instant", "day", "week", "month", "year", "lifetime"]),
+                categories=[MerchantCategory(code=code) for code in random.sample(categories, 3)],
+                countries=[MerchantCountry(code=code) for code in random.sample(countries, 2)],
+                methods=[CardMethod(code=code) for code in random.sample(methods, 4)],
+            )
+            for rule in range(random.randint(1, 5))
+        ]
+        engine.add_card(IssuingCard(
+            id=str(index), holder_id=str(index % 100), holder_name="Tony Stark", holder_tax_id="012.345.678-90",
+            holder_external_id=str(index), status="active", rules=rules,
+        ))
+    for index in range(100):
+        engine.add_holder(IssuingHolder(
+            id=str(index), name="Tony Stark", tax_id="012.345.678-90", external_id=str(index), status="active",
+            rules=[IssuingRule(name="Monthly", amount=100000000, interval="month")],
+        ))
+    return engine
+
+
+def purchases(cards, count, random):
+    result = []
+    for _ in range(count):
+        json = dict(issuingPurchaseJson)
+        json.update({
+            "cardId": str(random.randrange(cards)),
+            "amount": random.randint(100, 50000),
+            "merchantCategoryCode": random.choice(categories),
+            "merchantCountryCode": random.choice(countries),
+            "methodCode": random.choice(methods),
+            "created": None,
+        })
+        result.append(from_api_json(_purchaseResource, json))
+    return result
+
+
+def main(cards=10000, count=100000):
+    random = Random(0)
+    rules = engine(cards, random)
+    synthetic = purchases(cards, count, random)
+
+    start = perf_counter()
+    decisions = [rules.evaluate(purchase) for purchase in synthetic]
+    elapsed = perf_counter() - start
+
+    approved = sum(1 for decision in decisions if decision["status"] == "approved")
+    print("{count} purchases on {cards} cards: {average:.1f} us per evaluation, {approved} approved".format(
+        count=count,
+        cards=cards,
+        average=elapsed / count * 1e6,
+        approved=approved,
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+from timeit import timeit
+from importlib import import_module
+from ellipticcurve import Ecdsa, PrivateKey
+import starkinfra
+
+
+signer = import_module("starkinfra.utils.signer")
+request = import_module("starkinfra.utils.request")
+
+
+def measure(function, number=300):
+    function()
+    return number / timeit(function, number=number)
+
+
+def main():
+    privateKey = PrivateKey()
+    user = starkinfra.Project(environment="sandbox", id="5656565656565656", private_key=privateKey.toPem())
+    message = "project/5656565656565656:1670000000.0:"
+    key = signer.Signer(user.pem)
+    fastKey, key._fast_key = key._fast_key, None
+
+    def get():
+        return request.prepare(host="infra", sdk_version="0.4.0", user=user, method="GET", path="pix-request/5656565656565656")
+
+    print("{:<40} {:>16}".format("signature", "per second"))
+    print("{:<40} {:>16,.0f}".format("PEM decoded on every call", measure(
+        lambda: Ecdsa.sign(message=message, privateKey=user.private_key()).toBase64()
+    )))
+    print("{:<40} {:>16,.0f}".format("decoded key", measure(lambda: Ecdsa.sign(message=message, privateKey=key.private_key).toBase64())))
+    print("{:<40} {:>16,.0f}".format("Signer", measure(lambda: key.sign(message))))
+    if fastKey is not None:
+        key._fast_key = fastKey
+        print("{:<40} {:>16,.0f}".format("Signer with cryptography", measure(lambda: key.sign(message), number=3000)))
+    print("{:<40} {:>16,.0f}".format("pixrequest.get request preparation", measure(get)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import starkinfra
+from copy import deepcopy
+from time import time, sleep
+from threading import Lock, Thread
+from multiprocessing import Process, Queue
+from ellipticcurve import PrivateKey
+from tests.utils.server import startServer, startHttp2Server, JsonHandler, LocalTransport, LocalHttp2Transport
+from tests.utils.resources import pixRequestJson
+
+
+latency = 0.02
+
+
+def respond(method, path, body):
+    json = deepcopy(pixRequestJson)
+    json["id"] = path.split("?")[0].split("/")[-1]
+    return 200, {"request": json}
+
+
+class LatencyHandler(JsonHandler):
+
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        sleep(latency)
+        self.respond(respond("GET", self.path, None)[1])
+
+
+def run(user, threads, seconds=3):
+    counts = {"success": 0, "error": 0}
+    lock = Lock()
+    end = time() + seconds
+
+    def work():
+        while time() < end:
+            try:
+                starkinfra.pixrequest.get("5137269514043392", user=user)
+                result = "success"
+            except Exception:
+                result = "error"
+            with lock:
+                counts[result] += 1
+
+    workers = [Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return counts["success"] / float(seconds), counts["error"]
+
+
+def serve(urls):
+    _, http1Url = startServer(handler=LatencyHandler)
+    _, http2Url = startHttp2Server(respond=respond, latency=latency)
+    urls.put((http1Url, http2Url))
+    while True:
+        sleep(60)
+
+
+def main():
+    user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+    urls = Queue()
+    servers = Process(target=serve, args=(urls,))
+    servers.daemon = True
+    servers.start()
+    http1Url, http2Url = urls.get()
+    transports = [
+        ("HttpTransport()", lambda: LocalTransport(url=http1Url)),
+        ("HttpTransport(128)", lambda: LocalTransport(url=http1Url, max_connections=128)),
+        ("Http2Transport()", lambda: LocalHttp2Transport(url=http2Url)),
+    ]
+
+    print("{:.0f} ms server latency, requests per second by number of threads, * when some requests failed".format(latency * 1000))
+    print("{:<24} {:>10} {:>10} {:>10}".format("transport", 1, 16, 128))
+    for name, transport in transports:
+        rates = []
+        for threads in [1, 16, 128]:
+            starkinfra.transport = transport()
+            rate, errors = run(user, threads)
+            rates.append("{:.0f}{}".format(rate, "*" if errors else ""))
+            starkinfra.transport.close()
+        print("{:<24} {:>10} {:>10} {:>10}".format(name, *rates))
+
+    servers.terminate()
+
+
+if __name__ == "__main__":
+    main()
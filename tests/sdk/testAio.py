@@ -0,0 +1,54 @@
+import starkinfra
+import starkinfra.aio
+from asyncio import run, gather
+from unittest import TestCase, main
+from tests.utils.user import exampleProject
+from tests.utils.pixRequest import generateExamplePixRequestJson
+
+
+starkinfra.user = exampleProject
+
+
+class TestAioPixRequestPost(TestCase):
+
+    def test_success(self):
+        pix_requests = run(starkinfra.aio.pixrequest.create(generateExamplePixRequestJson(n=5)))
+        self.assertEqual(len(pix_requests), 5)
+        for pix_request in pix_requests:
+            print(pix_request.id)
+
+
+class TestAioPixRequestQuery(TestCase):
+
+    def test_success(self):
+        async def query():
+            return [request async for request in starkinfra.aio.pixrequest.query(limit=150)]
+
+        pix_requests = run(query())
+        self.assertEqual(len(pix_requests), 150)
+        self.assertEqual(len(set(request.id for request in pix_requests)), 150)
+
+
+class TestAioPixRequestGet(TestCase):
+
+    def test_success(self):
+        ids = [request.id for request in starkinfra.pixrequest.query(limit=10)]
+
+        async def get():
+            return await gather(*[starkinfra.aio.pixrequest.get(id) for id in ids])
+
+        pix_requests = run(get())
+        self.assertEqual([request.id for request in pix_requests], ids)
+
+
+class TestAioEventPage(TestCase):
+
+    def test_success(self):
+        events, cursor = run(starkinfra.aio.event.page(limit=2))
+        self.assertLessEqual(len(events), 2)
+        for event in events:
+            print(event)
+
+
+if __name__ == '__main__':
+    main()
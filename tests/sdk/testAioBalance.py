@@ -0,0 +1,69 @@
+import starkinfra
+import starkinfra.aio
+from asyncio import run
+from unittest import TestCase, main
+from ellipticcurve import PrivateKey
+from tests.utils.server import startServer, JsonHandler, LocalTransport, LocalAsyncTransport
+
+
+class BalanceHandler(JsonHandler):
+
+    def do_GET(self):
+        self.respond({"balances": [{
+            "id": "5155165527080960",
+            "amount": 150000,
+            "currency": "BRL",
+            "updated": "2022-03-01T12:00:00.000000+00:00",
+        }]})
+
+
+class TestAioBalance(TestCase):
+
+    def setUp(self):
+        self.server, url = startServer(handler=BalanceHandler)
+        self.transport = LocalAsyncTransport(url=url)
+        starkinfra.aio.transport = self.transport
+        self.user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+
+    def tearDown(self):
+        starkinfra.aio.transport = None
+        self.server.shutdown()
+
+    def get(self, module):
+        async def get():
+            try:
+                return await module.get(user=self.user)
+            finally:
+                self.transport.close()
+        return run(get())
+
+    def test_pix_balance(self):
+        balance = self.get(starkinfra.aio.pixbalance)
+        self.assertIsInstance(balance, starkinfra.PixBalance)
+        self.assertEqual(balance.amount, 150000)
+
+    def test_issuing_balance(self):
+        balance = self.get(starkinfra.aio.issuingbalance)
+        self.assertIsInstance(balance, starkinfra.IssuingBalance)
+        self.assertEqual(balance.amount, 150000)
+
+    def test_use_transport(self):
+        starkinfra.aio.transport = None
+
+        async def get():
+            try:
+                with starkinfra.use_transport(self.transport):
+                    return await starkinfra.aio.pixbalance.get(user=self.user)
+            finally:
+                self.transport.close()
+        self.assertEqual(run(get()).amount, 150000)
+
+    def test_sync_transport(self):
+        with starkinfra.use_transport(LocalTransport(url=self.transport.url)) as transport:
+            balance = self.get(starkinfra.aio.pixbalance)
+        transport.close()
+        self.assertEqual(balance.amount, 150000)
+
+
+if __name__ == '__main__':
+    main()
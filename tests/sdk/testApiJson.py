@@ -0,0 +1,80 @@
+from copy import deepcopy
+from datetime import date, datetime, timedelta
+from unittest import TestCase, main
+import starkcore.utils.api as reference
+import starkinfra
+from starkinfra.utils.api import from_api_json, api_json
+from starkinfra.utils.compact import compact
+from starkinfra.pixrequest.__pixrequest import _resource as _pixRequestResource
+from starkinfra.issuingpurchase.__issuingpurchase import _resource as _issuingPurchaseResource
+from starkinfra.creditnote.__creditnote import _resource as _creditNoteResource
+from tests.utils.resources import pixRequestJson, issuingPurchaseJson, creditNoteJson
+
+
+resources = [
+    (_pixRequestResource, pixRequestJson),
+    (_issuingPurchaseResource, issuingPurchaseJson),
+    (_creditNoteResource, creditNoteJson),
+]
+
+
+class TestFromApiJson(TestCase):
+
+    def test_success(self):
+        for resource, json in resources:
+            entity = from_api_json(resource, json)
+            expected = reference.from_api_json(resource, json)
+            self.assertIs(type(entity), resource["class"])
+            self.assertEqual(repr(entity), repr(expected))
+
+    def test_unknown_and_missing_keys(self):
+        json = deepcopy(pixRequestJson)
+        json["someNewField"] = "ignored"
+        del json["description"]
+        for _ in range(2):
+            entity = from_api_json(_pixRequestResource, json)
+            self.assertIsNone(entity.description)
+            self.assertFalse(hasattr(entity, "some_new_field"))
+            self.assertEqual(repr(entity), repr(reference.from_api_json(_pixRequestResource, json)))
+
+    def test_compact(self):
+        for resource, json in resources:
+            entity = from_api_json(compact(resource), json)
+            self.assertEqual(repr(entity), repr(reference.from_api_json(resource, json)))
+
+
+class TestApiJson(TestCase):
+
+    def test_success(self):
+        for resource, json in resources:
+            entity = reference.from_api_json(resource, json)
+            self.assertEqual(api_json(entity), reference.api_json(entity))
+            self.assertEqual(list(api_json(entity)), list(reference.api_json(entity)))
+
+    def test_changed_attributes(self):
+        entity = reference.from_api_json(_pixRequestResource, pixRequestJson)
+        api_json(entity)
+        entity.extra_field = "extra"
+        entity.description = None
+        self.assertEqual(api_json(entity), reference.api_json(entity))
+        self.assertIn("extraField", api_json(entity))
+
+    def test_compact(self):
+        for resource, json in resources[:2]:
+            entity = from_api_json(compact(resource), json)
+            self.assertEqual(api_json(entity), reference.api_json(entity))
+
+    def test_values(self):
+        json = {
+            "moment": datetime(2022, 2, 15, 20, 45, 8),
+            "day": date(2022, 2, 15),
+            "expiration": timedelta(hours=1),
+            "nested_dict": {"snake_key": [1, None, "a"]},
+            "rules": [starkinfra.IssuingRule(name="Daily", amount=1000, interval="day")],
+            "empty": None,
+        }
+        self.assertEqual(api_json(json), reference.api_json(json))
+
+
+if __name__ == '__main__':
+    main()
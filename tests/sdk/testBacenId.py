@@ -0,0 +1,39 @@
+from re import match
+from unittest import TestCase, main
+from importlib import import_module
+import starkinfra
+
+
+bacenid = import_module("starkinfra.utils.bacenid")
+
+
+class TestBacenIdCreateMany(TestCase):
+
+    def test_success(self):
+        for module, prefix in [(starkinfra.endtoendid, "E"), (starkinfra.returnid, "D")]:
+            ids = module.create_many("20018183", 10000)
+            self.assertEqual(len(ids), 10000)
+            self.assertEqual(len(set(ids)), 10000)
+            for id in ids:
+                self.assertTrue(match(prefix + r"20018183\d{12}[a-zA-Z0-9]{11}$", id), id)
+
+    def test_single(self):
+        self.assertTrue(match(r"E20018183\d{12}[a-zA-Z0-9]{11}$", starkinfra.endtoendid.create("20018183")))
+        self.assertTrue(match(r"D20018183\d{12}[a-zA-Z0-9]{11}$", starkinfra.returnid.create("20018183")))
+
+    def test_empty(self):
+        self.assertEqual(starkinfra.endtoendid.create_many("20018183", 0), [])
+
+    def test_duplicates(self):
+        random_strings = bacenid._random_strings
+        batches = [["a" * 11, "b" * 11, "a" * 11], ["a" * 11], ["c" * 11]]
+        bacenid._random_strings = lambda n: batches.pop(0)
+        try:
+            ids = starkinfra.endtoendid.create_many("20018183", 3)
+        finally:
+            bacenid._random_strings = random_strings
+        self.assertEqual([id[-11:] for id in ids], ["a" * 11, "b" * 11, "c" * 11])
+
+
+if __name__ == '__main__':
+    main()
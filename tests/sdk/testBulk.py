@@ -0,0 +1,54 @@
+import starkinfra
+from unittest import TestCase, main
+from tests.utils.user import exampleProject
+from tests.utils.pixRequest import generateExamplePixRequestJson
+
+
+starkinfra.user = exampleProject
+
+
+class TestBulkPixRequestPost(TestCase):
+
+    def test_success(self):
+        pix_requests = generateExamplePixRequestJson(n=250)
+        result = starkinfra.bulk.create(starkinfra.pixrequest, pix_requests, chunk_size=100, workers=3)
+        self.assertEqual(len(result.created), 250)
+        self.assertEqual(result.errors, {})
+        for index, pix_request in result.created.items():
+            self.assertEqual(pix_request.external_id, pix_requests[index].external_id)
+
+    def test_partial_failure(self):
+        pix_requests = generateExamplePixRequestJson(n=120)
+        pix_requests[7].amount = -1
+        pix_requests[110].amount = -1
+        result = starkinfra.bulk.create(starkinfra.pixrequest, pix_requests, chunk_size=100, workers=2)
+        self.assertEqual(sorted(result.errors), [7, 110])
+        self.assertEqual(len(result.created), 118)
+        for index, errors in result.errors.items():
+            print(index, errors)
+
+
+class FailingModule:
+
+    def __init__(self, failing):
+        self.failing = failing
+
+    def create(self, entities):
+        if any(entity in self.failing for entity in entities):
+            raise ValueError("unexpected response")
+        return ["created " + str(entity) for entity in entities]
+
+
+class TestBulkUnexpectedError(TestCase):
+
+    def test_success(self):
+        entities = list(range(250))
+        result = starkinfra.bulk.create(FailingModule(failing={10, 210}), entities, chunk_size=50, workers=3)
+        self.assertEqual(sorted(set(result.created) | set(result.errors)), entities)
+        self.assertEqual(sorted(result.errors), list(range(0, 50)) + list(range(200, 250)))
+        self.assertIsInstance(result.errors[10][0], ValueError)
+        self.assertEqual(result.created[60], "created 60")
+
+
+if __name__ == '__main__':
+    main()
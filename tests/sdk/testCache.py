@@ -0,0 +1,112 @@
+import os
+import starkinfra
+from copy import deepcopy
+from time import sleep
+from tempfile import mkdtemp
+from threading import Lock
+from unittest import TestCase, main
+from ellipticcurve import PrivateKey
+from tests.utils.server import startServer, JsonHandler, LocalTransport
+from tests.utils.resources import pixRequestJson
+
+
+class PixRequestHandler(JsonHandler):
+
+    requests = 0
+    lock = Lock()
+
+    def do_GET(self):
+        with self.lock:
+            PixRequestHandler.requests += 1
+        id = self.path.split("?")[0].split("/")[-1]
+        json = deepcopy(pixRequestJson)
+        json.update({"id": id, "status": "processing" if id.startswith("1") else "success"})
+        self.respond({"request": json})
+
+
+class TestCache(TestCase):
+
+    def setUp(self):
+        self.server, url = startServer(handler=PixRequestHandler)
+        self.transport = LocalTransport(url=url)
+        self.defaultTransport, starkinfra.transport = starkinfra.transport, self.transport
+        self.user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+        PixRequestHandler.requests = 0
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.transport.close()
+        starkinfra.transport = self.defaultTransport
+        starkinfra.cache = None
+
+    def test_success(self):
+        starkinfra.cache = starkinfra.Cache()
+        for _ in range(5):
+            request = starkinfra.pixrequest.get("5137269514043392", user=self.user)
+            self.assertEqual(request.id, "5137269514043392")
+            self.assertEqual(request.amount, 1000)
+        self.assertEqual(PixRequestHandler.requests, 1)
+        self.assertEqual(starkinfra.cache.hits, 4)
+        self.assertEqual(starkinfra.cache.misses, 1)
+
+    def test_mutation(self):
+        starkinfra.cache = starkinfra.Cache()
+        starkinfra.pixrequest.get("5137269514043392", user=self.user).tags.append("changed")
+        self.assertEqual(starkinfra.pixrequest.get("5137269514043392", user=self.user).tags, [])
+
+    def test_pending_status(self):
+        starkinfra.cache = starkinfra.Cache()
+        for _ in range(3):
+            starkinfra.pixrequest.get("1137269514043392", user=self.user)
+        self.assertEqual(PixRequestHandler.requests, 3)
+        self.assertEqual(starkinfra.cache.skipped, 3)
+
+    def test_user(self):
+        starkinfra.cache = starkinfra.Cache()
+        other = starkinfra.Project(environment="sandbox", id="2", private_key=PrivateKey().toPem())
+        starkinfra.pixrequest.get("5137269514043392", user=self.user)
+        starkinfra.pixrequest.get("5137269514043392", user=other)
+        self.assertEqual(PixRequestHandler.requests, 2)
+
+    def test_rules(self):
+        starkinfra.cache = starkinfra.Cache(rules={"PixReversal": True})
+        starkinfra.pixrequest.get("5137269514043392", user=self.user)
+        starkinfra.pixrequest.get("5137269514043392", user=self.user)
+        self.assertEqual(PixRequestHandler.requests, 2)
+        self.assertEqual(starkinfra.cache.misses, 0)
+
+    def test_ttl(self):
+        starkinfra.cache = starkinfra.Cache(ttls={"PixRequest": 0.1})
+        starkinfra.pixrequest.get("5137269514043392", user=self.user)
+        sleep(0.2)
+        starkinfra.pixrequest.get("5137269514043392", user=self.user)
+        self.assertEqual(PixRequestHandler.requests, 2)
+
+    def test_lru(self):
+        starkinfra.cache = starkinfra.Cache(backend=starkinfra.MemoryBackend(max_size=2))
+        for id in ["5000000000000001", "5000000000000002", "5000000000000001", "5000000000000003", "5000000000000001"]:
+            starkinfra.pixrequest.get(id, user=self.user)
+        self.assertEqual(PixRequestHandler.requests, 3)
+        starkinfra.pixrequest.get("5000000000000002", user=self.user)
+        self.assertEqual(PixRequestHandler.requests, 4)
+        self.assertEqual(starkinfra.cache.backend.evictions, 2)
+
+    def test_disk(self):
+        path = os.path.join(mkdtemp(), "cache.db")
+        starkinfra.cache = starkinfra.Cache(backend=starkinfra.DiskBackend(path, max_size=2))
+        for id in ["5000000000000001", "5000000000000002", "5000000000000001", "5000000000000003"]:
+            starkinfra.pixrequest.get(id, user=self.user)
+        self.assertEqual(PixRequestHandler.requests, 3)
+        starkinfra.cache.backend.close()
+
+        starkinfra.cache = starkinfra.Cache(backend=starkinfra.DiskBackend(path, max_size=2))
+        request = starkinfra.pixrequest.get("5000000000000001", user=self.user)
+        self.assertEqual(request.id, "5000000000000001")
+        self.assertEqual(PixRequestHandler.requests, 3)
+        starkinfra.pixrequest.get("5000000000000002", user=self.user)
+        self.assertEqual(PixRequestHandler.requests, 4)
+        starkinfra.cache.backend.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+import os
+import starkinfra
+from tempfile import mkdtemp
+from threading import Lock
+from unittest import TestCase, main
+from ellipticcurve import PrivateKey
+from tests.utils.server import startServer, JsonHandler, LocalTransport
+
+
+categories = [
+    {"code": "fastFoodRestaurants", "type": "food", "name": "Fast food restaurants", "number": "5814"},
+    {"code": "eatingPlacesRestaurants", "type": "food", "name": "Eating places and restaurants", "number": "5812"},
+    {"code": "veterinaryServices", "type": "pets", "name": "Veterinary services", "number": "742"},
+]
+countries = [
+    {"code": "BRA", "name": "Brazil", "number": "076", "shortCode": "BR"},
+    {"code": "USA", "name": "United States of America", "number": "840", "shortCode": "US"},
+]
+
+
+class CatalogHandler(JsonHandler):
+
+    requests = 0
+    lock = Lock()
+
+    def do_GET(self):
+        with self.lock:
+            CatalogHandler.requests += 1
+        path = self.path.split("?")[0]
+        if path.endswith("merchant-category"):
+            return self.respond({"categories": categories, "cursor": None})
+        if path.endswith("merchant-country"):
+            return self.respond({"countries": countries, "cursor": None})
+        self.respond({"errors": [{"code": "notFound", "message": "not found"}]}, status=404)
+
+
+class TestCatalog(TestCase):
+
+    def setUp(self):
+        self.server, url = startServer(handler=CatalogHandler)
+        self.transport = LocalTransport(url=url)
+        self.defaultTransport, starkinfra.transport = starkinfra.transport, self.transport
+        self.user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+        CatalogHandler.requests = 0
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.transport.close()
+        starkinfra.transport = self.defaultTransport
+
+    def test_success(self):
+        catalog = starkinfra.utils.catalog.Catalog(
+            resource=starkinfra.merchantcategory.catalog.resource,
+            fields=["code", "type", "name", "number"],
+            user=self.user,
+        )
+        self.assertEqual(catalog.get("veterinaryServices").number, "742")
+        self.assertIsNone(catalog.get("unknown"))
+        self.assertEqual([category.code for category in catalog.filter(type="food")], ["fastFoodRestaurants", "eatingPlacesRestaurants"])
+        self.assertEqual([category.code for category in catalog.search("REST")], ["fastFoodRestaurants", "eatingPlacesRestaurants"])
+        self.assertEqual([category.code for category in catalog.search("58")], ["fastFoodRestaurants", "eatingPlacesRestaurants"])
+        self.assertEqual([category.code for category in catalog.search("vet")], ["veterinaryServices"])
+        self.assertEqual(catalog.search("zzz"), [])
+        self.assertEqual(len(catalog), 3)
+        catalog.get("veterinaryServices").name = "changed"
+        self.assertEqual(catalog.get("veterinaryServices").name, "Veterinary services")
+        self.assertEqual(CatalogHandler.requests, 1)
+
+    def test_snapshot(self):
+        path = os.path.join(mkdtemp(), "countries.json")
+        catalog = starkinfra.utils.catalog.Catalog(
+            resource=starkinfra.merchantcountry.catalog.resource,
+            fields=["code", "name", "number", "short_code"],
+            path=path,
+            user=self.user,
+        )
+        self.assertEqual(catalog.load(), 2)
+        self.assertTrue(os.path.exists(path))
+
+        catalog = starkinfra.utils.catalog.Catalog(
+            resource=starkinfra.merchantcountry.catalog.resource,
+            fields=["code", "name", "number", "short_code"],
+            path=path,
+            user=self.user,
+        )
+        self.assertEqual(catalog.get("BRA").short_code, "BR")
+        self.assertEqual(CatalogHandler.requests, 1)
+
+        self.server.shutdown()
+        catalog.refresh_interval = 0
+        self.assertEqual(catalog.filter(short_code="US")[0].code, "USA")
+
+
+if __name__ == '__main__':
+    main()
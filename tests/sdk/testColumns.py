@@ -0,0 +1,71 @@
+import starkinfra
+from copy import deepcopy
+from array import array
+from datetime import datetime
+from unittest import TestCase, main
+from ellipticcurve import PrivateKey
+from tests.utils.user import exampleProject
+from tests.utils.server import startServer, JsonHandler, LocalTransport
+from tests.utils.resources import pixRequestJson
+
+
+starkinfra.user = exampleProject
+
+
+class TestColumnsQuery(TestCase):
+
+    def test_success(self):
+        count = 0
+        for batch in starkinfra.columns.query(starkinfra.pixrequest, fields=["id", "amount", "status", "created"], limit=150):
+            self.assertEqual(set(batch), {"id", "amount", "status", "created"})
+            self.assertIsInstance(batch["amount"], array)
+            self.assertIsInstance(batch["status"], starkinfra.columns.Categorical)
+            self.assertTrue(all(isinstance(created, datetime) for created in batch["created"]))
+            count += len(batch["id"])
+        self.assertEqual(count, 150)
+
+
+class TestColumnsToColumns(TestCase):
+
+    def test_success(self):
+        columns = starkinfra.columns.to_columns(starkinfra.issuingpurchase, limit=150)
+        requests = list(starkinfra.issuingpurchase.query(limit=150))
+        self.assertEqual(list(columns["id"]), [request.id for request in requests])
+        self.assertEqual(list(columns["amount"]), [request.amount for request in requests])
+        self.assertEqual(list(columns["status"]), [request.status for request in requests])
+
+
+class PageHandler(JsonHandler):
+
+    def do_GET(self):
+        requests = []
+        for index in range(3):
+            json = deepcopy(pixRequestJson)
+            json["id"] = str(5137269514043392 + index)
+            requests.append(json)
+        self.respond({"requests": requests, "cursor": None})
+
+
+class TestColumnsTransport(TestCase):
+
+    def setUp(self):
+        self.server, url = startServer(handler=PageHandler)
+        self.transport = LocalTransport(url=url)
+        self.user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.transport.close()
+        starkinfra.rate_limiter = None
+
+    def test_use_transport(self):
+        starkinfra.rate_limiter = starkinfra.RateLimiter()
+        with starkinfra.use_transport(self.transport):
+            columns = starkinfra.columns.to_columns(starkinfra.pixrequest, fields=["id", "amount"], user=self.user)
+        self.assertEqual(list(columns["id"]), ["5137269514043392", "5137269514043393", "5137269514043394"])
+        self.assertEqual(list(columns["amount"]), [1000] * 3)
+        self.assertEqual(starkinfra.rate_limiter.requests, 1)
+
+
+if __name__ == '__main__':
+    main()
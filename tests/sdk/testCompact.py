@@ -0,0 +1,84 @@
+from pkgutil import walk_packages
+from importlib import import_module
+from unittest import TestCase, main
+from starkcore.utils.resource import Resource
+from starkcore.utils.api import from_api_json, api_json
+import starkinfra
+from starkinfra.utils.compact import compact
+from starkinfra.pixrequest.__pixrequest import _resource as _pixRequestResource
+from starkinfra.issuingpurchase.__issuingpurchase import _resource as _issuingPurchaseResource
+from starkinfra.event.__event import Event, _raw_log_resource
+from starkinfra.individualdocument.log.__log import _resource as _individualDocumentLogResource
+from tests.utils.resources import pixRequestJson, issuingPurchaseJson
+
+
+class Transfer(Resource):
+
+    def __init__(self, amount, id=None):
+        Resource.__init__(self, id=id)
+        self._set_amount(amount)
+        setattr(self, "status", "created")
+
+    def _set_amount(self, amount):
+        self.amount = amount
+
+
+_transferResource = {"class": Transfer, "name": "Transfer"}
+
+
+class TestCompactResource(TestCase):
+
+    def test_success(self):
+        for resource, json in [(_pixRequestResource, pixRequestJson), (_issuingPurchaseResource, issuingPurchaseJson)]:
+            regular = from_api_json(resource, json)
+            compacted = from_api_json(compact(resource), json)
+            self.assertEqual(compacted.__dict__, {})
+            self.assertEqual(type(compacted).__name__, resource["name"])
+            self.assertEqual(repr(compacted), repr(regular))
+            self.assertEqual(str(compacted), str(regular))
+            self.assertEqual(api_json(compacted), api_json(regular))
+            self.assertEqual(compacted.created, regular.created)
+
+    def test_raw_log(self):
+        json = {"id": "1", "log": {"id": "2", "type": "created"}, "created": "2022-02-15T20:45:08.210009+00:00",
+                "isDelivered": False, "subscription": "pix-key", "workspaceId": "3"}
+        regular = from_api_json(_raw_log_resource, json)
+        compacted = from_api_json(compact(_raw_log_resource), json)
+        self.assertIsInstance(regular, Event)
+        self.assertIs(compacted.__class__, type(compacted))
+        self.assertEqual(type(compacted).__name__, "Event")
+        self.assertEqual(repr(compacted), repr(regular))
+        self.assertEqual(repr(regular), "Event[1]")
+        self.assertEqual(regular.log, {"id": "2", "type": "created"})
+        self.assertEqual(compacted.log, {"id": "2", "type": "created"})
+
+    def test_unlisted_attributes(self):
+        regular = from_api_json(_transferResource, {"id": "1", "amount": 100})
+        compacted = from_api_json(compact(_transferResource), {"id": "1", "amount": 100})
+        self.assertEqual(compacted.__dict__, {"status": "created"})
+        self.assertEqual(compacted.amount, 100)
+        self.assertEqual(str(compacted), str(regular))
+        self.assertEqual(api_json(compacted), api_json(regular))
+
+    def test_renamed_attribute(self):
+        json = {"id": "1", "type": "created", "errors": [], "created": "2022-02-15T20:45:08.210009+00:00",
+                "document": {"id": "2", "type": "identity-front", "content": "data:image/png;base64,", "status": "created"}}
+        regular = from_api_json(_individualDocumentLogResource, json)
+        compacted = from_api_json(compact(_individualDocumentLogResource), json)
+        self.assertEqual(compacted.__dict__, {})
+        self.assertNotIn("document", dir(compacted))
+        self.assertEqual(str(compacted), str(regular))
+        self.assertEqual(api_json(compacted), api_json(regular))
+
+    def test_all_resources(self):
+        for module in walk_packages(starkinfra.__path__, "starkinfra."):
+            resource = getattr(import_module(module.name), "_resource", None)
+            if isinstance(resource, dict) and "class" in resource:
+                self.assertEqual(compact(resource)["name"], resource["name"])
+
+    def test_cache(self):
+        self.assertIs(compact(_pixRequestResource)["class"], compact(_pixRequestResource)["class"])
+
+
+if __name__ == '__main__':
+    main()
@@ -19,6 +19,15 @@ class TestEventQuery(TestCase):
                 break
 
 
+class TestEventQueryRawLog(TestCase):
+
+    def test_success(self):
+        events = list(starkinfra.event.query(limit=5, decode_log=False))
+        for event in events:
+            self.assertIsInstance(event.log, dict)
+            print(event.subscription, event.log["type"])
+
+
 class TestEventPage(TestCase):
 
     def test_success(self):
@@ -64,6 +73,15 @@ class TesteEventProcess(TestCase):
         )
         print(event)
 
+    def test_success_raw_log(self):
+        event = starkinfra.event.parse(
+            content=self.content,
+            signature=self.valid_signature,
+            decode_log=False,
+        )
+        self.assertEqual(event.log["type"], "failed")
+        self.assertEqual(event.log["request"]["id"], "5137269514043392")
+
     def test_invalid_signature(self):
         with self.assertRaises(InvalidSignatureError):
             starkinfra.event.parse(
@@ -79,6 +97,27 @@ class TesteEventProcess(TestCase):
             )
 
 
+class TestEventParserPool(TestCase):
+
+    def test_success(self):
+        with starkinfra.event.ParserPool(processes=2, max_pending=4) as pool:
+            futures = [
+                pool.submit(content=TesteEventProcess.content, signature=TesteEventProcess.valid_signature)
+                for _ in range(20)
+            ]
+            for future in futures:
+                event = future.result()
+                self.assertEqual(event.id, "5015597159022592")
+                self.assertEqual(event.log.request.id, "5137269514043392")
+
+    def test_invalid_signature(self):
+        with starkinfra.event.ParserPool(processes=2) as pool:
+            with self.assertRaises(InvalidSignatureError):
+                pool.parse(content=TesteEventProcess.content, signature=TesteEventProcess.invalid_signature)
+            with self.assertRaises(InvalidSignatureError):
+                pool.parse(content=TesteEventProcess.content, signature=TesteEventProcess.malformed_signature)
+
+
 class TestEventDelete(TestCase):
 
     def test_success(self):
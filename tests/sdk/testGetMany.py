@@ -0,0 +1,141 @@
+import starkinfra
+import starkinfra.aio
+from asyncio import run
+from copy import deepcopy
+from threading import Lock
+from unittest import TestCase, main
+from ellipticcurve import PrivateKey
+from urllib.parse import urlsplit, parse_qs
+from starkcore.error import InternalServerError
+from tests.utils.server import startServer, JsonHandler, LocalTransport, LocalAsyncTransport
+from tests.utils.resources import pixRequestJson, issuingPurchaseJson
+
+
+class IdsHandler(JsonHandler):
+
+    known = set()
+    queries = []
+    fail = False
+    lock = Lock()
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        with self.lock:
+            IdsHandler.queries.append(query)
+        if self.fail:
+            return self.respond({"errors": []}, status=500)
+        key = "uuids" if "uuids" in query else "ids"
+        ids = query[key][0].split(",")
+        entities = []
+        for id in ids[:int(query["limit"][0])]:
+            if id in self.known and url.path.endswith("/log"):
+                entities.append({"id": id, "purchase": issuingPurchaseJson, "issuingTransactionId": None, "errors": [],
+                                 "type": "approved", "created": "2022-02-15T20:45:08.210009+00:00"})
+            elif id in self.known:
+                json = deepcopy(pixRequestJson)
+                json["id"] = id
+                json["uuid"] = id
+                entities.append(json)
+        self.respond({url.path.split("/")[-1].split("-")[-1] + "s": entities, "cursor": None})
+
+
+class TestGetMany(TestCase):
+
+    def setUp(self):
+        self.server, self.url = startServer(handler=IdsHandler)
+        self.transport = LocalTransport(url=self.url)
+        self.defaultTransport, starkinfra.transport = starkinfra.transport, self.transport
+        self.user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+        self.ids = [str(5000000000000000 + i) for i in range(250)]
+        IdsHandler.known = set(self.ids) - {self.ids[3], self.ids[120]}
+        IdsHandler.queries = []
+        IdsHandler.fail = False
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.transport.close()
+        starkinfra.transport = self.defaultTransport
+
+    def test_success(self):
+        ids = list(reversed(self.ids))
+        requests = starkinfra.pixrequest.get_many(ids, user=self.user)
+        self.assertEqual(len(IdsHandler.queries), 3)
+        self.assertEqual(sorted(len(query["ids"][0].split(",")) for query in IdsHandler.queries), [50, 100, 100])
+        self.assertEqual(len(requests), 250)
+        for id, request in zip(ids, requests):
+            if id in IdsHandler.known:
+                self.assertIsInstance(request, starkinfra.PixRequest)
+                self.assertEqual(request.id, id)
+            else:
+                self.assertIsNone(request)
+        self.assertEqual(requests.missing, [self.ids[120], self.ids[3]])
+
+    def test_duplicates(self):
+        ids = [self.ids[0], self.ids[3], self.ids[0]]
+        requests = starkinfra.pixrequest.get_many(ids, user=self.user)
+        self.assertEqual(IdsHandler.queries[0]["ids"], [",".join(self.ids[:4:3])])
+        self.assertEqual([request and request.id for request in requests], [self.ids[0], None, self.ids[0]])
+        self.assertEqual(requests.missing, [self.ids[3]])
+
+    def test_empty(self):
+        requests = starkinfra.pixrequest.get_many([], user=self.user)
+        self.assertEqual(requests, [])
+        self.assertEqual(requests.missing, [])
+        self.assertEqual(IdsHandler.queries, [])
+
+    def test_uuids(self):
+        brcodes = starkinfra.staticbrcode.get_many(self.ids[:5], user=self.user)
+        self.assertIn("uuids", IdsHandler.queries[0])
+        self.assertEqual([brcode and brcode.uuid for brcode in brcodes], self.ids[:3] + [None] + self.ids[4:5])
+
+    def test_logs(self):
+        logs = starkinfra.issuingpurchase.log.get_many(self.ids[:5], user=self.user)
+        self.assertIn("ids", IdsHandler.queries[0])
+        self.assertIsInstance(logs[0], starkinfra.issuingpurchase.Log)
+        self.assertEqual([log and log.id for log in logs], self.ids[:3] + [None] + self.ids[4:5])
+        self.assertEqual(logs.missing, [self.ids[3]])
+
+    def test_error(self):
+        IdsHandler.fail = True
+        with self.assertRaises(InternalServerError):
+            starkinfra.pixrequest.get_many(self.ids, user=self.user)
+
+    def test_aio(self):
+        transport = LocalAsyncTransport(url=self.url)
+        starkinfra.aio.transport = transport
+
+        async def get():
+            try:
+                return await starkinfra.aio.pixrequest.get_many(self.ids, workers=2, user=self.user)
+            finally:
+                transport.close()
+
+        try:
+            requests = run(get())
+        finally:
+            starkinfra.aio.transport = None
+        self.assertEqual(len(IdsHandler.queries), 3)
+        self.assertEqual([request and request.id for request in requests][:5], self.ids[:3] + [None] + self.ids[4:5])
+        self.assertEqual(requests.missing, [self.ids[3], self.ids[120]])
+
+    def test_aio_logs(self):
+        transport = LocalAsyncTransport(url=self.url)
+        starkinfra.aio.transport = transport
+
+        async def get():
+            try:
+                return await starkinfra.aio.pixkey.log.get_many([], user=self.user), await starkinfra.aio.issuingpurchase.log.get_many(self.ids[:5], user=self.user)
+            finally:
+                transport.close()
+
+        try:
+            empty, logs = run(get())
+        finally:
+            starkinfra.aio.transport = None
+        self.assertEqual(empty, [])
+        self.assertEqual([log and log.id for log in logs], self.ids[:3] + [None] + self.ids[4:5])
+
+
+if __name__ == '__main__':
+    main()
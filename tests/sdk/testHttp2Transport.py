@@ -0,0 +1,118 @@
+import starkinfra
+import starkinfra.utils.rest
+from copy import deepcopy
+from threading import Thread
+from unittest import TestCase, main, skipIf
+from ellipticcurve import PrivateKey
+from starkcore.error import InputErrors
+from tests.utils.server import startServer, startHttp2Server, LocalTransport, LocalHttp2Transport
+from tests.utils.resources import pixRequestJson
+
+try:
+    import h2
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def respond(method, path, body):
+    if method == "POST":
+        return 400, {"errors": [{"code": "invalidJson", "message": "Element 0: invalid amount"}]}
+    json = deepcopy(pixRequestJson)
+    json["id"] = path.split("?")[0].split("/")[-1]
+    return 200, {"request": json}
+
+
+class CountingTransport(starkinfra.Transport):
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.requests = 0
+
+    def request(self, method, url, body=None, headers=None, timeout=None):
+        self.requests += 1
+        return self.transport.request(method=method, url=url, body=body, headers=headers, timeout=timeout)
+
+
+class TestUseTransport(TestCase):
+
+    def setUp(self):
+        self.server, url = startServer()
+        self.transport = LocalTransport(url=url)
+        self.defaultTransport = starkinfra.transport
+        self.user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.transport.close()
+        starkinfra.transport = self.defaultTransport
+
+    def test_success(self):
+        transport = CountingTransport(self.transport)
+        with starkinfra.use_transport(transport):
+            response = starkinfra.utils.rest.get_raw(path="/pix-request/1", user=self.user)
+            content = starkinfra.utils.rest.get_content(resource={"name": "PixStatement"}, id="1", sub_resource_name="csv", user=self.user)
+        self.assertEqual(response["path"], "/v2/pix-request/1")
+        self.assertIn(b"/v2/pix-statement/1/csv", content)
+        self.assertEqual(transport.requests, 2)
+
+    def test_thread(self):
+        starkinfra.transport = CountingTransport(self.transport)
+        transport = CountingTransport(self.transport)
+        with starkinfra.use_transport(transport):
+            thread = Thread(target=starkinfra.utils.rest.get_raw, kwargs={"path": "/pix-request/1", "user": self.user})
+            thread.start()
+            thread.join()
+        starkinfra.utils.rest.get_raw(path="/pix-request/1", user=self.user)
+        self.assertEqual(transport.requests, 0)
+        self.assertEqual(starkinfra.transport.requests, 2)
+
+
+@skipIf(httpx is None, "httpx[http2] is not installed")
+class TestHttp2Transport(TestCase):
+
+    def setUp(self):
+        self.server, url = startHttp2Server(respond=respond, latency=0.2)
+        self.transport = LocalHttp2Transport(url=url)
+        self.defaultTransport, starkinfra.transport = starkinfra.transport, self.transport
+        self.user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+
+    def tearDown(self):
+        self.transport.close()
+        self.server.shutdown()
+        starkinfra.transport = self.defaultTransport
+
+    def test_success(self):
+        request = starkinfra.pixrequest.get("5137269514043392", user=self.user)
+        self.assertEqual(request.id, "5137269514043392")
+        self.assertEqual(self.transport.multiplexed, 1)
+
+    def test_multiplexing(self):
+        ids = [str(5000000000000000 + i) for i in range(32)]
+        requests = [None] * len(ids)
+
+        def get(index):
+            requests[index] = starkinfra.pixrequest.get(ids[index], user=self.user)
+
+        threads = [Thread(target=get, args=(index,)) for index in range(len(ids))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([request.id for request in requests], ids)
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(self.transport.multiplexed, 32)
+
+    def test_error(self):
+        with self.assertRaises(InputErrors) as context:
+            starkinfra.utils.rest.post_multi(resource={"name": "PixRequest"}, entities=[{"amount": -1}], user=self.user)
+        self.assertEqual(context.exception.errors[0].code, "invalidJson")
+
+    def test_stream(self):
+        response = starkinfra.utils.rest.get_content_response(resource={"name": "PixStatement"}, id="1", sub_resource_name="csv", user=self.user)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.json()["request"]["id"], "csv")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+from sys import executable, version_info
+from subprocess import check_output
+from unittest import TestCase, main, skipIf
+from importlib import import_module
+import starkinfra
+
+
+def loadedModules(code):
+    output = check_output([executable, "-c", "import sys\n" + code + "\nprint(' '.join(sorted(sys.modules)))"])
+    return set(module for module in output.decode("utf-8").split() if module.startswith("starkinfra."))
+
+
+class TestLazyImport(TestCase):
+
+    @skipIf(version_info < (3, 7), "the resource packages are imported eagerly before Python 3.7")
+    def test_import(self):
+        self.assertEqual(loadedModules("import starkinfra"), set())
+
+    def test_opt_in(self):
+        modules = loadedModules("import starkinfra")
+        for module in ["utils.http2", "utils.cache", "utils.ratelimiter", "utils.parallel", "utils.columns"]:
+            self.assertNotIn("starkinfra." + module, modules)
+        modules = loadedModules("import starkinfra\nstarkinfra.Cache")
+        self.assertIn("starkinfra.utils.cache", modules)
+
+    def test_event_pool(self):
+        output = check_output([executable, "-c", "import sys, starkinfra.event\nprint('concurrent.futures' in sys.modules)"])
+        self.assertEqual(output.decode("utf-8").strip(), "False")
+
+    @skipIf(version_info >= (3, 7), "the resource packages are imported lazily since Python 3.7")
+    def test_eager_import(self):
+        modules = loadedModules("import starkinfra")
+        self.assertIn("starkinfra.pixrequest.__pixrequest", modules)
+        self.assertIn("starkinfra.utils.endtoendid", modules)
+
+    @skipIf(version_info >= (3, 5), "Http2Transport is available since Python 3.5")
+    def test_minimum_version(self):
+        with self.assertRaises(ImportError):
+            starkinfra.Http2Transport
+
+    @skipIf(version_info < (3, 7), "the resource packages are imported eagerly before Python 3.7")
+    def test_module(self):
+        modules = loadedModules("import starkinfra\nstarkinfra.pixrequest.query")
+        self.assertIn("starkinfra.pixrequest.__pixrequest", modules)
+        self.assertNotIn("starkinfra.pixkey", modules)
+        self.assertNotIn("starkinfra.issuingcard", modules)
+
+    @skipIf(version_info < (3, 7), "the resource packages are imported eagerly before Python 3.7")
+    def test_event(self):
+        modules = loadedModules("import starkinfra\nstarkinfra.Event")
+        self.assertIn("starkinfra.event.__event", modules)
+        self.assertNotIn("starkinfra.pixkey.log.__log", modules)
+        self.assertNotIn("starkinfra.creditnote", modules)
+
+    def test_attributes(self):
+        for name in starkinfra.__all__:
+            if version_info < starkinfra._minimum_versions.get(name, (0,)):
+                continue
+            self.assertTrue(hasattr(starkinfra, name))
+            self.assertIn(name, dir(starkinfra))
+        from starkinfra import PixRequest, IssuingCard, HttpTransport, Cache, columns
+        self.assertIs(PixRequest, import_module("starkinfra.pixrequest.__pixrequest").PixRequest)
+        self.assertIs(IssuingCard, starkinfra.IssuingCard)
+        self.assertIs(HttpTransport, starkinfra.HttpTransport)
+        self.assertIs(Cache, starkinfra.Cache)
+        self.assertIs(columns, starkinfra.columns)
+        self.assertTrue(callable(starkinfra.pixrequest.query))
+
+    def test_unknown(self):
+        with self.assertRaises(AttributeError):
+            starkinfra.PixRequests
+        with self.assertRaises(ImportError):
+            from starkinfra import PixRequests
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+import starkinfra
+from copy import deepcopy
+from unittest import TestCase, main
+from ellipticcurve import PrivateKey
+from starkcore.utils.api import from_api_json
+from starkinfra.issuingpurchase.__issuingpurchase import _resource as _purchaseResource
+from tests.utils.resources import issuingPurchaseJson
+from tests.utils.server import startServer, JsonHandler, LocalTransport
+
+
+class CategoryHandler(JsonHandler):
+
+    requests = 0
+
+    def do_GET(self):
+        CategoryHandler.requests += 1
+        self.respond({"categories": [
+            {"code": "fastFoodRestaurants", "type": "food", "name": "Fast food restaurants", "number": "5814"},
+            {"code": "veterinaryServices", "type": "pets", "name": "Veterinary services", "number": "742"},
+        ], "cursor": None})
+
+
+def purchase(**fields):
+    json = deepcopy(issuingPurchaseJson)
+    json.update({"status": None, "created": None, "issuingTransactionIds": None})
+    json.update(fields)
+    return from_api_json(_purchaseResource, json)
+
+
+def card(rules, status="active", holderId="5656565656565656"):
+    return starkinfra.IssuingCard(
+        id="5630612155105280",
+        holder_id=holderId,
+        holder_name="Tony Stark",
+        holder_tax_id="012.345.678-90",
+        holder_external_id="stark",
+        status=status,
+        rules=rules,
+    )
+
+
+def holder(rules, status="active"):
+    return starkinfra.IssuingHolder(
+        id="5656565656565656",
+        name="Tony Stark",
+        tax_id="012.345.678-90",
+        external_id="stark",
+        status=status,
+        rules=rules,
+    )
+
+
+class TestRuleEngine(TestCase):
+
+    def test_amount(self):
+        engine = starkinfra.issuingrule.RuleEngine()
+        engine.add_card(card([starkinfra.IssuingRule(name="Daily", amount=4000, interval="day", counter_amount=1000)]))
+        self.assertEqual(engine.evaluate(purchase(amount=1500)), {"status": "approved", "amount": 1500, "reason": None})
+        self.assertEqual(engine.evaluate(purchase(amount=1500)), {"status": "approved", "amount": 1500, "reason": None})
+        self.assertEqual(engine.evaluate(purchase(amount=1500)), {"status": "denied", "amount": None, "reason": "insufficientCardLimit"})
+        self.assertEqual(engine.evaluate(purchase(amount=1500, isPartialAllowed=True))["status"], "denied")
+
+    def test_partial(self):
+        engine = starkinfra.issuingrule.RuleEngine()
+        engine.add_card(card([starkinfra.IssuingRule(name="Daily", amount=1000, interval="day")]))
+        self.assertEqual(engine.evaluate(purchase(amount=1500, isPartialAllowed=True)), {"status": "approved", "amount": 1000, "reason": None})
+        self.assertEqual(engine.evaluate(purchase(amount=10))["status"], "denied")
+
+    def test_interval(self):
+        engine = starkinfra.issuingrule.RuleEngine(utc_offset=0)
+        engine.add_card(card([starkinfra.IssuingRule(name="Daily", amount=1000, interval="day")]))
+        self.assertEqual(engine.evaluate(purchase(amount=1000, created="2022-02-15T20:45:08.210009+00:00"))["status"], "approved")
+        self.assertEqual(engine.evaluate(purchase(amount=1000, created="2022-02-15T23:45:08.210009+00:00"))["status"], "denied")
+        self.assertEqual(engine.evaluate(purchase(amount=1000, created="2022-02-16T00:45:08.210009+00:00"))["status"], "approved")
+
+    def test_instant(self):
+        engine = starkinfra.issuingrule.RuleEngine()
+        engine.add_card(card([starkinfra.IssuingRule(name="Each", amount=1000, interval="instant")]))
+        for _ in range(5):
+            self.assertEqual(engine.evaluate(purchase(amount=1000))["status"], "approved")
+        self.assertEqual(engine.evaluate(purchase(amount=1001))["status"], "denied")
+
+    def test_filters(self):
+        engine = starkinfra.issuingrule.RuleEngine()
+        engine.add_card(card([starkinfra.IssuingRule(
+            name="Food in Brazil",
+            amount=100000,
+            categories=[starkinfra.MerchantCategory(code="fastFoodRestaurants")],
+            countries=[starkinfra.MerchantCountry(code="BRA")],
+            methods=[starkinfra.CardMethod(code="chip"), starkinfra.CardMethod(code="contactless")],
+        )]))
+        self.assertEqual(engine.evaluate(purchase())["status"], "approved")
+        self.assertEqual(engine.evaluate(purchase(merchantCountryCode="USA"))["reason"], "cardRuleMismatch")
+        self.assertEqual(engine.evaluate(purchase(methodCode="manual"))["reason"], "cardRuleMismatch")
+        self.assertEqual(engine.evaluate(purchase(merchantCategoryCode="veterinaryServices"))["reason"], "cardRuleMismatch")
+
+    def test_category_type(self):
+        engine = starkinfra.issuingrule.RuleEngine(categories=[
+            starkinfra.MerchantCategory(code="fastFoodRestaurants", type="food"),
+            starkinfra.MerchantCategory(code="veterinaryServices", type="pets"),
+        ])
+        engine.add_card(card([starkinfra.IssuingRule(name="Food", amount=1000, categories=[starkinfra.MerchantCategory(type="food")])]))
+        self.assertEqual(engine.evaluate(purchase(amount=10))["status"], "approved")
+        self.assertEqual(engine.evaluate(purchase(amount=10, merchantCategoryCode="veterinaryServices"))["status"], "denied")
+
+    def test_category_catalog(self):
+        server, url = startServer(handler=CategoryHandler)
+        transport = LocalTransport(url=url)
+        defaultTransport, starkinfra.transport = starkinfra.transport, transport
+        catalog = starkinfra.merchantcategory.catalog
+        catalog.user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+        CategoryHandler.requests = 0
+        try:
+            engine = starkinfra.issuingrule.RuleEngine()
+            engine.add_card(card([starkinfra.IssuingRule(name="Food", amount=1000, categories=[starkinfra.MerchantCategory(type="food")])]))
+        finally:
+            server.shutdown()
+            transport.close()
+            starkinfra.transport = defaultTransport
+            catalog.user = None
+            catalog._state = None
+        self.assertEqual(CategoryHandler.requests, 1)
+        self.assertEqual(engine.evaluate(purchase(amount=10))["status"], "approved")
+        self.assertEqual(engine.evaluate(purchase(amount=10, merchantCategoryCode="veterinaryServices"))["status"], "denied")
+
+    def test_holder(self):
+        engine = starkinfra.issuingrule.RuleEngine()
+        engine.add_card(card([]))
+        engine.add_holder(holder([starkinfra.IssuingRule(name="Monthly", amount=2000, interval="month")]))
+        self.assertEqual(engine.evaluate(purchase(amount=1500))["status"], "approved")
+        self.assertEqual(engine.evaluate(purchase(amount=1500))["reason"], "insufficientHolderLimit")
+        engine.add_holder(holder([], status="blocked"))
+        self.assertEqual(engine.evaluate(purchase(amount=1))["reason"], "blocked")
+
+    def test_status(self):
+        engine = starkinfra.issuingrule.RuleEngine()
+        engine.add_card(card([], status="expired"))
+        self.assertEqual(engine.evaluate(purchase())["reason"], "cardExpired")
+        engine.remove_card("5630612155105280")
+        self.assertIsNone(engine.evaluate(purchase()))
+
+    def test_commit(self):
+        engine = starkinfra.issuingrule.RuleEngine()
+        engine.add_card(card([starkinfra.IssuingRule(name="Lifetime", amount=1000)]))
+        for _ in range(3):
+            self.assertEqual(engine.evaluate(purchase(amount=1000), commit=False)["status"], "approved")
+        response = starkinfra.issuingpurchase.response(**engine.evaluate(purchase(amount=1000)))
+        self.assertIn("approved", response)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+import starkinfra
+from copy import deepcopy
+from time import sleep
+from threading import enumerate as running_threads
+from unittest import TestCase, main
+from datetime import date, timedelta
+from ellipticcurve import PrivateKey
+from tests.utils.user import exampleProject
+from tests.utils.server import startServer, JsonHandler, LocalTransport
+from tests.utils.resources import pixRequestJson
+
+
+starkinfra.user = exampleProject
+
+
+class TestParallelQuery(TestCase):
+
+    def test_success(self):
+        after = date.today() - timedelta(days=30)
+        before = date.today()
+        expected = [request.id for request in starkinfra.pixrequest.query(after=after, before=before)]
+
+        requests = starkinfra.parallel.query(starkinfra.pixrequest, after=after, before=before, shards=6, workers=3)
+        requests = list(requests)
+        self.assertEqual([request.id for request in requests], expected)
+        created = [request.created for request in requests]
+        self.assertEqual(created, sorted(created, reverse=True))
+
+    def test_success_progress(self):
+        query = starkinfra.parallel.query(
+            starkinfra.pixrequest.log,
+            after=date.today() - timedelta(days=10),
+            before=date.today(),
+            shards=20,
+            types=["success"],
+        )
+        logs = list(query)
+        self.assertEqual(len(query.shards), 11)
+        self.assertEqual(sum(shard.count for shard in query.shards), len(logs))
+        for shard in query.shards:
+            self.assertEqual(shard.status, "success")
+            print(shard)
+
+
+class EndlessModule:
+
+    def __init__(self):
+        self.produced = {}
+
+    def query(self, after, before):
+        self.produced[after] = 0
+        while True:
+            self.produced[after] += 1
+            yield after
+
+
+class TestParallelBuffer(TestCase):
+
+    def test_buffer(self):
+        module = EndlessModule()
+        threads = set(running_threads())
+        requests = iter(starkinfra.parallel.query(module, after="2022-01-01", before="2022-01-02", shards=2, buffer=5))
+        self.assertEqual(next(requests), date(2022, 1, 2))
+        sleep(0.3)
+        self.assertEqual(set(module.produced), {date(2022, 1, 1), date(2022, 1, 2)})
+        for produced in module.produced.values():
+            self.assertLessEqual(produced, 7)
+        started = set(running_threads()) - threads
+        self.assertEqual(len(started), 2)
+        requests.close()
+        sleep(0.3)
+        self.assertFalse(any(thread.is_alive() for thread in started))
+
+
+class PageHandler(JsonHandler):
+
+    def do_GET(self):
+        json = deepcopy(pixRequestJson)
+        json["id"] = self.path.split("after=")[1].split("&")[0]
+        self.respond({"requests": [json], "cursor": None})
+
+
+class TestParallelTransport(TestCase):
+
+    def setUp(self):
+        self.server, url = startServer(handler=PageHandler)
+        self.transport = LocalTransport(url=url)
+        self.user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.transport.close()
+
+    def test_use_transport(self):
+        with starkinfra.use_transport(self.transport):
+            requests = list(starkinfra.parallel.query(
+                starkinfra.pixrequest, after="2022-01-01", before="2022-01-03", shards=3, user=self.user,
+            ))
+        self.assertEqual([request.id for request in requests], ["2022-01-03", "2022-01-02", "2022-01-01"])
+
+
+if __name__ == '__main__':
+    main()
@@ -24,6 +24,11 @@ class TestPixRequestQuery(TestCase):
         pix_requests = list(starkinfra.pixrequest.query(limit=10))
         assert len(pix_requests) == 10
 
+    def test_success_prefetch(self):
+        pix_requests = list(starkinfra.pixrequest.query(limit=300, prefetch=2))
+        self.assertEqual(len(pix_requests), 300)
+        self.assertEqual(len(set(pix_request.id for pix_request in pix_requests)), 300)
+
     def test_success_with_params(self):
         pix_requests = starkinfra.pixrequest.query(
             limit=10,
@@ -0,0 +1,72 @@
+import os
+import starkinfra
+from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED
+from datetime import datetime
+from tempfile import mkdtemp
+from importlib import import_module
+from unittest import TestCase, main
+from starkinfra.pixstatement.__main__ import main as cli
+
+
+indexModule = import_module("starkinfra.pixstatement.__index")
+
+
+rows = 20000
+content = "".join(
+    "{id},{amount},E{id:031d},{returnId},2022-02-15T20:45:08.210009+00:00\r\n".format(
+        id=i,
+        amount=i * 100,
+        returnId="D{id:031d}".format(id=i) if i % 7 == 0 else "",
+    )
+    for i in range(rows)
+).encode("utf-8")
+archive = BytesIO()
+with ZipFile(archive, "w", ZIP_DEFLATED) as file:
+    file.writestr("statement.csv", b"id,amount,endToEndId,returnId,created\r\n" + content)
+
+
+class TestPixStatementIndex(TestCase):
+
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.source = os.path.join(self.directory, "statement.zip")
+        self.path = os.path.join(self.directory, "statement.idx")
+        with open(self.source, "wb") as file:
+            file.write(archive.getvalue())
+
+    def test_success(self):
+        count = starkinfra.pixstatement.build_index(self.source, self.path)
+        self.assertEqual(count, rows)
+        with starkinfra.pixstatement.StatementIndex(self.path) as index:
+            self.assertEqual(len(index), rows + (rows + 6) // 7)
+            for id in [0, 1, 7, 4321, rows - 1]:
+                found = index.get("E{id:031d}".format(id=id))
+                self.assertEqual(len(found), 1)
+                self.assertEqual(found[0]["amount"], id * 100)
+                self.assertIsInstance(found[0]["created"], datetime)
+            self.assertEqual(index.get("D{id:031d}".format(id=70))[0]["id"], "70")
+            self.assertEqual(index.get("D{id:031d}".format(id=71)), [])
+            self.assertEqual(index.get("E"), [])
+            self.assertEqual(index.get("E{id:040d}".format(id=1)), [])
+            self.assertFalse("E{id:031d}".format(id=rows) in index)
+
+    def test_runs(self):
+        size, indexModule._run_size = indexModule._run_size, 1000
+        try:
+            starkinfra.pixstatement.build_index([archive.getvalue()], self.path, keys=["end_to_end_id"])
+        finally:
+            indexModule._run_size = size
+        with starkinfra.pixstatement.StatementIndex(self.path) as index:
+            self.assertEqual(len(index), rows)
+            for id in range(0, rows, 997):
+                self.assertEqual(index.get("E{id:031d}".format(id=id))[0]["id"], str(id))
+
+    def test_cli(self):
+        self.assertEqual(cli(["index", self.source, self.path]), 0)
+        self.assertEqual(cli(["lookup", self.path, "E{id:031d}".format(id=5)]), 0)
+        self.assertEqual(cli(["lookup", self.path, "E{id:031d}".format(id=rows)]), 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+import os
+import starkinfra
+from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED
+from datetime import datetime
+from tempfile import mkdtemp
+from tracemalloc import start, stop, get_traced_memory
+from unittest import TestCase, main
+from ellipticcurve import PrivateKey
+from starkcore.error import UnknownError
+from tests.utils.server import startServer, FileHandler, ChunkedFileHandler, LocalTransport
+
+
+rows = 50000
+content = "".join(
+    "{id},{amount},E{id:031d},2022-02-15T20:45:08.210009+00:00\r\n".format(id=i, amount=i * 100)
+    for i in range(rows)
+).encode("utf-8")
+archive = BytesIO()
+with ZipFile(archive, "w", ZIP_DEFLATED) as file:
+    file.writestr("statement.csv", b"id,amount,endToEndId,created\r\n" + content)
+
+
+class StatementHandler(ChunkedFileHandler):
+    content = archive.getvalue()
+
+
+class DroppingStatementHandler(FileHandler):
+    content = archive.getvalue()
+    chunk_size = 4096
+    json = {"statement": {
+        "id": "5155165527080960",
+        "after": "2022-02-15",
+        "before": "2022-02-15",
+        "type": "transaction",
+        "status": "success",
+        "transactionCount": rows,
+    }}
+
+
+class TestPixStatementStream(TestCase):
+
+    def setUp(self):
+        self.server, url = startServer(handler=StatementHandler)
+        self.transport = LocalTransport(url=url)
+        self.defaultTransport, starkinfra.transport = starkinfra.transport, self.transport
+        self.user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.transport.close()
+        starkinfra.transport = self.defaultTransport
+
+    def test_success(self):
+        chunks = list(starkinfra.pixstatement.csv_stream("5155165527080960", user=self.user))
+        self.assertEqual(b"".join(chunks), StatementHandler.content)
+        self.assertTrue(len(chunks) > 1)
+
+    def test_download(self):
+        path = os.path.join(mkdtemp(), "statement.zip")
+        size = starkinfra.pixstatement.download_csv("5155165527080960", path=path, verify=False, user=self.user)
+        self.assertEqual(size, len(StatementHandler.content))
+        self.assertEqual(sum(1 for _ in starkinfra.pixstatement.read_csv(path)), rows)
+
+    def test_read_csv(self):
+        start()
+        count = 0
+        for row in starkinfra.pixstatement.read_csv(starkinfra.pixstatement.csv_stream("5155165527080960", user=self.user)):
+            self.assertEqual(row["amount"], count * 100)
+            self.assertIsInstance(row["created"], datetime)
+            self.assertEqual(row["end_to_end_id"], "E{id:031d}".format(id=count))
+            count += 1
+        _, peak = get_traced_memory()
+        stop()
+        self.assertEqual(count, rows)
+        self.assertLess(peak, len(content) // 4)
+        self.assertEqual(self.transport.opened, 1)
+
+
+class TestPixStatementResumableDownload(TestCase):
+
+    def setUp(self):
+        self.server, url = startServer(handler=DroppingStatementHandler)
+        self.transport = LocalTransport(url=url)
+        self.defaultTransport, starkinfra.transport = starkinfra.transport, self.transport
+        self.user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+        self.directory = mkdtemp()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.transport.close()
+        starkinfra.transport = self.defaultTransport
+        DroppingStatementHandler.drops = 0
+        DroppingStatementHandler.failures = 0
+        DroppingStatementHandler.failure_status = 500
+        DroppingStatementHandler.offsets = []
+
+    def test_resume(self):
+        DroppingStatementHandler.drops = 3
+        path = os.path.join(self.directory, "statement.zip")
+        size = starkinfra.pixstatement.download_csv("5155165527080960", path=path, user=self.user)
+        self.assertEqual(size, len(DroppingStatementHandler.content))
+        self.assertEqual(DroppingStatementHandler.drops, 0)
+        self.assertFalse(os.path.exists(path + ".part"))
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), DroppingStatementHandler.content)
+
+    def test_resume_after_failure(self):
+        DroppingStatementHandler.drops = 2
+        path = os.path.join(self.directory, "statement.zip")
+        with self.assertRaises(Exception):
+            starkinfra.pixstatement.download_csv("5155165527080960", path=path, retries=0, user=self.user)
+        partial = os.path.getsize(path + ".part")
+        self.assertTrue(0 < partial < len(DroppingStatementHandler.content))
+        size = starkinfra.pixstatement.download_csv("5155165527080960", path=path, user=self.user)
+        self.assertEqual(size, len(DroppingStatementHandler.content))
+
+    def test_failed_resume(self):
+        DroppingStatementHandler.drops = 1
+        DroppingStatementHandler.failures = 0
+        path = os.path.join(self.directory, "statement.zip")
+        original = DroppingStatementHandler._drop
+
+        def drop(handler):
+            dropped = original(handler)
+            if dropped:
+                DroppingStatementHandler.failures = 2
+            return dropped
+
+        DroppingStatementHandler._drop = drop
+        try:
+            size = starkinfra.pixstatement.download_csv("5155165527080960", path=path, user=self.user)
+        finally:
+            DroppingStatementHandler._drop = original
+        offsets = DroppingStatementHandler.offsets
+        self.assertEqual(size, len(DroppingStatementHandler.content))
+        self.assertEqual(len(offsets), 4)
+        self.assertEqual(offsets[0], 0)
+        self.assertGreater(offsets[1], 0)
+        self.assertEqual(offsets[1:], [offsets[1]] * 3)
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), DroppingStatementHandler.content)
+
+    def test_rejected_range(self):
+        path = os.path.join(self.directory, "statement.zip")
+        with open(path + ".part", "wb") as file:
+            file.write(DroppingStatementHandler.content + b"\x00" * 1000)
+        size = starkinfra.pixstatement.download_csv("5155165527080960", path=path, retries=2, user=self.user)
+        self.assertEqual(size, len(DroppingStatementHandler.content))
+        self.assertEqual(DroppingStatementHandler.offsets, [len(DroppingStatementHandler.content) + 1000, 0])
+
+    def test_corrupted_part(self):
+        path = os.path.join(self.directory, "statement.zip")
+        with open(path + ".part", "wb") as file:
+            file.write(DroppingStatementHandler.content[:1000] + b"\x00" * 1000)
+        with self.assertRaises(UnknownError):
+            starkinfra.pixstatement.download_csv("5155165527080960", path=path, retries=2, user=self.user)
+        self.assertEqual(len(DroppingStatementHandler.offsets), 1)
+        self.assertFalse(os.path.exists(path + ".part"))
+        size = starkinfra.pixstatement.download_csv("5155165527080960", path=path, retries=2, user=self.user)
+        self.assertEqual(size, len(DroppingStatementHandler.content))
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), DroppingStatementHandler.content)
+
+    def test_complete_part(self):
+        path = os.path.join(self.directory, "statement.zip")
+        with open(path + ".part", "wb") as file:
+            file.write(DroppingStatementHandler.content)
+        size = starkinfra.pixstatement.download_csv("5155165527080960", path=path, user=self.user)
+        self.assertEqual(size, len(DroppingStatementHandler.content))
+        self.assertEqual(DroppingStatementHandler.offsets, [len(DroppingStatementHandler.content)])
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), DroppingStatementHandler.content)
+
+    def test_server_error(self):
+        DroppingStatementHandler.failures = 2
+        DroppingStatementHandler.failure_status = 503
+        path = os.path.join(self.directory, "statement.zip")
+        size = starkinfra.pixstatement.download_csv("5155165527080960", path=path, user=self.user)
+        self.assertEqual(size, len(DroppingStatementHandler.content))
+        self.assertEqual(DroppingStatementHandler.offsets, [0, 0, 0])
+
+    def test_api_error(self):
+        DroppingStatementHandler.failures = 5
+        DroppingStatementHandler.failure_status = 404
+        path = os.path.join(self.directory, "statement.zip")
+        with self.assertRaises(UnknownError):
+            starkinfra.pixstatement.download_csv("5155165527080960", path=path, user=self.user)
+        self.assertEqual(DroppingStatementHandler.offsets, [0])
+
+    def test_disk_error(self):
+        path = os.path.join(self.directory, "missing", "statement.zip")
+        with self.assertRaises(EnvironmentError):
+            starkinfra.pixstatement.download_csv("5155165527080960", path=path, user=self.user)
+        self.assertEqual(DroppingStatementHandler.offsets, [0])
+
+    def test_parallel(self):
+        DroppingStatementHandler.drops = 4
+        ids = ["5155165527080960", "5155165527080961", "5155165527080962", "5155165527080963"]
+        paths = starkinfra.pixstatement.download_csvs(ids, directory=self.directory, workers=2, user=self.user)
+        self.assertEqual(sorted(paths), ids)
+        for path in paths.values():
+            self.assertEqual(sum(1 for _ in starkinfra.pixstatement.read_csv(path)), rows)
+
+
+if __name__ == '__main__':
+    main()
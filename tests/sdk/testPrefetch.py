@@ -0,0 +1,60 @@
+from time import sleep
+from threading import enumerate as running_threads
+from unittest import TestCase, main
+from starkinfra.utils.prefetch import prefetch
+
+
+class PageSource:
+
+    def __init__(self, pages=None, error=None):
+        self.pages = pages
+        self.error = error
+        self.produced = 0
+
+    def __iter__(self):
+        while self.pages is None or self.produced < self.pages:
+            self.produced += 1
+            yield [self.produced]
+        if self.error is not None:
+            raise self.error
+
+
+class TestPrefetch(TestCase):
+
+    def test_success(self):
+        pages = list(prefetch(iter(PageSource(pages=5)), size=2))
+        self.assertEqual(pages, [[1], [2], [3], [4], [5]])
+
+    def test_buffer(self):
+        source = PageSource()
+        pages = prefetch(iter(source), size=3)
+        self.assertEqual(next(pages), [1])
+        sleep(0.3)
+        self.assertLessEqual(source.produced, 1 + 3 + 1)
+        self.assertEqual(next(pages), [2])
+        pages.close()
+
+    def test_error(self):
+        pages = prefetch(iter(PageSource(pages=2, error=ValueError("page failed"))), size=1)
+        self.assertEqual(next(pages), [1])
+        self.assertEqual(next(pages), [2])
+        with self.assertRaises(ValueError):
+            next(pages)
+
+    def test_close(self):
+        threads = set(running_threads())
+        source = PageSource()
+        pages = prefetch(iter(source), size=2)
+        self.assertEqual(next(pages), [1])
+        started = set(running_threads()) - threads
+        self.assertEqual(len(started), 1)
+        pages.close()
+        sleep(0.3)
+        self.assertFalse(any(thread.is_alive() for thread in started))
+        produced = source.produced
+        sleep(0.2)
+        self.assertEqual(source.produced, produced)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+import starkinfra
+import starkinfra.aio
+from asyncio import run
+from copy import deepcopy
+from time import time
+from threading import Lock, Thread
+from unittest import TestCase, main
+from ellipticcurve import PrivateKey
+from starkcore.error import UnknownError
+from tests.utils.server import startServer, JsonHandler, LocalTransport, LocalAsyncTransport
+from tests.utils.resources import pixRequestJson
+
+
+class ThrottlingHandler(JsonHandler):
+
+    requests = 0
+    rejections = 0
+    retryAfter = "0.2"
+    lock = Lock()
+
+    def do_GET(self):
+        with self.lock:
+            ThrottlingHandler.requests += 1
+            rejected = ThrottlingHandler.rejections > 0
+            ThrottlingHandler.rejections -= 1
+        if rejected:
+            headers = {"Retry-After": self.retryAfter} if self.retryAfter else {}
+            return self.respond({"errors": [{"code": "tooManyRequests", "message": "Slow down"}]}, status=429, headers=headers)
+        json = deepcopy(pixRequestJson)
+        json["id"] = self.path.split("?")[0].split("/")[-1]
+        self.respond({"request": json})
+
+
+class TestRateLimiter(TestCase):
+
+    def setUp(self):
+        self.server, url = startServer(handler=ThrottlingHandler)
+        self.transport = LocalTransport(url=url)
+        self.defaultTransport, starkinfra.transport = starkinfra.transport, self.transport
+        self.user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+        ThrottlingHandler.requests = 0
+        ThrottlingHandler.rejections = 0
+        ThrottlingHandler.retryAfter = "0.2"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.transport.close()
+        starkinfra.transport = self.defaultTransport
+        starkinfra.rate_limiter = None
+
+    def test_retry_after(self):
+        starkinfra.rate_limiter = starkinfra.RateLimiter(rate=100)
+        ThrottlingHandler.rejections = 2
+        start = time()
+        request = starkinfra.pixrequest.get("5137269514043392", user=self.user)
+        self.assertEqual(request.id, "5137269514043392")
+        self.assertGreaterEqual(time() - start, 0.4)
+        self.assertEqual(ThrottlingHandler.requests, 3)
+        self.assertEqual(starkinfra.rate_limiter.rejected, 2)
+        self.assertEqual(starkinfra.rate_limiter.retried, 2)
+        self.assertGreaterEqual(starkinfra.rate_limiter.throttled_time, 0.4)
+
+    def test_backoff(self):
+        starkinfra.rate_limiter = starkinfra.RateLimiter(rate=100, backoff=0.01)
+        ThrottlingHandler.rejections = 3
+        ThrottlingHandler.retryAfter = None
+        request = starkinfra.pixrequest.get("5137269514043392", user=self.user)
+        self.assertEqual(request.id, "5137269514043392")
+        self.assertEqual(starkinfra.rate_limiter.retried, 3)
+
+    def test_exhausted(self):
+        starkinfra.rate_limiter = starkinfra.RateLimiter(rate=100, retries=1, max_backoff=0.05)
+        ThrottlingHandler.rejections = 10
+        with self.assertRaises(UnknownError):
+            starkinfra.pixrequest.get("5137269514043392", user=self.user)
+        self.assertEqual(ThrottlingHandler.requests, 2)
+        self.assertEqual(starkinfra.rate_limiter.rejected, 2)
+
+    def test_rate(self):
+        starkinfra.rate_limiter = starkinfra.RateLimiter(rate=20, burst=1)
+        errors = []
+
+        def work():
+            try:
+                for _ in range(4):
+                    starkinfra.pixrequest.get("5137269514043392", user=self.user)
+            except Exception as error:
+                errors.append(error)
+
+        start = time()
+        threads = [Thread(target=work) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertGreaterEqual(time() - start, 0.9)
+        self.assertEqual(starkinfra.rate_limiter.requests, 20)
+        self.assertGreater(starkinfra.rate_limiter.throttled, 0)
+
+    def test_buckets(self):
+        starkinfra.rate_limiter = starkinfra.RateLimiter(rate=100, rates={"PixRequestLog": 1})
+        other = starkinfra.Project(environment="sandbox", id="2", private_key=PrivateKey().toPem())
+        starkinfra.pixrequest.get("5137269514043392", user=self.user)
+        starkinfra.pixrequest.get("5137269514043392", user=other)
+        self.assertEqual(len(starkinfra.rate_limiter._buckets), 2)
+        bucket = starkinfra.rate_limiter._bucket("PixRequestLog/sandbox/1/None", "PixRequestLog")
+        self.assertEqual(bucket.rate, 1)
+
+    def test_recovery(self):
+        starkinfra.rate_limiter = starkinfra.RateLimiter(rate=50, recovery=1)
+        ThrottlingHandler.rejections = 1
+        ThrottlingHandler.retryAfter = "0"
+        starkinfra.pixrequest.get("5137269514043392", user=self.user)
+        bucket = list(starkinfra.rate_limiter._buckets.values())[0]
+        self.assertLess(bucket.rate, 50)
+        starkinfra.rate_limiter.recovery = 1000
+        for _ in range(5):
+            starkinfra.pixrequest.get("5137269514043392", user=self.user)
+        self.assertEqual(bucket.rate, 50)
+
+
+class TestAioRateLimiter(TestCase):
+
+    def setUp(self):
+        self.server, url = startServer(handler=ThrottlingHandler)
+        self.transport = LocalAsyncTransport(url=url)
+        starkinfra.aio.transport = self.transport
+        self.user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+        ThrottlingHandler.requests = 0
+        ThrottlingHandler.rejections = 0
+        ThrottlingHandler.retryAfter = "0.2"
+
+    def tearDown(self):
+        self.server.shutdown()
+        starkinfra.aio.transport = None
+        starkinfra.rate_limiter = None
+
+    def get(self, id):
+        async def get():
+            try:
+                return await starkinfra.aio.pixrequest.get(id, user=self.user)
+            finally:
+                self.transport.close()
+        return run(get())
+
+    def test_retry_after(self):
+        starkinfra.rate_limiter = starkinfra.RateLimiter(rate=100)
+        ThrottlingHandler.rejections = 2
+        start = time()
+        request = self.get("5137269514043392")
+        self.assertEqual(request.id, "5137269514043392")
+        self.assertGreaterEqual(time() - start, 0.4)
+        self.assertEqual(ThrottlingHandler.requests, 3)
+        self.assertEqual(starkinfra.rate_limiter.requests, 3)
+        self.assertEqual(starkinfra.rate_limiter.retried, 2)
+
+    def test_exhausted(self):
+        starkinfra.rate_limiter = starkinfra.RateLimiter(rate=100, retries=1)
+        ThrottlingHandler.rejections = 5
+        with self.assertRaises(UnknownError):
+            self.get("5137269514043392")
+        self.assertEqual(ThrottlingHandler.requests, 2)
+
+
+if __name__ == '__main__':
+    main()
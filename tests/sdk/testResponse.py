@@ -0,0 +1,59 @@
+import starkinfra
+from json import dumps, loads
+from datetime import datetime, date
+from importlib import import_module
+from unittest import TestCase, main
+from starkcore.utils.api import api_json
+
+
+template = import_module("starkinfra.utils.template")
+
+dueValues = {
+    "version": 1, "created": datetime(2022, 3, 10, 10, 30), "due": date(2022, 3, 20), "key_id": "+5511989898989",
+    "status": "paid", "reconciliation_id": "cd65c78aeb6543eaaa0170f68bd741ee", "nominal_amount": 100,
+    "sender_name": "Anthony Edward Stark", "receiver_name": "Jamie Lannister",
+    "receiver_street_line": "Av. Paulista, 200", "receiver_city": "São Paulo", "receiver_state_code": "SP",
+    "receiver_zip_code": "01234-567", "expiration": 123456789, "sender_tax_id": "012.345.678-90",
+    "receiver_tax_id": "20.018.183/0001-80", "fine": 2.5, "interest": 1.3,
+    "discounts": [{"percentage": 5, "due": datetime(2022, 3, 15)}], "description": "Test description",
+}
+instantValues = {
+    "version": 1, "created": "2022-02-15T20:45:08.210009+00:00", "key_id": "+5511989898989", "status": "paid",
+    "reconciliation_id": "b77f5236-7ab9-4487-9f95-66ee6eaf1781", "amount": 100, "cashier_type": "merchant",
+    "cashier_bank_code": "20018183", "cash_amount": 1000, "expiration": 3600, "sender_name": None,
+    "sender_tax_id": None, "amount_type": "fixed", "description": "Cafe \"com\" leite\n",
+}
+
+
+def reference(values, root=None):
+    json = api_json(values)
+    return dumps({root: json} if root else json)
+
+
+class TestResponse(TestCase):
+
+    def cases(self):
+        return [
+            (starkinfra.pixrequest.response(status="denied", reason="invalidAccountNumber"), reference({"status": "denied", "reason": "invalidAccountNumber"}, "authorization")),
+            (starkinfra.pixrequest.response(status="approved"), reference({"status": "approved"}, "authorization")),
+            (starkinfra.pixreversal.response(status="approved"), reference({"status": "approved"}, "authorization")),
+            (starkinfra.issuingpurchase.response(status="approved", amount=1000, tags=["tony", "ção"]), reference({"status": "approved", "amount": 1000, "tags": ["tony", "ção"]}, "authorization")),
+            (starkinfra.dynamicbrcode.response_due(**dueValues), reference(dueValues)),
+            (starkinfra.dynamicbrcode.response_instant(**instantValues), reference(instantValues)),
+        ]
+
+    def test_success(self):
+        for response, expected in self.cases():
+            self.assertEqual(loads(response), loads(expected))
+
+    def test_standard_library(self):
+        fastDumps, template._fast_dumps = template._fast_dumps, None
+        try:
+            for response, expected in self.cases():
+                self.assertEqual(response, expected)
+        finally:
+            template._fast_dumps = fastDumps
+
+
+if __name__ == '__main__':
+    main()
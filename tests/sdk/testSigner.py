@@ -0,0 +1,49 @@
+from unittest import TestCase, main, skipIf
+from importlib import import_module
+from ellipticcurve import Ecdsa, PrivateKey, Signature
+import starkinfra
+
+
+signer = import_module("starkinfra.utils.signer")
+request = import_module("starkinfra.utils.request")
+
+
+class TestSigner(TestCase):
+
+    def setUp(self):
+        self.privateKey = PrivateKey()
+        self.publicKey = self.privateKey.publicKey()
+
+    def verify(self, message, signature):
+        signature = Signature.fromBase64(signature)
+        self.assertLessEqual(signature.s, self.privateKey.curve.N // 2)
+        return Ecdsa.verify(message, signature, self.publicKey)
+
+    def test_success(self):
+        key = signer.Signer(self.privateKey.toPem())
+        key._fast_key = None
+        for index in range(20):
+            message = "project/1:{index}:{{}}".format(index=index)
+            self.assertTrue(self.verify(message, key.sign(message)))
+        self.assertFalse(self.verify("project/1:0:{}", key.sign("project/1:1:{}")))
+
+    @skipIf(signer.derive_private_key is None, "cryptography is not installed")
+    def test_cryptography(self):
+        key = signer.Signer(self.privateKey.toPem())
+        self.assertIsNotNone(key._fast_key)
+        for index in range(20):
+            message = "project/1:{index}:{{}}".format(index=index)
+            self.assertTrue(self.verify(message, key.sign(message)))
+
+    def test_headers(self):
+        user = starkinfra.Project(environment="sandbox", id="1", private_key=self.privateKey.toPem())
+        headers = request._authentication_headers(user=user, body='{"amount": 1000}')
+        message = "{id}:{time}:{body}".format(id=headers["Access-Id"], time=headers["Access-Time"], body='{"amount": 1000}')
+        self.assertTrue(self.verify(message, headers["Access-Signature"]))
+        cached = signer._signers[user.pem]
+        request._authentication_headers(user=user, body="")
+        self.assertIs(signer._signers[user.pem], cached)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+import starkinfra
+import starkinfra.aio
+from asyncio import gather, run
+from copy import deepcopy
+from time import sleep
+from threading import Lock, Thread
+from unittest import TestCase, main
+from ellipticcurve import PrivateKey
+from starkcore.error import InternalServerError
+from tests.utils.server import startServer, JsonHandler, LocalTransport, LocalAsyncTransport
+from tests.utils.resources import pixRequestJson
+
+
+class SlowHandler(JsonHandler):
+
+    requests = 0
+    fail = False
+    lock = Lock()
+
+    def do_GET(self):
+        with self.lock:
+            SlowHandler.requests += 1
+        sleep(0.3)
+        if self.fail:
+            return self.respond({"errors": []}, status=500)
+        json = deepcopy(pixRequestJson)
+        json["id"] = self.path.split("?")[0].split("/")[-1]
+        self.respond({self.path.split("?")[0].split("/")[-2].split("-")[-1]: json})
+
+
+def concurrently(functions):
+    results = [None] * len(functions)
+
+    def run(index):
+        try:
+            results[index] = functions[index]()
+        except Exception as error:
+            results[index] = error
+
+    threads = [Thread(target=run, args=(index,)) for index in range(len(functions))]
+    for thread in threads:
+        thread.start()
+        sleep(0.01)
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestSingleFlight(TestCase):
+
+    def setUp(self):
+        self.server, url = startServer(handler=SlowHandler)
+        self.transport = LocalTransport(url=url, max_connections=20)
+        self.defaultTransport, starkinfra.transport = starkinfra.transport, self.transport
+        self.user = starkinfra.Project(environment="sandbox", id="1", private_key=PrivateKey().toPem())
+        starkinfra.single_flight = starkinfra.SingleFlight()
+        SlowHandler.requests = 0
+        SlowHandler.fail = False
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.transport.close()
+        starkinfra.transport = self.defaultTransport
+        starkinfra.single_flight = None
+        starkinfra.cache = None
+
+    def test_success(self):
+        requests = concurrently([lambda: starkinfra.pixrequest.get("5137269514043392", user=self.user)] * 10)
+        self.assertEqual(SlowHandler.requests, 1)
+        self.assertEqual(starkinfra.single_flight.requests, 1)
+        self.assertEqual(starkinfra.single_flight.coalesced, 9)
+        self.assertEqual(set(request.id for request in requests), {"5137269514043392"})
+        requests[0].tags.append("changed")
+        self.assertEqual(requests[1].tags, [])
+
+    def test_different_calls(self):
+        other = starkinfra.Project(environment="sandbox", id="2", private_key=PrivateKey().toPem())
+        calls = [
+            lambda: starkinfra.pixrequest.get("5137269514043392", user=self.user),
+            lambda: starkinfra.pixrequest.get("5137269514043393", user=self.user),
+            lambda: starkinfra.pixrequest.get("5137269514043392", user=other),
+            lambda: starkinfra.issuingholder.get("5137269514043392", expand=["rules"], user=self.user),
+        ]
+        concurrently(calls)
+        self.assertEqual(SlowHandler.requests, 4)
+        self.assertEqual(starkinfra.single_flight.coalesced, 0)
+
+    def test_expand(self):
+        holders = concurrently([lambda: starkinfra.issuingholder.get("5137269514043392", expand=["rules"], user=self.user)] * 3)
+        self.assertEqual(SlowHandler.requests, 1)
+        self.assertEqual([holder.id for holder in holders], ["5137269514043392"] * 3)
+
+    def test_error(self):
+        SlowHandler.fail = True
+        errors = concurrently([lambda: starkinfra.pixrequest.get("5137269514043392", user=self.user)] * 5)
+        self.assertEqual(SlowHandler.requests, 1)
+        for error in errors:
+            self.assertIsInstance(error, InternalServerError)
+        SlowHandler.fail = False
+        self.assertEqual(starkinfra.pixrequest.get("5137269514043392", user=self.user).id, "5137269514043392")
+
+    def test_cache(self):
+        starkinfra.cache = starkinfra.Cache()
+        requests = concurrently([lambda: starkinfra.pixrequest.get("5137269514043392", user=self.user)] * 5)
+        self.assertEqual(SlowHandler.requests, 1)
+        self.assertEqual([request.id for request in requests], ["5137269514043392"] * 5)
+        starkinfra.pixrequest.get("5137269514043392", user=self.user)
+        self.assertEqual(SlowHandler.requests, 1)
+        self.assertEqual(starkinfra.cache.hits, 1)
+
+    def test_aio(self):
+        transport = LocalAsyncTransport(url=self.transport.url)
+
+        async def get():
+            try:
+                with starkinfra.use_transport(transport):
+                    gets = [starkinfra.aio.pixrequest.get("5137269514043392", user=self.user) for _ in range(5)]
+                return await gather(*gets)
+            finally:
+                transport.close()
+        requests = run(get())
+        self.assertEqual(SlowHandler.requests, 1)
+        self.assertEqual(starkinfra.single_flight.requests, 1)
+        self.assertEqual(starkinfra.single_flight.coalesced, 4)
+        self.assertEqual([request.id for request in requests], ["5137269514043392"] * 5)
+        requests[0].tags.append("changed")
+        self.assertEqual(requests[1].tags, [])
+
+    def test_aio_error(self):
+        SlowHandler.fail = True
+        transport = LocalAsyncTransport(url=self.transport.url)
+
+        async def get():
+            try:
+                with starkinfra.use_transport(transport):
+                    gets = [starkinfra.aio.pixrequest.get("5137269514043392", user=self.user) for _ in range(3)]
+                return await gather(*gets, return_exceptions=True)
+            finally:
+                transport.close()
+        errors = run(get())
+        self.assertEqual(SlowHandler.requests, 1)
+        for error in errors:
+            self.assertIsInstance(error, InternalServerError)
+
+
+if __name__ == '__main__':
+    main()
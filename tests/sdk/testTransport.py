@@ -0,0 +1,191 @@
+import starkinfra
+import starkinfra.aio
+from asyncio import run, gather
+from time import sleep
+from threading import Thread
+from unittest import TestCase, main
+from starkinfra.utils.compatibility import BadStatusLine
+from tests.utils.server import startServer, clientContext, JsonHandler
+
+
+class ClosingHandler(JsonHandler):
+
+    closes = 0
+    requests = []
+
+    def do_GET(self):
+        self.handle_request()
+
+    def do_POST(self):
+        self.handle_request()
+
+    def do_DELETE(self):
+        self.handle_request()
+
+    def handle_request(self):
+        ClosingHandler.requests.append(self.command)
+        if ClosingHandler.closes > 0:
+            ClosingHandler.closes -= 1
+            self.close_connection = True
+            return
+        JsonHandler.respond(self, {"path": self.path})
+
+
+class TestHttpTransportKeepAlive(TestCase):
+
+    def setUp(self):
+        self.server, self.url = startServer()
+
+    def tearDown(self):
+        self.server.shutdown()
+
+    def test_success(self):
+        transport = starkinfra.HttpTransport(context=clientContext())
+        for i in range(10):
+            response = transport.request(method="GET", url="{url}/pix-request/{i}".format(url=self.url, i=i))
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.json()["path"], "/pix-request/{i}".format(i=i))
+        self.assertEqual(transport.opened, 1)
+        self.assertEqual(transport.reused, 9)
+        transport.close()
+
+    def test_idle_timeout(self):
+        transport = starkinfra.HttpTransport(idle_timeout=0.1, context=clientContext())
+        transport.request(method="GET", url=self.url)
+        sleep(0.2)
+        transport.request(method="GET", url=self.url)
+        self.assertEqual(transport.opened, 2)
+        self.assertEqual(transport.reused, 0)
+        transport.close()
+
+    def test_max_connections(self):
+        transport = starkinfra.HttpTransport(max_connections=2, context=clientContext())
+
+        def send():
+            for _ in range(5):
+                transport.request(method="POST", url=self.url, body=b"{}")
+
+        threads = [Thread(target=send) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(transport.opened, 2)
+        self.assertEqual(transport.opened + transport.reused, 40)
+        transport.close()
+
+
+class TestHttpTransportRetry(TestCase):
+
+    def setUp(self):
+        self.server, self.url = startServer(handler=ClosingHandler)
+        self.transport = starkinfra.HttpTransport(context=clientContext())
+        self.transport.request(method="GET", url=self.url)
+        ClosingHandler.requests = []
+
+    def tearDown(self):
+        ClosingHandler.closes = 0
+        self.transport.close()
+        self.server.shutdown()
+
+    def test_idempotent(self):
+        ClosingHandler.closes = 1
+        response = self.transport.request(method="GET", url=self.url + "/pix-request/1")
+        self.assertEqual(response.json()["path"], "/pix-request/1")
+        self.assertEqual(ClosingHandler.requests, ["GET", "GET"])
+        self.assertEqual(self.transport.opened, 2)
+
+    def test_not_idempotent(self):
+        ClosingHandler.closes = 1
+        with self.assertRaises(BadStatusLine):
+            self.transport.request(method="POST", url=self.url + "/pix-request", body=b"{}")
+        self.assertEqual(ClosingHandler.requests, ["POST"])
+        self.assertEqual(self.transport.opened, 1)
+
+
+class TestAsyncHttpTransportRetry(TestCase):
+
+    def setUp(self):
+        self.server, self.url = startServer(handler=ClosingHandler)
+        self.transport = starkinfra.aio.AsyncHttpTransport(context=clientContext())
+
+    def tearDown(self):
+        ClosingHandler.closes = 0
+        self.server.shutdown()
+
+    def send(self, method, body=None):
+        async def send():
+            try:
+                await self.transport.request(method="GET", url=self.url)
+                ClosingHandler.requests = []
+                ClosingHandler.closes = 1
+                return await self.transport.request(method=method, url=self.url + "/pix-key/1", body=body)
+            finally:
+                self.transport.close()
+        return run(send())
+
+    def test_idempotent(self):
+        response = self.send("DELETE")
+        self.assertEqual(response.json()["path"], "/pix-key/1")
+        self.assertEqual(ClosingHandler.requests, ["DELETE", "DELETE"])
+        self.assertEqual(self.transport.opened, 2)
+
+    def test_not_idempotent(self):
+        with self.assertRaises(ConnectionError):
+            self.send("POST", body=b"{}")
+        self.assertEqual(ClosingHandler.requests, ["POST"])
+        self.assertEqual(self.transport.opened, 1)
+
+
+class TestAsyncHttpTransportKeepAlive(TestCase):
+
+    def setUp(self):
+        self.server, self.url = startServer()
+
+    def tearDown(self):
+        self.server.shutdown()
+
+    def test_success(self):
+        transport = starkinfra.aio.AsyncHttpTransport(context=clientContext())
+
+        async def send():
+            for i in range(10):
+                response = await transport.request(method="GET", url="{url}/pix-key/{i}".format(url=self.url, i=i))
+                self.assertEqual(response.status, 200)
+                self.assertEqual(response.json()["path"], "/pix-key/{i}".format(i=i))
+            transport.close()
+
+        run(send())
+        self.assertEqual(transport.opened, 1)
+        self.assertEqual(transport.reused, 9)
+
+    def test_concurrency(self):
+        transport = starkinfra.aio.AsyncHttpTransport(max_connections=10, context=clientContext())
+
+        async def send():
+            responses = await gather(*[
+                transport.request(method="POST", url=self.url, body=b"{}") for _ in range(100)
+            ])
+            transport.close()
+            return responses
+
+        responses = run(send())
+        self.assertEqual([response.json()["size"] for response in responses], [2] * 100)
+        self.assertLessEqual(transport.opened, 10)
+        self.assertEqual(transport.opened + transport.reused, 100)
+
+    def test_event_loops(self):
+        transport = starkinfra.aio.AsyncHttpTransport(context=clientContext())
+
+        async def send(i):
+            response = await transport.request(method="GET", url="{url}/pix-key/{i}".format(url=self.url, i=i))
+            return response.json()["path"]
+
+        self.assertEqual(run(send(1)), "/pix-key/1")
+        self.assertEqual(run(send(2)), "/pix-key/2")
+        self.assertEqual(transport.opened, 2)
+        transport.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+import starkinfra
+from json import dumps
+from unittest import TestCase, main
+from ellipticcurve import Ecdsa, PrivateKey
+from starkcore.error import InvalidSignatureError
+
+
+class RotatingVerifier(starkinfra.Verifier):
+
+    def __init__(self, keys, **kwargs):
+        self.keys = keys
+        self.fetched = 0
+        starkinfra.Verifier.__init__(self, **kwargs)
+
+    def _fetch_key(self, user=None, **request):
+        key = self.keys[min(self.fetched, len(self.keys) - 1)]
+        self.fetched += 1
+        return key.publicKey()
+
+
+class EnvironmentVerifier(starkinfra.Verifier):
+
+    def __init__(self, keys, **kwargs):
+        self.keys = keys
+        self.fetched = []
+        starkinfra.Verifier.__init__(self, **kwargs)
+
+    def _fetch_key(self, user=None, **request):
+        self.fetched.append(user.environment)
+        return self.keys[user.environment].publicKey()
+
+
+class TestVerifierVerify(TestCase):
+
+    def setUp(self):
+        self.privateKey = PrivateKey()
+        self.verifier = starkinfra.Verifier(public_key=self.privateKey.publicKey().toPem())
+
+    def test_success(self):
+        for i in range(20):
+            content = dumps({"event": {"id": str(i), "subscription": "pix-request.in"}})
+            signature = Ecdsa.sign(content, self.privateKey).toBase64()
+            self.assertEqual(self.verifier.verify(content=content, signature=signature), content)
+
+    def test_success_normalized(self):
+        content = dumps({"b": 1, "a": 2}, sort_keys=True)
+        signature = Ecdsa.sign(content, self.privateKey).toBase64()
+        self.assertEqual(self.verifier.verify(content='{"b": 1, "a": 2}', signature=signature), '{"b": 1, "a": 2}')
+
+    def test_fail_invalid_signature(self):
+        content = dumps({"event": {"id": "1"}})
+        signature = Ecdsa.sign(content, PrivateKey()).toBase64()
+        with self.assertRaises(InvalidSignatureError):
+            self.verifier.verify(content=content, signature=signature)
+        with self.assertRaises(InvalidSignatureError):
+            self.verifier.verify(content=content, signature="something is definitely wrong")
+
+
+class TestVerifierVerifyMany(TestCase):
+
+    def test_success(self):
+        privateKey = PrivateKey()
+        verifier = starkinfra.Verifier(public_key=privateKey.publicKey().toPem())
+        contents = [dumps({"event": {"id": str(i)}}) for i in range(10)]
+        items = [(content, Ecdsa.sign(content, privateKey).toBase64()) for content in contents]
+        items[3] = (contents[3], Ecdsa.sign(contents[3], PrivateKey()).toBase64())
+        items[7] = (contents[7], "invalid")
+        results = verifier.verify_many(items)
+        self.assertEqual(results, [i not in (3, 7) for i in range(10)])
+
+
+class TestVerifierRefresh(TestCase):
+
+    def test_success_rotation(self):
+        oldKey, newKey = PrivateKey(), PrivateKey()
+        verifier = RotatingVerifier(keys=[oldKey, newKey], refresh_interval=0)
+        content = dumps({"event": {"id": "1"}})
+        self.assertEqual(verifier.verify(content, Ecdsa.sign(content, oldKey).toBase64()), content)
+        self.assertEqual(verifier.verify(content, Ecdsa.sign(content, newKey).toBase64()), content)
+        self.assertEqual(verifier.fetched, 2)
+
+    def test_refresh_interval(self):
+        verifier = RotatingVerifier(keys=[PrivateKey()], refresh_interval=60)
+        content = dumps({"event": {"id": "1"}})
+        signature = Ecdsa.sign(content, PrivateKey()).toBase64()
+        for _ in range(5):
+            with self.assertRaises(InvalidSignatureError):
+                verifier.verify(content, signature)
+        self.assertEqual(verifier.fetched, 1)
+
+
+class TestVerifierEnvironment(TestCase):
+
+    def test_success(self):
+        keys = {"sandbox": PrivateKey(), "production": PrivateKey()}
+        users = dict((environment, starkinfra.Project(environment=environment, id="1", private_key=PrivateKey().toPem())) for environment in keys)
+        verifier = EnvironmentVerifier(keys=keys, refresh_interval=60)
+        content = dumps({"event": {"id": "1"}})
+        for _ in range(3):
+            for environment in ["sandbox", "production"]:
+                signature = Ecdsa.sign(content, keys[environment]).toBase64()
+                self.assertEqual(verifier.verify(content, signature, user=users[environment]), content)
+        self.assertEqual(verifier.fetched, ["sandbox", "production"])
+        with self.assertRaises(InvalidSignatureError):
+            verifier.verify(content, Ecdsa.sign(content, keys["sandbox"]).toBase64(), user=users["production"])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+pixRequestJson = {
+    "amount": 1000, "bankCode": "34052649", "cashAmount": 0, "cashierBankCode": "", "cashierType": "",
+    "created": "2022-02-15T20:45:08.210009+00:00", "description": "For saving my life",
+    "endToEndId": "E34052649202201272111u34srod1a91", "externalId": "141322efdgber1ecd1s342341321", "fee": 0,
+    "flow": "out", "id": "5137269514043392", "initiatorTaxId": "", "method": "manual",
+    "receiverAccountNumber": "000001", "receiverAccountType": "checking", "receiverBankCode": "00000001",
+    "receiverBranchCode": "0001", "receiverKeyId": "", "receiverName": "Jamie Lennister",
+    "receiverTaxId": "45.987.245/0001-92", "reconciliationId": "", "senderAccountNumber": "000000",
+    "senderAccountType": "checking", "senderBankCode": "34052649", "senderBranchCode": "0000",
+    "senderName": "tyrion Lennister", "senderTaxId": "012.345.678-90", "status": "failed", "tags": [],
+    "updated": "2022-02-15T20:45:09.436661+00:00",
+}
+
+issuingPurchaseJson = {
+    "id": "5155165527080960", "holderName": "Tony Stark", "cardId": "5630612155105280", "cardEnding": "1234",
+    "purpose": "purchase", "amount": 1500, "tax": 0, "issuerAmount": 1500, "issuerCurrencyCode": "BRL",
+    "issuerCurrencySymbol": "R$", "merchantAmount": 1500, "merchantCurrencyCode": "BRL",
+    "merchantCurrencySymbol": "R$", "merchantCategoryCode": "fastFoodRestaurants", "merchantCountryCode": "BRA",
+    "acquirerId": "236090", "merchantId": "204933612653639", "merchantName": "STARK INFRA",
+    "merchantFee": 0, "walletId": "", "methodCode": "contactless", "score": 0.0,
+    "endToEndId": "679cd385-642b-49d0-96b7-89491e1249a5", "tags": ["food"], "zipCode": "01311200",
+    "issuingTransactionIds": ["5669417434382336"], "status": "confirmed",
+    "updated": "2022-02-15T20:45:09.436661+00:00", "created": "2022-02-15T20:45:08.210009+00:00",
+    "isPartialAllowed": False, "cardTags": ["travel"], "holderTags": ["iron"],
+}
+
+creditNoteJson = {
+    "id": "5155165527080960", "templateId": "0123456789101112", "name": "Jamie Lannister",
+    "taxId": "012.345.678-90", "nominalAmount": 100000, "amount": 98000, "rebateAmount": 0, "taxAmount": 400,
+    "interest": 2.47, "nominalInterest": 2.4, "scheduled": "2022-04-28T19:21:27.140009+00:00",
+    "expiration": 604800, "externalId": "my-internal-id-123456", "documentId": "6287263290900480",
+    "status": "success", "paymentType": "transfer", "streetLine1": "Av. Paulista, 200",
+    "streetLine2": "10 andar", "district": "Bela Vista", "city": "Sao Paulo", "stateCode": "SP",
+    "zipCode": "01310-000", "tags": ["war supply", "invoice #1234"], "transactionIds": ["6287263290900481"],
+    "workspaceId": "5078376503050240", "created": "2022-04-28T19:21:27.140009+00:00",
+    "updated": "2022-04-28T19:21:28.436661+00:00",
+    "payment": {
+        "bankCode": "00000000", "branchCode": "1234", "accountNumber": "129340-1", "accountType": "checking",
+        "taxId": "012.345.678-90", "name": "Jamie Lannister", "amount": 98000,
+    },
+    "signers": [
+        {"id": "5643209507569664", "name": "Jamie Lannister", "contact": "jamie.lannister@gmail.com", "method": "link"},
+    ],
+    "invoices": [
+        {
+            "id": "5746405336662016", "amount": 50800, "nominalAmount": 50800, "due": "2022-05-28T19:21:27.140009+00:00",
+            "expiration": 5097600, "fine": 2.0, "interest": 1.0, "fineAmount": 0, "interestAmount": 0,
+            "discountAmount": 0, "status": "created", "fee": 0, "name": "Jamie Lannister",
+            "taxId": "012.345.678-90", "tags": [], "transactionIds": [], "brcode": "", "link": "", "pdf": "",
+            "created": "2022-04-28T19:21:27.140009+00:00", "updated": "2022-04-28T19:21:27.140009+00:00",
+            "descriptions": [{"key": "Rent", "value": "April"}], "discounts": [],
+        },
+        {
+            "id": "5746405336662017", "amount": 50800, "nominalAmount": 50800, "due": "2022-06-28T19:21:27.140009+00:00",
+            "expiration": 5097600, "fine": 2.0, "interest": 1.0, "fineAmount": 0, "interestAmount": 0,
+            "discountAmount": 0, "status": "created", "fee": 0, "name": "Jamie Lannister",
+            "taxId": "012.345.678-90", "tags": [], "transactionIds": [], "brcode": "", "link": "", "pdf": "",
+            "created": "2022-04-28T19:21:27.140009+00:00", "updated": "2022-04-28T19:21:27.140009+00:00",
+            "descriptions": [{"key": "Rent", "value": "May"}], "discounts": [],
+        },
+    ],
+}
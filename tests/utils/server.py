@@ -0,0 +1,283 @@
+import os
+import ssl
+import socket
+from re import search
+from json import dumps
+from time import sleep
+from threading import Thread, Lock
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit
+from starkinfra import HttpTransport, Http2Transport
+from starkinfra.aio import AsyncHttpTransport
+
+
+certificateDir = os.path.join(os.path.dirname(__file__), "certificate")
+certificatePath = os.path.join(certificateDir, "localhost-cert.pem")
+keyPath = os.path.join(certificateDir, "localhost-key.pem")
+_lock = Lock()
+
+
+class JsonHandler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.respond({"path": self.path})
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.respond({"path": self.path, "size": len(body)})
+
+    def respond(self, json, status=200, headers=None):
+        content = dumps(json).encode("utf-8")
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+class FileHandler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+    content = b""
+    chunk_size = 65536
+    drops = 0
+    failures = 0
+    failure_status = 500
+    offsets = []
+    json = None
+
+    def do_GET(self):
+        if self.json is not None and not urlsplit(self.path).path.endswith("/csv"):
+            return JsonHandler.respond(self, self.json)
+        match = search(r"bytes=(\d+)-", self.headers.get("Range", ""))
+        start = int(match.group(1)) if match else 0
+        with _lock:
+            self.__class__.offsets.append(start)
+            failed = self.__class__.failures > 0
+            if failed:
+                self.__class__.failures -= 1
+        if failed:
+            return JsonHandler.respond(self, {"errors": []}, status=self.failure_status)
+        if start >= len(self.content) and start:
+            self.send_response(416)
+            self.send_header("Content-Range", "bytes */{size}".format(size=len(self.content)))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        content = self.content[start:]
+        self.send_response(206 if match else 200)
+        self.send_header("Content-Type", "application/zip")
+        if match:
+            self.send_header("Content-Range", "bytes {start}-{end}/{size}".format(
+                start=start,
+                end=len(self.content) - 1,
+                size=len(self.content),
+            ))
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if self._drop():
+            self.wfile.write(content[:len(content) // 3])
+            self.close_connection = True
+            return
+        for start in range(0, len(content), self.chunk_size):
+            self.wfile.write(content[start:start + self.chunk_size])
+
+    def _drop(self):
+        cls = self.__class__
+        with _lock:
+            if cls.drops <= 0:
+                return False
+            cls.drops -= 1
+            return True
+
+    def log_message(self, *args):
+        pass
+
+
+class ChunkedFileHandler(FileHandler):
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for start in range(0, len(self.content), self.chunk_size):
+            chunk = self.content[start:start + self.chunk_size]
+            self.wfile.write("{size:x}\r\n".format(size=len(chunk)).encode("ascii") + chunk + b"\r\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+
+class LocalTransport(HttpTransport):
+
+    def __init__(self, url, **kwargs):
+        HttpTransport.__init__(self, context=clientContext(), **kwargs)
+        self.url = url
+
+    def stream(self, method, url, **kwargs):
+        url = urlsplit(url)
+        return HttpTransport.stream(self, method, self.url + url.path + ("?" + url.query if url.query else ""), **kwargs)
+
+
+class LocalAsyncTransport(AsyncHttpTransport):
+
+    def __init__(self, url, **kwargs):
+        AsyncHttpTransport.__init__(self, context=clientContext(), **kwargs)
+        self.url = url
+
+    async def request(self, method, url, **kwargs):
+        url = urlsplit(url)
+        return await AsyncHttpTransport.request(self, method, self.url + url.path + ("?" + url.query if url.query else ""), **kwargs)
+
+
+class LocalHttp2Transport(Http2Transport):
+
+    def __init__(self, url, **kwargs):
+        Http2Transport.__init__(self, context=clientContext(), **kwargs)
+        self.url = url
+
+    def request(self, method, url, **kwargs):
+        return Http2Transport.request(self, method, self._local(url), **kwargs)
+
+    def stream(self, method, url, **kwargs):
+        return Http2Transport.stream(self, method, self._local(url), **kwargs)
+
+    def _local(self, url):
+        url = urlsplit(url)
+        return self.url + url.path + ("?" + url.query if url.query else "")
+
+
+class Http2Server:
+    """Minimal HTTP/2 server over TLS. respond(method, path, body) returns the status and JSON of each
+    response, which is sent from its own thread after the latency, so streams are answered concurrently."""
+
+    def __init__(self, respond, latency=0):
+        self.respond = respond
+        self.latency = latency
+        self.connections = 0
+        self.streams = 0
+        self._lock = Lock()
+        self._sockets = []
+        self._context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self._context.load_cert_chain(certificatePath, keyPath)
+        self._context.set_alpn_protocols(["h2"])
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.bind(("localhost", 0))
+        self._listener.listen(128)
+        self.server_port = self._listener.getsockname()[1]
+        Thread(target=self._accept, daemon=True).start()
+
+    def shutdown(self):
+        self._listener.close()
+        for connection in list(self._sockets):
+            try:
+                connection.close()
+            except OSError:
+                pass
+
+    def _accept(self):
+        while True:
+            try:
+                connection, _ = self._listener.accept()
+            except OSError:
+                return
+            Thread(target=self._serve, args=(connection,), daemon=True).start()
+
+    def _serve(self, connection):
+        from h2.config import H2Configuration
+        from h2.connection import H2Connection
+        from h2.events import RequestReceived, DataReceived, StreamEnded, ConnectionTerminated
+
+        try:
+            connection = self._context.wrap_socket(connection, server_side=True)
+        except (OSError, ssl.SSLError):
+            connection.close()
+            return
+        with self._lock:
+            self.connections += 1
+            self._sockets.append(connection)
+        h2 = H2Connection(config=H2Configuration(client_side=False, header_encoding="utf-8"))
+        h2.local_settings.max_concurrent_streams = 1000
+        lock = Lock()
+        requests = {}
+
+        def send():
+            data = h2.data_to_send()
+            if data:
+                connection.sendall(data)
+
+        def reply(stream_id, headers, body):
+            if self.latency:
+                sleep(self.latency)
+            status, json = self.respond(headers[":method"], headers[":path"], body)
+            content = dumps(json).encode("utf-8")
+            try:
+                with lock:
+                    h2.send_headers(stream_id, [
+                        (":status", str(status)),
+                        ("content-type", "application/json"),
+                        ("content-length", str(len(content))),
+                    ])
+                    size = h2.max_outbound_frame_size
+                    for start in range(0, len(content), size):
+                        h2.send_data(stream_id, content[start:start + size], end_stream=start + size >= len(content))
+                    if not content:
+                        h2.end_stream(stream_id)
+                    send()
+            except (OSError, ssl.SSLError):
+                pass
+
+        try:
+            with lock:
+                h2.initiate_connection()
+                send()
+            while True:
+                data = connection.recv(65536)
+                if not data:
+                    break
+                with lock:
+                    events = h2.receive_data(data)
+                    for event in events:
+                        if isinstance(event, RequestReceived):
+                            requests[event.stream_id] = (dict(event.headers), [])
+                        elif isinstance(event, DataReceived):
+                            requests[event.stream_id][1].append(event.data)
+                            h2.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                        elif isinstance(event, StreamEnded):
+                            headers, body = requests.pop(event.stream_id)
+                            with self._lock:
+                                self.streams += 1
+                            Thread(target=reply, args=(event.stream_id, headers, b"".join(body)), daemon=True).start()
+                        elif isinstance(event, ConnectionTerminated):
+                            return
+                    send()
+        except (OSError, ssl.SSLError):
+            pass
+        finally:
+            connection.close()
+
+
+def startHttp2Server(respond, latency=0):
+    server = Http2Server(respond=respond, latency=latency)
+    return server, "https://localhost:{port}".format(port=server.server_port)
+
+
+def clientContext():
+    return ssl.create_default_context(cafile=certificatePath)
+
+
+def startServer(handler=JsonHandler, secure=True):
+    server = ThreadingHTTPServer(("localhost", 0), handler)
+    if secure:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certificatePath, keyPath)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = "{scheme}://localhost:{port}".format(scheme="https" if secure else "http", port=server.server_port)
+    return server, url